@@ -0,0 +1,87 @@
+"""Benchmark: Parsen und Validieren einer typischen Query mit und ohne Dokument-Cache.
+
+- `ohne Cache`: `parse` und `validate` gegen das Federation-Schema bei jedem Request
+- `mit Cache`: Nachschlagen des validierten Dokuments per SHA-256-Hash der Query
+
+```powershell
+uv run python benchmarks/bench_document_cache.py --iterations 5000
+```
+"""
+
+import argparse
+from time import perf_counter
+from typing import Final
+
+from graphql import parse, specified_rules, validate
+from loguru import logger
+
+from inventory.graphql.document_cache import DocumentCache, query_hash
+from inventory.graphql.schema import schema
+
+_QUERY: Final = """
+query Inventorys($pagination: PaginationInput, $criteria: InventorySearchCriteriaInput) {
+  inventorys(pagination: $pagination, searchCriteria: $criteria) {
+    content {
+      ...InventoryFields
+      reservedItems {
+        id
+        quantity
+        customerId
+        created
+      }
+    }
+    total
+    page
+    size
+  }
+}
+
+fragment InventoryFields on InventoryType {
+  id
+  version
+  skuCode
+  quantity
+  unitPrice
+  status
+  productId
+  created
+  updated
+  product {
+    id
+  }
+}
+"""
+
+
+def _without_cache(iterations: int) -> float:
+    graphql_schema: Final = schema._schema  # noqa: SLF001
+    start: Final = perf_counter()
+    for _ in range(iterations):
+        errors = validate(graphql_schema, parse(_QUERY), specified_rules)
+        assert not errors
+    return iterations / (perf_counter() - start)
+
+
+def _with_cache(iterations: int) -> float:
+    cache: Final = DocumentCache(max_size=100)
+    cache.put(query_hash(_QUERY), _QUERY, parse(_QUERY))
+    start: Final = perf_counter()
+    for _ in range(iterations):
+        entry = cache.get(query_hash(_QUERY))
+        assert entry is not None
+    return iterations / (perf_counter() - start)
+
+
+def main() -> None:
+    """Benchmark ausführen."""
+    parser: Final = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=5_000)
+    args: Final = parser.parse_args()
+    logger.remove()
+    for label, measure in (("ohne Cache", _without_cache), ("mit Cache", _with_cache)):
+        rate = measure(args.iterations)
+        print(f"{label:<12} {rate:12,.0f} Dokumente/s")
+
+
+if __name__ == "__main__":
+    main()
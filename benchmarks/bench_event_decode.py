@@ -0,0 +1,69 @@
+"""Benchmark: Dekodierung der Reserve-/Release-Events pro Kafka-Nachricht.
+
+Vergleicht den bisherigen Weg (`json.loads` + Dict-Zugriffe) mit dem typisierten
+Decoder (`orjson` + Slotted Dataclass).
+
+Aufruf:
+
+```powershell
+uv run python benchmarks/bench_event_decode.py --messages 200000
+```
+"""
+
+import argparse
+import json
+from time import perf_counter_ns
+from typing import Final
+
+import orjson
+
+from inventory.model.dto.inventory_item_event import decode_inventory_item_event
+
+_PAYLOAD: Final = orjson.dumps(
+    {
+        "item": {"inventoryId": "5b1b3b5e-6a4c-4c1f-9a55-0b1f1f2b8a01", "quantity": 3},
+        "customerId": "0a6d2f0c-8c3b-4bd8-9a10-5a1b8a2ad6f3",
+    },
+)
+_HEADERS: Final = {"x-event-version": "1.0.0"}
+
+
+def _decode_legacy(value: bytes) -> tuple[str, int, str]:
+    payload = json.loads(value.decode("utf-8"))
+    item = payload["item"]
+    return item["inventoryId"], item["quantity"], payload["customerId"]
+
+
+def _decode_typed(value: bytes) -> object:
+    return decode_inventory_item_event(value, _HEADERS)
+
+
+def _measure(name: str, decode, messages: int) -> None:
+    for _ in range(1_000):  # Warm-up
+        decode(_PAYLOAD)
+
+    start: Final = perf_counter_ns()
+    for _ in range(messages):
+        decode(_PAYLOAD)
+    elapsed_ns: Final = perf_counter_ns() - start
+
+    per_message_ns: Final = elapsed_ns / messages
+    print(
+        f"{name:<22} {per_message_ns:>10.1f} ns/msg "
+        f"{1e9 / per_message_ns:>14,.0f} msg/s",
+    )
+
+
+def main() -> None:
+    """Benchmark ausführen."""
+    parser: Final = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=200_000)
+    args: Final = parser.parse_args()
+
+    print(f"Payload: {len(_PAYLOAD)} Bytes, {args.messages:,} Nachrichten")
+    _measure("json.loads + dict", _decode_legacy, args.messages)
+    _measure("orjson + slots", _decode_typed, args.messages)
+
+
+if __name__ == "__main__":
+    main()
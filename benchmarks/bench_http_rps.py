@@ -0,0 +1,105 @@
+"""Benchmark: Requests pro Sekunde für eine triviale GraphQL-Query je Middleware-Stack.
+
+- `vorher`: der frühere Stack, d.h. Keycloak-Middleware per `@app.middleware("http")`
+  mit Lesen des Bodys, `TraceContextMiddleware` als `BaseHTTPMiddleware`, eine
+  zusätzliche `OpenTelemetryMiddleware` und Prometheus
+- `nachher`: die App aus `inventory.fastapi_app` mit reinen ASGI-Middlewares und
+  einmaliger Instrumentierung
+
+Die Requests laufen über `httpx.ASGITransport` im selben Prozess, d.h. ohne
+Netzwerk und ohne Lifespan (kein Kafka, keine DB). Die Query `{ __typename }`
+mit dem Header `x-introspection` benötigt kein Token.
+
+```powershell
+$env:OTEL_SDK_DISABLED = "true"
+uv run python benchmarks/bench_http_rps.py --requests 5000 --concurrency 20
+```
+"""
+
+import argparse
+import asyncio
+from time import perf_counter
+from typing import Final
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
+from loguru import logger
+from opentelemetry.instrumentation.asgi import OpenTelemetryMiddleware
+from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+from prometheus_client import CollectorRegistry
+from prometheus_fastapi_instrumentator import Instrumentator
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from inventory.fastapi_app import app as current_app
+from inventory.graphql.schema import graphql_router
+from inventory.security.keycloak_service import KeycloakService
+from inventory.tracing.trace_context_util import TraceContextUtil
+
+_QUERY: Final = {"query": "{ __typename }"}
+_HEADERS: Final = {"x-introspection": "true"}
+
+
+class _BaseHTTPTraceContextMiddleware(BaseHTTPMiddleware):
+    """Frühere Implementierung als `BaseHTTPMiddleware`."""
+
+    async def dispatch(self, request: Request, call_next):
+        TraceContextUtil.set(TraceContextUtil.from_current_span())
+        return await call_next(request)
+
+
+def _previous_app() -> FastAPI:
+    app: Final = FastAPI(default_response_class=ORJSONResponse)
+    FastAPIInstrumentor().instrument_app(app)
+    app.add_middleware(_BaseHTTPTraceContextMiddleware)
+    app.add_middleware(OpenTelemetryMiddleware)
+    Instrumentator(registry=CollectorRegistry()).instrument(app)
+
+    @app.middleware("http")
+    async def inject_keycloak(request: Request, call_next):
+        body = await request.body()
+        request.state.keycloak = (
+            None if b"__schema" in body else await KeycloakService.create(request)
+        )
+        return await call_next(request)
+
+    app.include_router(graphql_router, prefix="/graphql")
+    return app
+
+
+async def _measure(app: FastAPI, requests: int, concurrency: int) -> float:
+    transport: Final = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def _worker(count: int) -> None:
+            for _ in range(count):
+                response = await client.post("/graphql", json=_QUERY, headers=_HEADERS)
+                response.raise_for_status()
+
+        # Warmup
+        await _worker(min(requests, 100))
+
+        per_worker: Final = requests // concurrency
+        start: Final = perf_counter()
+        await asyncio.gather(*(_worker(per_worker) for _ in range(concurrency)))
+        return per_worker * concurrency / (perf_counter() - start)
+
+
+async def _run(requests: int, concurrency: int) -> None:
+    logger.remove()
+    for label, app in (("vorher", _previous_app()), ("nachher", current_app)):
+        rps = await _measure(app, requests, concurrency)
+        print(f"{label:<8} {rps:10,.0f} Requests/s")
+
+
+def main() -> None:
+    """Benchmark ausführen."""
+    parser: Final = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args: Final = parser.parse_args()
+    asyncio.run(_run(args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
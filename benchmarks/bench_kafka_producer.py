@@ -0,0 +1,95 @@
+"""Benchmark: Nachrichten pro Sekunde des KafkaProducerService je Modus.
+
+Modi:
+
+- `send_and_wait`: `publish`, d.h. ein Round Trip je Nachricht (Producer ohne Linger)
+- `nowait`: `publish_nowait` + `flush()`, Batching über `producer_linger_ms`
+- `nowait+lz4` / `nowait+zstd`: zusätzlich mit Kompression (Extra `compression`)
+
+Benötigt einen laufenden Kafka-Broker (`KAFKA_URI`), mit `--transport memory`
+wird nur der Overhead im Prozess gemessen.
+
+```powershell
+uv run --extra compression python benchmarks/bench_kafka_producer.py --messages 20000
+```
+"""
+
+import argparse
+import asyncio
+import os
+from time import perf_counter
+from typing import Final
+
+import orjson
+from loguru import logger
+
+from inventory.messaging.kafka_producer_service import KafkaProducerService
+from inventory.messaging.transport import AIOKafkaTransport, InMemoryTransport, KafkaTransport
+
+_TOPIC: Final = "inventory.benchmark.producer"
+
+# Modus → (Umgebungsvariablen für KafkaSettings, publish_nowait?)
+_MODES: Final[dict[str, tuple[dict[str, str], bool]]] = {
+    "send_and_wait": ({}, False),
+    "nowait": ({}, True),
+    "nowait+lz4": ({"KAFKA_PRODUCER_COMPRESSION": "lz4"}, True),
+    "nowait+zstd": ({"KAFKA_PRODUCER_COMPRESSION": "zstd"}, True),
+}
+
+_PAYLOAD: Final = orjson.dumps(
+    {
+        "item": {"inventoryId": "5b1b3b5e-6a4c-4c1f-9a55-0b1f1f2b8a01", "quantity": 3},
+        "customerId": "0a6d2f0c-8c3b-4bd8-9a10-5a1b8a2ad6f3",
+    },
+)
+
+
+async def _run_mode(
+    transport: KafkaTransport,
+    env: dict[str, str],
+    nowait: bool,
+    messages: int,
+) -> float:
+    os.environ.update(env)
+    try:
+        producer: Final = KafkaProducerService(transport=transport)
+    finally:
+        for key in env:
+            del os.environ[key]
+    await producer.start()
+
+    start: Final = perf_counter()
+    if nowait:
+        for _ in range(messages):
+            await producer.publish_nowait(_TOPIC, _PAYLOAD)
+        await producer.flush()
+    else:
+        for _ in range(messages):
+            await producer.publish(_TOPIC, _PAYLOAD)
+    elapsed: Final = perf_counter() - start
+
+    await producer.stop()
+    return messages / elapsed
+
+
+async def _run(messages: int, transport_name: str) -> None:
+    logger.remove()
+    for mode, (env, nowait) in _MODES.items():
+        transport: KafkaTransport = (
+            InMemoryTransport() if transport_name == "memory" else AIOKafkaTransport()
+        )
+        rate = await _run_mode(transport, env, nowait, messages)
+        print(f"{mode:<14} {rate:12,.0f} Nachrichten/s")
+
+
+def main() -> None:
+    """Benchmark ausführen."""
+    parser: Final = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=20_000)
+    parser.add_argument("--transport", choices=["kafka", "memory"], default="kafka")
+    args: Final = parser.parse_args()
+    asyncio.run(_run(args.messages, args.transport))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Benchmark: Reserve- und Release-Events durch die echten Handler gegen die lokale DB.
+
+Die Events laufen über den In-Memory-Broker (`InMemoryTransport`) und den
+`KafkaConsumerService` inkl. Backpressure in die `ReserveItemHandler` und
+`ReleaseItemHandler`. Es wird kein Kafka-Broker benötigt, wohl aber die lokale
+MySQL-DB aus `app.toml` mit geladenen Testdaten.
+
+Je Kunde wird ein Reserve- und ein Release-Event gesendet. Reserve und Release
+sind verschiedene Topics, d.h. der Key ordnet sie nicht zueinander. Deshalb
+laufen zwei Phasen: zuerst werden alle Reserve-Events vollständig verarbeitet,
+danach alle Release-Events. Der Bestand ist danach unverändert. Schlägt ein
+Handler fehl, bricht der Benchmark ohne Ergebnis ab, damit nicht der Fehlerpfad
+gemessen wird.
+
+```powershell
+uv run python benchmarks/bench_kafka_replay.py --events 10000 --consumers 2
+```
+"""
+
+import argparse
+import asyncio
+import uuid
+from time import perf_counter
+from typing import Final
+
+import orjson
+from sqlalchemy import select
+
+from inventory.messaging.handler.release_item_handler import ReleaseItemHandler
+from inventory.messaging.handler.reserve_item_handler import ReserveItemHandler
+from inventory.messaging.kafka_consumer_service import KafkaConsumerService
+from inventory.messaging.kafka_event_dispatcher import KafkaEventDispatcher
+from inventory.messaging.kafka_topic_properties import KafkaTopics
+from inventory.messaging.transport import InMemoryBroker, InMemoryTransport
+from inventory.model.dto.inventory_item_event import EVENT_VERSION_HEADER
+from inventory.model.entity.inventory import Inventory
+from inventory.repository.session import dispose_connection_pool, get_session
+
+
+class _Progress:
+    """Verarbeitete und fehlgeschlagene Events der aktuellen Phase."""
+
+    def __init__(self) -> None:
+        self.expected = 0
+        self.processed = 0
+        self.failures = 0
+        self.done = asyncio.Event()
+
+    def reset(self, expected: int) -> None:
+        self.expected = expected
+        self.processed = 0
+        self.failures = 0
+        self.done = asyncio.Event()
+
+
+class _CountingHandler:
+    """Zählt verarbeitete und fehlgeschlagene Events und meldet das Ende der Phase."""
+
+    def __init__(self, handler, progress: _Progress) -> None:
+        self._handler = handler
+        self._progress = progress
+
+    async def __call__(self, value: bytes, headers: dict[str, str]) -> None:
+        try:
+            await self._handler(value, headers)
+        except Exception:
+            self._progress.failures += 1
+            raise
+        finally:
+            self._progress.processed += 1
+            if self._progress.processed >= self._progress.expected:
+                self._progress.done.set()
+
+
+async def _inventory_ids(limit: int) -> list[str]:
+    async with get_session() as session:
+        result = await session.scalars(select(Inventory.id).limit(limit))
+        return list(result.all())
+
+
+async def _run(events: int, consumers: int, partitions: int) -> None:
+    inventory_ids: Final = await _inventory_ids(limit=50)
+    if not inventory_ids:
+        raise SystemExit("Keine Inventare in der DB gefunden: zuerst die DB befüllen")
+
+    transport: Final = InMemoryTransport(InMemoryBroker(num_partitions=partitions))
+    pairs: Final = events // 2
+    progress: Final = _Progress()
+
+    dispatcher: Final = KafkaEventDispatcher()
+    dispatcher.register(
+        KafkaTopics.inventory_reserve,
+        _CountingHandler(ReserveItemHandler(), progress),
+    )
+    dispatcher.register(
+        KafkaTopics.inventory_release,
+        _CountingHandler(ReleaseItemHandler(), progress),
+    )
+
+    customers: Final = [
+        (str(uuid.uuid4()), inventory_ids[index % len(inventory_ids)]) for index in range(pairs)
+    ]
+
+    consumer_services: Final = [
+        KafkaConsumerService(
+            dispatcher=dispatcher,
+            topics=[KafkaTopics.inventory_reserve, KafkaTopics.inventory_release],
+            name=f"bench-{index}",
+            transport=transport,
+        )
+        for index in range(consumers)
+    ]
+
+    for service in consumer_services:
+        await service.start()
+
+    elapsed = 0.0
+    try:
+        for topic in (KafkaTopics.inventory_reserve, KafkaTopics.inventory_release):
+            progress.reset(expected=pairs)
+            # Events zuerst vollständig in den Broker schreiben, damit nur der Verbrauch zählt
+            for customer_id, inventory_id in customers:
+                transport.broker.append(
+                    topic,
+                    orjson.dumps(
+                        {
+                            "item": {"inventoryId": inventory_id, "quantity": 1},
+                            "customerId": customer_id,
+                        },
+                    ),
+                    key=customer_id.encode(),
+                    headers=[(EVENT_VERSION_HEADER, b"1.0.0")],
+                )
+            start = perf_counter()
+            await progress.done.wait()
+            elapsed += perf_counter() - start
+            if progress.failures:
+                raise SystemExit(
+                    f"{progress.failures:,} Handler-Fehler in {topic}: Messung ungültig",
+                )
+    finally:
+        for service in consumer_services:
+            await service.stop()
+        await dispose_connection_pool()
+
+    print(
+        f"{pairs * 2:,} Events mit {consumers} Consumer(n) / {partitions} Partitionen: "
+        f"{elapsed:.2f}s, {pairs * 2 / elapsed:,.0f} Events/s",
+    )
+
+
+def main() -> None:
+    """Benchmark ausführen."""
+    parser: Final = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=10_000)
+    parser.add_argument("--consumers", type=int, default=1)
+    parser.add_argument("--partitions", type=int, default=3)
+    args: Final = parser.parse_args()
+    asyncio.run(_run(args.events, args.consumers, args.partitions))
+
+
+if __name__ == "__main__":
+    main()
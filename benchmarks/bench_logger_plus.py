@@ -0,0 +1,82 @@
+"""Benchmark: Overhead je Aufruf von `LoggerPlus.info`.
+
+Vergleicht die bisherige Ermittlung von Klasse und Methode per `inspect.stack()`
+mit dem Frame-Walk über `sys._getframe` und dem Cache je Code-Objekt. Die
+loguru-Ausgabe ist abgeschaltet und die Events landen in einer unbeschränkten
+Queue, d.h. gemessen wird nur der Aufruf selbst.
+
+```powershell
+uv run python benchmarks/bench_logger_plus.py --calls 20000
+```
+"""
+
+import argparse
+import asyncio
+import inspect
+from time import perf_counter_ns
+from typing import Final
+
+from loguru import logger
+
+from inventory.messaging.kafka_singleton import get_kafka_producer
+from inventory.tracing.log_event_pipeline import LogEventPipeline
+from inventory.tracing.logger_plus import LoggerPlus
+
+
+class _InspectStackLoggerPlus(LoggerPlus):
+    """Bisherige Implementierung mit `inspect.stack()`."""
+
+    def _get_context(self) -> tuple[str, str]:
+        frame = inspect.stack()[3]
+        instance = frame.frame.f_locals.get("self", None)
+        class_name = instance.__class__.__name__ if instance else "UnknownClass"
+        return class_name, frame.function
+
+
+class _Service:
+    """Aufrufer wie z.B. ein Service mit `self`."""
+
+    def __init__(self, logger_plus: LoggerPlus) -> None:
+        self._logger_plus = logger_plus
+
+    async def do_work(self, calls: int) -> int:
+        start: Final = perf_counter_ns()
+        for index in range(calls):
+            await self._logger_plus.info("Artikel %s reserviert", index)
+        return perf_counter_ns() - start
+
+
+def _logger_plus(cls: type[LoggerPlus]) -> LoggerPlus:
+    logger_plus: Final = cls()
+    # Unbeschränkte Queue ohne Publisher: kein Überlauf, kein Kafka
+    logger_plus.pipeline = LogEventPipeline(
+        producer_factory=get_kafka_producer,
+        max_queue=0,
+        batch_size=1,
+        linger_ms=0,
+    )
+    return logger_plus
+
+
+async def _run(calls: int) -> None:
+    logger.remove()
+    for label, cls in (
+        ("inspect.stack()", _InspectStackLoggerPlus),
+        ("sys._getframe + Cache", LoggerPlus),
+    ):
+        service = _Service(_logger_plus(cls))
+        await service.do_work(min(calls, 1_000))  # Warmup
+        elapsed_ns = await service.do_work(calls)
+        print(f"{label:<24} {elapsed_ns / calls / 1000:8.2f} µs/Aufruf")
+
+
+def main() -> None:
+    """Benchmark ausführen."""
+    parser: Final = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20_000)
+    args: Final = parser.parse_args()
+    asyncio.run(_run(args.calls))
+
+
+if __name__ == "__main__":
+    main()
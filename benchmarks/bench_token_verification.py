@@ -0,0 +1,94 @@
+"""Benchmark: verifizierte Tokens pro Sekunde mit und ohne Token-Cache.
+
+Ein Schlüsselpaar wird lokal erzeugt und der öffentliche Schlüssel direkt in den
+JWKS-Cache gelegt, d.h. Keycloak wird nicht benötigt. Gemessen wird
+`KeycloakService._decode_token` für `--tokens` verschiedene Tokens, die jeweils
+`--reuse` mal verwendet werden (wie ein Client, der sein Token wiederverwendet).
+
+```powershell
+uv run python benchmarks/bench_token_verification.py --tokens 50 --reuse 200
+```
+"""
+
+import argparse
+import asyncio
+from time import perf_counter, time
+from typing import Final
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+from loguru import logger
+
+import inventory.security.jwks_cache as jwks_cache_module
+import inventory.security.token_cache as token_cache_module
+from inventory.security.jwks_cache import JwksCache
+from inventory.security.keycloak_service import KeycloakService
+from inventory.security.token_cache import TokenCache
+
+_KID: Final = "benchmark"
+
+
+def _signed_tokens(count: int) -> tuple[list[str], JwksCache]:
+    private_key: Final = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem: Final = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem: Final = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+
+    jwks_cache: Final = JwksCache(
+        url="http://localhost/certs",
+        ttl=3600,
+        min_refetch_interval=3600,
+        timeout=1,
+    )
+    jwks_cache._keys = {_KID: jwk.construct(public_pem, "RS256")}  # noqa: SLF001
+
+    exp: Final = int(time()) + 3600
+    tokens: Final = [
+        jwt.encode(
+            {"sub": f"user-{index}", "exp": exp, "realm_access": {"roles": ["User"]}},
+            private_pem,
+            algorithm="RS256",
+            headers={"kid": _KID},
+        )
+        for index in range(count)
+    ]
+    return tokens, jwks_cache
+
+
+async def _verify_all(tokens: list[str], reuse: int) -> float:
+    start: Final = perf_counter()
+    for _ in range(reuse):
+        for token in tokens:
+            await KeycloakService._decode_token(token)  # noqa: SLF001
+    return len(tokens) * reuse / (perf_counter() - start)
+
+
+async def _run(token_count: int, reuse: int) -> None:
+    logger.remove()
+    tokens, jwks_cache = _signed_tokens(token_count)
+    jwks_cache_module._jwks_cache = jwks_cache  # noqa: SLF001
+
+    for label, max_size in (("ohne Cache", 0), ("mit Cache", 10_000)):
+        token_cache_module._token_cache = TokenCache(max_size=max_size)  # noqa: SLF001
+        rate = await _verify_all(tokens, reuse)
+        print(f"{label:<12} {rate:12,.0f} Verifikationen/s")
+
+
+def main() -> None:
+    """Benchmark ausführen."""
+    parser: Final = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=50)
+    parser.add_argument("--reuse", type=int, default=200)
+    args: Final = parser.parse_args()
+    asyncio.run(_run(args.tokens, args.reuse))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Invalidierung des Response-Caches über Prozessgrenzen per Kafka.
+
+Schreiboperationen laufen auch in anderen Prozessen, z.B. Reservierungen aus
+Kafka-Events im separaten `inventory-worker` oder Mutationen in einer anderen
+Instanz. `invalidate_response_cache` invalidiert deshalb den eigenen Cache und
+sendet die Tags an das Topic `KafkaTopics.response_cache_invalidated`.
+
+Jeder HTTP-Server liest das Topic mit einem Consumer ohne Consumer Group ab dem
+aktuellen Ende und invalidiert seinen Cache. Beim (Neu-)Start des Consumers wird
+der Cache geleert, da Invalidierungen während eines Ausfalls verloren sind.
+Nur wenn Kafka nicht erreichbar ist, begrenzt allein die TTL veraltete Antworten.
+"""
+
+import asyncio
+from contextlib import suppress
+from typing import Final, Optional
+from uuid import uuid4
+
+from aiokafka import ConsumerRecord
+from loguru import logger
+import orjson
+
+from inventory.cache.response_cache import get_response_cache
+from inventory.config import env
+from inventory.config.kafka import get_kafka_settings
+from inventory.messaging.kafka_topic_properties import KafkaTopics
+from inventory.messaging.transport import KafkaConsumerClient, KafkaTransport
+
+__all__ = [
+    "ResponseCacheInvalidationListener",
+    "get_response_cache_invalidation_listener",
+    "invalidate_response_cache",
+]
+
+_RETRY_INTERVAL_S: Final = 5.0
+
+_INSTANCE_HEADER: Final = "x-instance"
+_INSTANCE_ID: Final = uuid4().hex
+"""Kennung des Prozesses: eigene Invalidierungen sind bereits lokal erledigt."""
+
+
+async def invalidate_response_cache(*tags: str) -> None:
+    """Antworten mit den Tags im eigenen Cache und in allen anderen Prozessen entfernen."""
+    cache: Final = get_response_cache()
+    cache.invalidate(*tags)
+    if not cache.enabled:
+        return
+
+    # ⛔ Zirkularimport vermeiden durch Lazy Import:
+    from inventory.messaging.kafka_singleton import get_kafka_producer
+
+    try:
+        sent = await get_kafka_producer().publish_nowait(
+            topic=KafkaTopics.response_cache_invalidated,
+            payload={"tags": list(tags)},
+            headers=[(_INSTANCE_HEADER, _INSTANCE_ID)],
+            # Nach einem Ausfall sind die Caches ohnehin geleert
+            spill=False,
+        )
+    except Exception as e:
+        logger.warning("⚠️ Cache-Invalidierung nicht gesendet: {}", e)
+        return
+    sent.add_done_callback(_log_send_failure)
+
+
+def _log_send_failure(sent: asyncio.Future) -> None:
+    if not sent.cancelled() and (error := sent.exception()) is not None:
+        logger.warning("⚠️ Cache-Invalidierung nicht gesendet: {}", error)
+
+
+def _decode_tags(record: ConsumerRecord) -> list[str]:
+    """Tags einer Invalidierung, leer falls sie von diesem Prozess stammt."""
+    headers: Final = dict(record.headers or ())
+    if headers.get(_INSTANCE_HEADER) == _INSTANCE_ID.encode():
+        return []
+    try:
+        tags = orjson.loads(record.value)["tags"]
+    except (orjson.JSONDecodeError, KeyError, TypeError) as e:
+        logger.error("⚠️ Ungültige Cache-Invalidierung: {}", e)
+        return []
+    return [str(tag) for tag in tags]
+
+
+class ResponseCacheInvalidationListener:
+    """Liest Invalidierungen anderer Prozesse und wendet sie auf den eigenen Cache an."""
+
+    def __init__(self, transport: KafkaTransport) -> None:
+        self._transport: Final = transport
+        self._consumer: Optional[KafkaConsumerClient] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Consumer im Hintergrund starten, ohne auf Kafka zu warten."""
+        if not get_response_cache().enabled:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self._close_consumer()
+
+    async def _connect(self) -> bool:
+        settings: Final = get_kafka_settings()
+        consumer: Final = self._transport.create_consumer(
+            bootstrap_servers=env.KAFKA_URI,
+            client_id=f"{settings.client_id}-response-cache",
+            # Ohne Group: jeder Prozess liest alle Partitionen, nur neue Invalidierungen
+            group_id=None,
+            auto_offset_reset="latest",
+            enable_auto_commit=False,
+        )
+        consumer.subscribe([KafkaTopics.response_cache_invalidated])
+        try:
+            await consumer.start()
+        except Exception as e:
+            logger.warning("⚠️ Cache-Invalidierung: Kafka nicht erreichbar: {}", e)
+            with suppress(Exception):
+                await consumer.stop()
+            return False
+        self._consumer = consumer
+        return True
+
+    async def _close_consumer(self) -> None:
+        if self._consumer is not None:
+            with suppress(Exception):
+                await self._consumer.stop()
+            self._consumer = None
+
+    async def _run(self) -> None:
+        """Invalidierungen lesen; fällt der Consumer aus, wird er nach einer Pause neu angelegt."""
+        while True:
+            if not await self._connect():
+                await asyncio.sleep(_RETRY_INTERVAL_S)
+                continue
+            # Invalidierungen vor dem Start bzw. während des Ausfalls sind verloren
+            get_response_cache().clear()
+            try:
+                await self._consume()
+            except Exception:
+                logger.exception(
+                    "❌ Cache-Invalidierung: Consumer ausgefallen, Neustart in {}s",
+                    _RETRY_INTERVAL_S,
+                )
+                await self._close_consumer()
+                await asyncio.sleep(_RETRY_INTERVAL_S)
+
+    async def _consume(self) -> None:
+        cache: Final = get_response_cache()
+        while True:
+            batches = await self._consumer.getmany(timeout_ms=1000, max_records=1000)
+            tags = {
+                tag
+                for records in batches.values()
+                for record in records
+                for tag in _decode_tags(record)
+            }
+            if tags:
+                cache.invalidate(*tags)
+
+
+_listener: Optional[ResponseCacheInvalidationListener] = None
+
+
+def get_response_cache_invalidation_listener() -> ResponseCacheInvalidationListener:
+    """Gemeinsamer Listener des Prozesses."""
+    global _listener
+    if _listener is None:
+        # ⛔ Zirkularimport vermeiden durch Lazy Import:
+        from inventory.messaging.kafka_singleton import get_kafka_transport
+
+        _listener = ResponseCacheInvalidationListener(transport=get_kafka_transport())
+    return _listener
@@ -0,0 +1,27 @@
+"""Prometheus-Metriken für den Cache der GraphQL-Antworten."""
+
+from typing import Final
+
+from prometheus_client import Counter, Gauge
+
+__all__ = [
+    "graphql_response_cache_bytes",
+    "graphql_response_cache_invalidations",
+    "graphql_response_cache_lookups",
+]
+
+graphql_response_cache_lookups: Final = Counter(
+    "inventory_graphql_response_cache_lookups",
+    "Zugriffe auf den Cache für Antworten von Queries nach Ergebnis (hit, miss, expired)",
+    ["result"],
+)
+
+graphql_response_cache_bytes: Final = Gauge(
+    "inventory_graphql_response_cache_bytes",
+    "Größe der gecachten Antworten als JSON in Bytes",
+)
+
+graphql_response_cache_invalidations: Final = Counter(
+    "inventory_graphql_response_cache_invalidations",
+    "Antworten, die wegen einer Änderung an Inventaren oder Produkten entfernt wurden",
+)
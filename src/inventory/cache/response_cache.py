@@ -0,0 +1,189 @@
+"""Cache für Antworten der Queries `inventory` und `inventorys` mit Invalidierung per Tags.
+
+Der Cache liegt außerhalb der GraphQL-Schicht, damit Services und das Product
+Read Model ihn invalidieren können, ohne von `inventory.graphql` abzuhängen.
+Befüllt wird er durch `inventory.graphql.response_cache.ResponseCacheExtension`.
+
+Der Speicher ist durch die Größe der Antworten als JSON beschränkt, bei
+Überschreitung wird LRU verdrängt. Änderungen in anderen Instanzen oder im
+separaten `inventory-worker` kommen per Kafka an (siehe
+`inventory.cache.cache_invalidation`).
+"""
+
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, Final, Optional
+
+import orjson
+
+from inventory.cache.cache_metrics import (
+    graphql_response_cache_bytes,
+    graphql_response_cache_invalidations,
+    graphql_response_cache_lookups,
+)
+from inventory.config.graphql import graphql_response_cache_max_bytes, graphql_response_cache_ttl
+
+__all__ = [
+    "INVENTORYS_TAG",
+    "ResponseCache",
+    "get_response_cache",
+    "inventory_tag",
+    "product_tag",
+]
+
+INVENTORYS_TAG: Final = "inventorys"
+"""Tag aller Suchergebnisse, d.h. jede Schreiboperation entfernt sie."""
+
+
+def inventory_tag(inventory_id: str) -> str:
+    """Tag der Antworten mit dem Inventar `inventory_id`."""
+    return f"inventory:{inventory_id}"
+
+
+def product_tag(product_id: str) -> str:
+    """Tag der Antworten mit dem Produktnamen zu `product_id`."""
+    return f"product:{product_id}"
+
+
+@dataclass(eq=False, slots=True, kw_only=True)
+class _Entry:
+    data: bytes
+    tags: frozenset[str]
+    size: int
+    expires_at: float
+
+
+class ResponseCache:
+    """Beschränkter Cache: Schlüssel → Daten einer Antwort als JSON mit Tags."""
+
+    def __init__(self, max_bytes: int, ttl: float) -> None:
+        self._max_bytes: Final = max_bytes
+        self._ttl: Final = ttl
+        self._entries: Final[OrderedDict[str, _Entry]] = OrderedDict()
+        self._keys_by_tag: Final[dict[str, set[str]]] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self.generation = 0
+        """Wird bei jeder Invalidierung erhöht, damit keine veraltete Antwort gespeichert wird."""
+
+    @property
+    def enabled(self) -> bool:
+        """Flag, ob Antworten gespeichert werden."""
+        return self._max_bytes > 0
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Daten einer gespeicherten Antwort, None falls unbekannt oder abgelaufen.
+
+        Jeder Treffer erhält eine eigene Kopie, d.h. Aufrufer können sie ändern.
+        """
+        entry: Final = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            graphql_response_cache_lookups.labels("miss").inc()
+            return None
+        if monotonic() >= entry.expires_at:
+            self._remove(key)
+            self._misses += 1
+            graphql_response_cache_lookups.labels("expired").inc()
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        graphql_response_cache_lookups.labels("hit").inc()
+        return orjson.loads(entry.data)
+
+    def put(
+        self,
+        key: str,
+        data: dict[str, Any],
+        tags: Iterable[str],
+        generation: int,
+    ) -> None:
+        """Daten einer Antwort speichern, falls seit `generation` nichts invalidiert wurde."""
+        if not self.enabled or generation != self.generation:
+            return
+        serialized: Final = orjson.dumps(data)
+        size: Final = len(serialized)
+        if size > self._max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+
+        entry: Final = _Entry(
+            data=serialized,
+            tags=frozenset(tags),
+            size=size,
+            expires_at=monotonic() + self._ttl,
+        )
+        self._entries[key] = entry
+        self._bytes += size
+        for tag in entry.tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+        while self._bytes > self._max_bytes:
+            self._remove(next(iter(self._entries)))
+        graphql_response_cache_bytes.set(self._bytes)
+
+    def invalidate(self, *tags: str) -> None:
+        """Alle Antworten mit mindestens einem der Tags entfernen."""
+        self.generation += 1
+        keys: Final = {key for tag in tags for key in self._keys_by_tag.get(tag, ())}
+        for key in keys:
+            self._remove(key)
+        if keys:
+            self._invalidations += len(keys)
+            graphql_response_cache_invalidations.inc(len(keys))
+            graphql_response_cache_bytes.set(self._bytes)
+
+    def clear(self) -> None:
+        """Alle Antworten entfernen, z.B. wenn Invalidierungen verloren sein können."""
+        self.generation += 1
+        removed: Final = len(self._entries)
+        self._entries.clear()
+        self._keys_by_tag.clear()
+        self._bytes = 0
+        if removed:
+            self._invalidations += removed
+            graphql_response_cache_invalidations.inc(removed)
+            graphql_response_cache_bytes.set(0)
+
+    def stats(self) -> dict[str, Any]:
+        """Speichergrenze, Belegung und Trefferquote, z.B. für `/admin/cache`."""
+        lookups: Final = self._hits + self._misses
+        return {
+            "enabled": self.enabled,
+            "maxBytes": self._max_bytes,
+            "bytes": self._bytes,
+            "entries": len(self._entries),
+            "ttl": self._ttl,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hitRatio": self._hits / lookups if lookups else 0.0,
+            "invalidations": self._invalidations,
+        }
+
+    def _remove(self, key: str) -> None:
+        entry: Final = self._entries.pop(key)
+        self._bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Gemeinsamer Response-Cache des Prozesses."""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache(
+            max_bytes=graphql_response_cache_max_bytes,
+            ttl=graphql_response_cache_ttl,
+        )
+    return _response_cache
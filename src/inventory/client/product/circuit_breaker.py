@@ -0,0 +1,143 @@
+"""Circuit Breaker für Aufrufe des Product-Service.
+
+- geschlossen: Requests laufen, das Ergebnis kommt in ein Fenster der letzten Aufrufe.
+  Überschreitet die Fehlerquote den Schwellwert, öffnet der Breaker.
+- offen: Requests werden sofort mit `CircuitOpenError` abgelehnt.
+- halb offen: nach `open_seconds` sind einzelne Probe-Requests erlaubt. Sind alle
+  erfolgreich, schließt der Breaker, sonst öffnet er wieder.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from enum import IntEnum
+from time import monotonic
+from typing import Final
+
+import httpx
+from loguru import logger
+
+from inventory.client.product.product_metrics import (
+    product_breaker_rejected,
+    product_breaker_state,
+    product_breaker_transitions,
+)
+
+__all__ = ["CircuitBreaker", "CircuitOpenError", "CircuitState", "is_failure"]
+
+
+class CircuitOpenError(Exception):
+    """Exception, falls der Circuit Breaker offen ist und kein Request gesendet wird."""
+
+
+class CircuitState(IntEnum):
+    """Zustände des Circuit Breakers, der Wert wird als Metrik exportiert."""
+
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
+
+
+def is_failure(error: BaseException) -> bool:
+    """Nur Timeouts, Verbindungsfehler und 5xx zählen, nicht z.B. 401 oder GraphQL-Fehler."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, (TimeoutError, httpx.TransportError))
+
+
+class CircuitBreaker:
+    """Circuit Breaker mit Fehlerquote über die letzten `window` Aufrufe."""
+
+    def __init__(
+        self,
+        window: int,
+        failure_rate: float,
+        min_calls: int,
+        open_seconds: float,
+        half_open_probes: int,
+    ) -> None:
+        self._results: Final[deque[bool]] = deque(maxlen=window)
+        self._failure_rate: Final = failure_rate
+        self._min_calls: Final = min_calls
+        self._open_seconds: Final = open_seconds
+        self._half_open_probes: Final = half_open_probes
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probes_started = 0
+        self._probes_succeeded = 0
+        product_breaker_state.set(self._state)
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    async def call[T](self, fn: Callable[[], Awaitable[T]]) -> T:
+        """`fn` ausführen, sofern der Breaker es zulässt.
+
+        :raises CircuitOpenError: Falls der Breaker offen ist
+        """
+        self._before_call()
+        try:
+            result: Final = await fn()
+        except asyncio.CancelledError:
+            # Abbruch durch den Aufrufer sagt nichts über den Product-Service aus
+            if self._state == CircuitState.HALF_OPEN:
+                self._probes_started -= 1
+            raise
+        except Exception as e:
+            self._on_result(success=not is_failure(e))
+            raise
+        self._on_result(success=True)
+        return result
+
+    def _before_call(self) -> None:
+        if (
+            self._state == CircuitState.OPEN
+            and monotonic() - self._opened_at >= self._open_seconds
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+
+        if self._state == CircuitState.OPEN or (
+            self._state == CircuitState.HALF_OPEN
+            and self._probes_started >= self._half_open_probes
+        ):
+            product_breaker_rejected.inc()
+            raise CircuitOpenError("Product-Service: Circuit Breaker offen")
+
+        if self._state == CircuitState.HALF_OPEN:
+            self._probes_started += 1
+
+    def _on_result(self, success: bool) -> None:
+        if self._state == CircuitState.HALF_OPEN:
+            if not success:
+                self._transition(CircuitState.OPEN)
+                return
+            self._probes_succeeded += 1
+            if self._probes_succeeded >= self._half_open_probes:
+                self._transition(CircuitState.CLOSED)
+            return
+
+        if self._state == CircuitState.OPEN:
+            # Nachzügler aus der Zeit vor dem Öffnen
+            return
+
+        self._results.append(success)
+        failures: Final = self._results.count(False)
+        if (
+            len(self._results) >= self._min_calls
+            and failures / len(self._results) >= self._failure_rate
+        ):
+            self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        previous: Final = self._state
+        self._state = state
+        self._probes_started = 0
+        self._probes_succeeded = 0
+        if state == CircuitState.OPEN:
+            self._opened_at = monotonic()
+        if state == CircuitState.CLOSED:
+            self._results.clear()
+        product_breaker_state.set(state)
+        product_breaker_transitions.labels(previous.name.lower(), state.name.lower()).inc()
+        logger.warning("🔌 Product-Service Circuit Breaker: {} → {}", previous.name, state.name)
@@ -0,0 +1,203 @@
+"""Cache für Produktdaten aus dem Product-Service mit TTL und LRU-Verdrängung.
+
+- Aktuelle Einträge werden ohne Remote-Aufruf geliefert.
+- Nicht existierende Produkte werden kürzer gemerkt (negatives Caching).
+- Abgelaufene Einträge werden innerhalb von `stale_ttl` noch geliefert und
+  parallel im Hintergrund aktualisiert (stale-while-revalidate).
+"""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, Final, Optional
+
+from loguru import logger
+
+from inventory.client.product.product_metrics import product_cache_lookups, product_cache_size
+from inventory.config.product import (
+    product_cache_max_size,
+    product_cache_negative_ttl,
+    product_cache_stale_ttl,
+    product_cache_ttl,
+)
+
+__all__ = ["ProductBatchLoader", "ProductCache", "ProductLoader", "get_product_cache"]
+
+type ProductLoader = Callable[[], Awaitable[Optional[dict[str, Any]]]]
+"""Lädt ein Produkt aus dem Product-Service, None falls es nicht existiert."""
+
+type ProductBatchLoader = Callable[
+    [list[str]], Awaitable[dict[str, Optional[dict[str, Any]]]]
+]
+"""Lädt mehrere Produkte mit einem Request: ID → Produkt bzw. None.
+
+IDs, die wegen eines Fehlers nicht geladen wurden, fehlen im Ergebnis.
+"""
+
+
+@dataclass(eq=False, slots=True, kw_only=True)
+class _CacheEntry:
+    product: Optional[dict[str, Any]]
+    expires_at: float
+    stale_until: float
+
+
+class ProductCache:
+    """Beschränkter Cache: Produkt-ID → Produktdaten (oder None für unbekannt)."""
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        negative_ttl: float,
+        stale_ttl: float,
+    ) -> None:
+        self._max_size: Final = max_size
+        self._ttl: Final = ttl
+        self._negative_ttl: Final = negative_ttl
+        self._stale_ttl: Final = stale_ttl
+        self._entries: Final[OrderedDict[str, _CacheEntry]] = OrderedDict()
+        self._refreshing: Final[dict[str, asyncio.Task]] = {}
+
+    async def get(self, product_id: str, loader: ProductLoader) -> Optional[dict[str, Any]]:
+        """Produkt aus dem Cache oder über `loader` laden.
+
+        :param product_id: ID des Produkts
+        :param loader: Lädt das Produkt bei einem Miss bzw. zur Aktualisierung
+        :return: Produktdaten oder None, falls das Produkt nicht existiert
+        :raises Exception: Fehler von `loader` bei einem Miss
+        """
+        now: Final = monotonic()
+        entry: Final = self._entries.get(product_id)
+        if entry is not None:
+            if now < entry.expires_at:
+                self._entries.move_to_end(product_id)
+                product_cache_lookups.labels("hit" if entry.product else "negative_hit").inc()
+                return entry.product
+            if now < entry.stale_until:
+                self._entries.move_to_end(product_id)
+                product_cache_lookups.labels("stale").inc()
+                self._refresh_in_background(product_id, loader)
+                return entry.product
+
+        product_cache_lookups.labels("miss").inc()
+        product: Final = await loader()
+        self.put(product_id, product)
+        return product
+
+    async def get_many(
+        self,
+        product_ids: list[str],
+        loader: ProductBatchLoader,
+    ) -> dict[str, Optional[dict[str, Any]]]:
+        """Mehrere Produkte aus dem Cache, alle Misses mit einem Aufruf von `loader`.
+
+        :param product_ids: IDs der Produkte, Duplikate sind erlaubt
+        :param loader: Lädt die fehlenden bzw. zu aktualisierenden Produkte
+        :return: Produkt-ID → Produktdaten bzw. None, auch für nicht ladbare IDs
+        :raises Exception: Fehler von `loader`, falls es Misses gibt
+        """
+        now: Final = monotonic()
+        result: Final[dict[str, Optional[dict[str, Any]]]] = {}
+        missing: Final[list[str]] = []
+        stale: Final[list[str]] = []
+        for product_id in dict.fromkeys(product_ids):
+            entry = self._entries.get(product_id)
+            if entry is None or now >= entry.stale_until:
+                missing.append(product_id)
+                continue
+            self._entries.move_to_end(product_id)
+            result[product_id] = entry.product
+            if now < entry.expires_at:
+                product_cache_lookups.labels("hit" if entry.product else "negative_hit").inc()
+            else:
+                product_cache_lookups.labels("stale").inc()
+                if product_id not in self._refreshing:
+                    stale.append(product_id)
+
+        if stale:
+            self._refresh_many_in_background(stale, loader)
+
+        if missing:
+            product_cache_lookups.labels("miss").inc(len(missing))
+            loaded: Final = await loader(missing)
+            for product_id in missing:
+                product = loaded.get(product_id)
+                # Fehlende IDs: Fehler statt "nicht vorhanden", d.h. kein negatives Caching
+                if product_id in loaded:
+                    self.put(product_id, product)
+                result[product_id] = product
+        return result
+
+    def put(self, product_id: str, product: Optional[dict[str, Any]]) -> None:
+        """Produkt (oder None für nicht existierend) speichern."""
+        now: Final = monotonic()
+        ttl: Final = self._ttl if product is not None else self._negative_ttl
+        self._entries[product_id] = _CacheEntry(
+            product=product,
+            expires_at=now + ttl,
+            stale_until=now + ttl + self._stale_ttl,
+        )
+        self._entries.move_to_end(product_id)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+        product_cache_size.set(len(self._entries))
+
+    def invalidate(self, product_id: str) -> None:
+        """Eintrag entfernen, z.B. nach einer Änderung des Produkts."""
+        self._entries.pop(product_id, None)
+        product_cache_size.set(len(self._entries))
+
+    def _refresh_in_background(self, product_id: str, loader: ProductLoader) -> None:
+        if product_id in self._refreshing:
+            return
+
+        async def _refresh() -> None:
+            try:
+                self.put(product_id, await loader())
+            except Exception as e:
+                # Alter Wert bleibt bis `stale_until` gültig
+                logger.warning("⚠️ Produkt {} nicht aktualisiert: {}", product_id, e)
+            finally:
+                self._refreshing.pop(product_id, None)
+
+        self._refreshing[product_id] = asyncio.create_task(_refresh())
+
+    def _refresh_many_in_background(
+        self,
+        product_ids: list[str],
+        loader: ProductBatchLoader,
+    ) -> None:
+        async def _refresh() -> None:
+            try:
+                loaded = await loader(product_ids)
+                for product_id in product_ids:
+                    if product_id in loaded:
+                        self.put(product_id, loaded[product_id])
+            except Exception as e:
+                logger.warning("⚠️ {} Produkte nicht aktualisiert: {}", len(product_ids), e)
+            finally:
+                for product_id in product_ids:
+                    self._refreshing.pop(product_id, None)
+
+        task: Final = asyncio.create_task(_refresh())
+        for product_id in product_ids:
+            self._refreshing[product_id] = task
+
+
+_product_cache: Optional[ProductCache] = None
+
+
+def get_product_cache() -> ProductCache:
+    """Gemeinsamer Produkt-Cache des Prozesses."""
+    global _product_cache
+    if _product_cache is None:
+        _product_cache = ProductCache(
+            max_size=product_cache_max_size,
+            ttl=product_cache_ttl,
+            negative_ttl=product_cache_negative_ttl,
+            stale_ttl=product_cache_stale_ttl,
+        )
+    return _product_cache
@@ -1,10 +1,117 @@
+import asyncio
 import httpx
-from typing import Any, Dict
+from time import perf_counter
+from typing import Any, Dict, Final, Optional
 from loguru import logger
 
-from inventory.config import env
+from inventory.client.product.circuit_breaker import CircuitBreaker, CircuitOpenError
+from inventory.client.product.product_metrics import (
+    product_pool_connections,
+    product_request_seconds,
+)
+from inventory.config.product import (
+    product_breaker_failure_rate,
+    product_breaker_half_open_probes,
+    product_breaker_min_calls,
+    product_breaker_open_seconds,
+    product_breaker_window,
+    product_connect_timeout,
+    product_graphql_url,
+    product_http2,
+    product_keepalive_expiry,
+    product_latency_budget,
+    product_max_connections,
+    product_max_keepalive_connections,
+    product_timeout,
+    product_verify_tls,
+)
+
+PRODUCT_GRAPHQL_URL = product_graphql_url
+
+# Ein langlebiger Client je Prozess: Keep-Alive statt TCP-/TLS-Handshake je Aufruf
+_http_client: Optional[httpx.AsyncClient] = None
+
+# Laufende Requests: Ersatz für die aktiven Verbindungen, falls der Pool nicht lesbar ist
+_requests_in_flight = 0
+
+# Bei gestörtem Product-Service sofort auf den Fallback ausweichen
+_circuit_breaker: Final = CircuitBreaker(
+    window=product_breaker_window,
+    failure_rate=product_breaker_failure_rate,
+    min_calls=product_breaker_min_calls,
+    open_seconds=product_breaker_open_seconds,
+    half_open_probes=product_breaker_half_open_probes,
+)
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    http2: Final = product_http2 and _http2_available()
+    if product_http2 and not http2:
+        logger.warning("⚠️ HTTP/2 für den Product-Service nicht verfügbar (Paket h2 fehlt)")
+    return httpx.AsyncClient(
+        verify=product_verify_tls,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=product_max_connections,
+            max_keepalive_connections=product_max_keepalive_connections,
+            keepalive_expiry=product_keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(product_timeout, connect=product_connect_timeout),
+    )
+
+
+def get_product_http_client() -> httpx.AsyncClient:
+    """Gemeinsamen HTTP-Client liefern, ggf. anlegen (z.B. im `inventory-worker`)."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = _create_http_client()
+    return _http_client
+
+
+async def start_product_http_client() -> None:
+    """HTTP-Client beim Start der Anwendung anlegen."""
+    get_product_http_client()
+    logger.info(
+        "🔗 Product-Client gestartet (max_connections={}, keepalive={})",
+        product_max_connections,
+        product_max_keepalive_connections,
+    )
+
+
+async def close_product_http_client() -> None:
+    """Offene Verbindungen beim Shutdown schließen."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        logger.info("🛑 Product-Client geschlossen")
+
+
+def _record_pool_metrics(client: httpx.AsyncClient) -> None:
+    """Aktive und freie Verbindungen aus dem httpcore-Pool.
+
+    Der Pool ist keine öffentliche API von httpx. Ist er nicht lesbar, z.B. nach
+    einem Update, werden die laufenden Requests als aktive Verbindungen gemeldet.
+    """
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    try:
+        connections = list(getattr(pool, "connections", None))
+        idle = sum(1 for connection in connections if connection.is_idle())
+    except (AttributeError, TypeError):
+        product_pool_connections.labels("active").set(_requests_in_flight)
+        return
+    product_pool_connections.labels("idle").set(idle)
+    product_pool_connections.labels("active").set(len(connections) - idle)
+
 
-PRODUCT_GRAPHQL_URL = env.PRODUCT_GRAPHQL_URL
 class ProductGraphQLClient:
     """Client zur Kommunikation mit dem Product-Service via GraphQL."""
 
@@ -13,27 +120,79 @@ class ProductGraphQLClient:
         self.token = token
 
     async def execute(
-        self, query: str, variables: Dict[str, Any] = {}
+        self,
+        query: str,
+        variables: Dict[str, Any] = {},
+        allow_partial: bool = False,
+    ) -> Dict[str, Any]:
+        """GraphQL-Request ausführen.
+
+        :param allow_partial: Bei Fehlern einzelner Felder (z.B. Aliase) die übrigen
+            Daten liefern, statt eine Exception zu werfen
+        """
+        json_data = await self._execute(query, variables, allow_partial)
+        return json_data["data"]
+
+    async def execute_partial(
+        self,
+        query: str,
+        variables: Dict[str, Any],
+    ) -> tuple[Dict[str, Any], list[Dict[str, Any]]]:
+        """GraphQL-Request ausführen, Fehler einzelner Felder werden mitgeliefert.
+
+        :return: Daten und Fehler der Antwort, z.B. mit `path` des betroffenen Alias
+        """
+        json_data = await self._execute(query, variables, allow_partial=True)
+        return json_data["data"], json_data.get("errors") or []
+
+    async def _execute(
+        self,
+        query: str,
+        variables: Dict[str, Any],
+        allow_partial: bool,
     ) -> Dict[str, Any]:
         headers = {
             "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json",
         }
 
-        async with httpx.AsyncClient(verify=False) as client:
+        client = get_product_http_client()
+
+        async def _post() -> httpx.Response:
+            global _requests_in_flight
+            _requests_in_flight += 1
             try:
-                response = await client.post(
-                    self.graphql_url,
-                    json={"query": query, "variables": variables},
-                    headers=headers,
-                    timeout=10.0,
-                )
-                response.raise_for_status()
-                json_data = response.json()
-                if "errors" in json_data:
-                    logger.error("GraphQL-Fehler: {}", json_data["errors"])
-                    raise Exception(f"GraphQL-Fehler: {json_data['errors']}")
-                return json_data["data"]
-            except Exception as e:
-                logger.exception("Fehler bei GraphQL-Anfrage an Product-Service")
-                raise
+                # Latenzbudget je Request statt des langen Read-Timeouts
+                async with asyncio.timeout(product_latency_budget):
+                    response = await client.post(
+                        self.graphql_url,
+                        json={"query": query, "variables": variables},
+                        headers=headers,
+                    )
+            finally:
+                _requests_in_flight -= 1
+            response.raise_for_status()
+            return response
+
+        start = perf_counter()
+        outcome = "error"
+        try:
+            response = await _circuit_breaker.call(_post)
+            json_data = response.json()
+            if "errors" in json_data and allow_partial and json_data.get("data"):
+                logger.warning("GraphQL-Teilfehler: {}", json_data["errors"])
+            elif "errors" in json_data:
+                logger.error("GraphQL-Fehler: {}", json_data["errors"])
+                outcome = "graphql_error"
+                raise Exception(f"GraphQL-Fehler: {json_data['errors']}")
+            outcome = "success"
+            return json_data
+        except CircuitOpenError:
+            outcome = "rejected"
+            raise
+        except Exception as e:
+            logger.exception("Fehler bei GraphQL-Anfrage an Product-Service")
+            raise
+        finally:
+            product_request_seconds.labels(outcome).observe(perf_counter() - start)
+            _record_pool_metrics(client)
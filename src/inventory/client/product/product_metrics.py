@@ -0,0 +1,74 @@
+"""Prometheus-Metriken für Aufrufe des Product-Service."""
+
+from typing import Final
+
+from prometheus_client import Counter, Gauge, Histogram
+
+__all__ = [
+    "product_breaker_rejected",
+    "product_breaker_state",
+    "product_breaker_transitions",
+    "product_cache_lookups",
+    "product_cache_size",
+    "product_coalesced_lookups",
+    "product_pool_connections",
+    "product_read_model_events",
+    "product_read_model_size",
+    "product_request_seconds",
+]
+
+product_request_seconds: Final = Histogram(
+    "inventory_product_request_seconds",
+    "Dauer der GraphQL-Requests an den Product-Service",
+    ["outcome"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+product_pool_connections: Final = Gauge(
+    "inventory_product_pool_connections",
+    "Verbindungen im HTTP-Pool zum Product-Service",
+    ["state"],
+)
+
+product_cache_lookups: Final = Counter(
+    "inventory_product_cache_lookups",
+    "Zugriffe auf den Produkt-Cache nach Ergebnis (hit, negative_hit, stale, miss)",
+    ["result"],
+)
+
+product_cache_size: Final = Gauge(
+    "inventory_product_cache_size",
+    "Anzahl Einträge im Produkt-Cache",
+)
+
+product_coalesced_lookups: Final = Counter(
+    "inventory_product_coalesced_lookups",
+    "Produkt-Abfragen, die sich einen bereits laufenden Request geteilt haben",
+)
+
+product_breaker_state: Final = Gauge(
+    "inventory_product_breaker_state",
+    "Zustand des Circuit Breakers: 0 geschlossen, 1 halb offen, 2 offen",
+)
+
+product_breaker_transitions: Final = Counter(
+    "inventory_product_breaker_transitions",
+    "Zustandswechsel des Circuit Breakers",
+    ["from_state", "to_state"],
+)
+
+product_breaker_rejected: Final = Counter(
+    "inventory_product_breaker_rejected",
+    "Requests, die wegen offenem Circuit Breaker nicht gesendet wurden",
+)
+
+product_read_model_events: Final = Counter(
+    "inventory_product_read_model_events",
+    "Verarbeitete Product-Events nach Typ (created, updated, deleted, invalid, stale)",
+    ["type"],
+)
+
+product_read_model_size: Final = Gauge(
+    "inventory_product_read_model_size",
+    "Anzahl Produkte im lokalen Read Model",
+)
@@ -0,0 +1,307 @@
+"""Lokales Read Model der Produktnamen, gespeist aus den Events des Product-Service.
+
+- Beim Start werden die kompakte Tabelle `product` (Produkt-ID → Name) und die
+  gelesenen Offsets aus `product_offset` geladen.
+- Danach liest ein Consumer ohne Consumer Group die Product-Topics ab diesen
+  Offsets (ohne gespeicherten Offset ab dem Anfang) bis zum aktuellen Ende nach
+  (Backfill) und verarbeitet anschließend neue Events.
+- Die drei Topics werden nach dem Zeitstempel der Events zusammengeführt: je
+  Produkt zählt das jüngste Event, bei gleichem Zeitstempel gewinnt das Löschen.
+  Ältere Events, die erst später gelesen werden, werden ignoriert.
+- Änderungen werden je Batch zusammen mit den Offsets in einer Transaktion in
+  die Tabellen geschrieben und im Produkt-Cache invalidiert. Tabelle und Offsets
+  passen damit immer zusammen.
+- Fällt der Consumer oder das Schreiben in die DB aus, wird der Consumer nach
+  einer Pause neu angelegt und liest ab den zuletzt gespeicherten Offsets
+  weiter. Bis er wieder aktuell ist, ist das Read Model nicht bereit.
+
+Jeder Prozess hält damit eine eigene vollständige Kopie im Speicher, d.h.
+Produktnamen werden bei Queries ohne Aufruf des Product-Service ermittelt.
+Solange das Read Model nicht bereit ist oder eine ID nicht kennt, fragen die
+Aufrufer den Produkt-Cache bzw. den Product-Service.
+"""
+
+import asyncio
+from contextlib import suppress
+from typing import Final, Optional
+
+from aiokafka import ConsumerRecord, TopicPartition
+from loguru import logger
+
+from inventory.cache.response_cache import get_response_cache, product_tag
+from inventory.client.product.product_cache import get_product_cache
+from inventory.client.product.product_metrics import (
+    product_read_model_events,
+    product_read_model_size,
+)
+from inventory.config import env
+from inventory.config.kafka import get_kafka_settings
+from inventory.config.product import (
+    product_read_model_catchup_timeout,
+    product_read_model_enabled,
+)
+from inventory.messaging.kafka_topic_properties import KafkaTopics
+from inventory.messaging.transport import KafkaConsumerClient, KafkaTransport
+from inventory.model.dto.inventory_item_event import InvalidEventError
+from inventory.model.dto.product_event import decode_product_event
+from inventory.repository.product_repository import ProductRepository
+from inventory.repository.session import get_session
+
+__all__ = ["ProductReadModel", "get_product_read_model"]
+
+_RETRY_INTERVAL_S: Final = 5.0
+
+_TOPICS: Final[dict[str, str]] = {
+    KafkaTopics.product_created: "created",
+    KafkaTopics.product_updated: "updated",
+    KafkaTopics.product_deleted: "deleted",
+}
+"""Topic → Event-Typ."""
+
+
+class ProductReadModel:
+    """Produkt-ID → Name im Speicher, persistiert in der Tabelle `product`."""
+
+    def __init__(
+        self,
+        transport: KafkaTransport,
+        catchup_timeout: float,
+        enabled: bool = True,
+    ) -> None:
+        self._transport: Final = transport
+        self._catchup_timeout: Final = catchup_timeout
+        self._enabled: Final = enabled
+        self._names: dict[str, str] = {}
+        # Zuletzt übernommenes Event je Produkt: (Zeitstempel, gelöscht), auch nach dem Löschen
+        self._applied_at: Final[dict[str, tuple[int, bool]]] = {}
+        self._caught_up: Final = asyncio.Event()
+        # Nächster Offset je Partition: überlebt einen Neustart des Consumers
+        self._positions: Final[dict[TopicPartition, int]] = {}
+        self._consumer: Optional[KafkaConsumerClient] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        """Flag, ob der Consumer läuft und die Product-Topics bis zum Ende gelesen hat."""
+        return self._caught_up.is_set()
+
+    def name(self, product_id: str) -> Optional[str]:
+        """Name des Produkts, None falls unbekannt (Aufrufer fragen dann den Product-Service)."""
+        return self._names.get(product_id)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    async def start(self) -> None:
+        """Tabelle laden, Consumer starten und höchstens `catchup_timeout` auf den Backfill warten.
+
+        Ist Kafka nicht erreichbar, wird nicht gewartet: der Consumer wird im
+        Hintergrund gestartet und bis dahin der Product-Service gefragt.
+        """
+        if not self._enabled:
+            logger.info("📦 Product Read Model deaktiviert")
+            return
+
+        await self._load_table()
+        connected: Final = await self._connect()
+        self._task = asyncio.create_task(self._run())
+        if not connected:
+            return
+        try:
+            await asyncio.wait_for(self._caught_up.wait(), timeout=self._catchup_timeout)
+        except TimeoutError:
+            logger.warning(
+                "⏱️ Product Read Model nach {}s nicht aktuell, Backfill läuft weiter",
+                self._catchup_timeout,
+            )
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self._close_consumer()
+
+    async def _load_table(self) -> None:
+        """Produkte und Offsets laden; ohne Tabelle wird ab dem Anfang gelesen."""
+        try:
+            async with get_session() as session:
+                repo = ProductRepository(session)
+                names = await repo.find_names()
+                offsets = await repo.find_offsets()
+        except Exception as e:
+            logger.warning("⚠️ Tabelle product nicht geladen: {}", e)
+            return
+        self._names = names
+        for (topic, partition), offset in offsets.items():
+            self._positions[TopicPartition(topic, partition)] = offset
+        product_read_model_size.set(len(self._names))
+        logger.info(
+            "📦 Product Read Model: {} Produkte aus der DB, {} Partitionen mit Offset",
+            len(self._names),
+            len(offsets),
+        )
+
+    async def _connect(self) -> bool:
+        """Consumer anlegen und ab den zuletzt verarbeiteten Offsets lesen."""
+        settings: Final = get_kafka_settings()
+        consumer: Final = self._transport.create_consumer(
+            bootstrap_servers=env.KAFKA_URI,
+            client_id=f"{settings.client_id}-product-read-model",
+            # Ohne Group: jeder Prozess liest alle Partitionen, ab den Offsets aus der DB
+            group_id=None,
+            auto_offset_reset="earliest",
+            enable_auto_commit=False,
+        )
+        consumer.subscribe(list(_TOPICS))
+        try:
+            await consumer.start()
+        except Exception as e:
+            logger.warning("⚠️ Product Read Model: Kafka nicht erreichbar: {}", e)
+            with suppress(Exception):
+                await consumer.stop()
+            return False
+        for tp in consumer.assignment():
+            if tp in self._positions:
+                consumer.seek(tp, self._positions[tp])
+        self._consumer = consumer
+        return True
+
+    async def _close_consumer(self) -> None:
+        if self._consumer is not None:
+            with suppress(Exception):
+                await self._consumer.stop()
+            self._consumer = None
+
+    async def _run(self) -> None:
+        """Events lesen; fällt der Consumer aus, wird er nach einer Pause neu angelegt."""
+        while True:
+            if self._consumer is None and not await self._connect():
+                await asyncio.sleep(_RETRY_INTERVAL_S)
+                continue
+            try:
+                await self._consume()
+            except Exception:
+                logger.exception(
+                    "❌ Product Read Model: Consumer oder DB ausgefallen, Neustart in {}s",
+                    _RETRY_INTERVAL_S,
+                )
+                # Bis der neue Consumer aufgeholt hat, fragen die Aufrufer den Product-Service
+                self._caught_up.clear()
+                await self._close_consumer()
+                await asyncio.sleep(_RETRY_INTERVAL_S)
+
+    async def _consume(self) -> None:
+        end_offsets: Optional[dict[TopicPartition, int]] = None
+        while True:
+            batches = await self._consumer.getmany(timeout_ms=1000, max_records=1000)
+            records = [
+                record
+                for tp, tp_records in batches.items()
+                for record in tp_records
+                # Ohne seek (Partition erst später zugewiesen) nicht hinter den Stand zurück
+                if record.offset >= self._positions.get(tp, 0)
+            ]
+            positions = {
+                tp: tp_records[-1].offset + 1
+                for tp, tp_records in batches.items()
+                if tp_records and tp_records[-1].offset >= self._positions.get(tp, 0)
+            }
+            if records:
+                await self._apply(records, positions)
+            self._positions.update(positions)
+
+            if self._caught_up.is_set():
+                continue
+            assignment = self._consumer.assignment()
+            if not assignment:
+                continue
+            if end_offsets is None:
+                end_offsets = await self._consumer.end_offsets(assignment)
+            if await self._reached(end_offsets):
+                self._caught_up.set()
+                logger.info("📦 Product Read Model aktuell: {} Produkte", len(self._names))
+
+    async def _reached(self, end_offsets: dict[TopicPartition, int]) -> bool:
+        """Flag, ob alle Partitionen bis zu den Offsets beim Start gelesen sind."""
+        for tp, end_offset in end_offsets.items():
+            if await self._consumer.position(tp) < end_offset:
+                return False
+        return True
+
+    async def _apply(
+        self, records: list[ConsumerRecord], positions: dict[TopicPartition, int]
+    ) -> None:
+        """Events eines Batches übernehmen, je Produkt zählt das jüngste Event.
+
+        Die Offsets nach dem Batch werden in derselben Transaktion gespeichert.
+        """
+        # getmany liefert je Partition geordnet, aber nicht über die Topics hinweg
+        typed: Final = sorted(
+            (
+                (record, event_type)
+                for record in records
+                if (event_type := _TOPICS.get(record.topic)) is not None
+            ),
+            key=lambda item: (item[0].timestamp, item[1] == "deleted"),
+        )
+        changes: Final[dict[str, Optional[str]]] = {}
+        for record, event_type in typed:
+            try:
+                event = decode_product_event(record.value, deleted=event_type == "deleted")
+            except InvalidEventError as e:
+                logger.error("⚠️ Ungültiges Product-Event: {}", e)
+                product_read_model_events.labels("invalid").inc()
+                continue
+            applied_at = (record.timestamp, event_type == "deleted")
+            if applied_at < self._applied_at.get(event.product_id, applied_at):
+                logger.debug("⏭️ Veraltetes Product-Event für {} ignoriert", event.product_id)
+                product_read_model_events.labels("stale").inc()
+                continue
+            self._applied_at[event.product_id] = applied_at
+            changes[event.product_id] = event.name
+            product_read_model_events.labels(event_type).inc()
+
+        cache: Final = get_product_cache()
+        for product_id, name in changes.items():
+            if name is None:
+                self._names.pop(product_id, None)
+            else:
+                self._names[product_id] = name
+            cache.invalidate(product_id)
+        if changes:
+            get_response_cache().invalidate(*(product_tag(product_id) for product_id in changes))
+        product_read_model_size.set(len(self._names))
+
+        # Schlägt das Schreiben fehl, bleiben die Offsets stehen: der Consumer wird in
+        # _run neu angelegt und liest den Batch erneut, sonst fehlten die Änderungen
+        async with get_session() as session, session.begin():
+            repo = ProductRepository(session)
+            await repo.upsert(
+                (product_id, name) for product_id, name in changes.items() if name is not None
+            )
+            await repo.delete(
+                product_id for product_id, name in changes.items() if name is None
+            )
+            await repo.save_offsets(
+                (tp.topic, tp.partition, offset) for tp, offset in positions.items()
+            )
+
+
+_product_read_model: Optional[ProductReadModel] = None
+
+
+def get_product_read_model() -> ProductReadModel:
+    """Gemeinsames Read Model des Prozesses."""
+    global _product_read_model
+    if _product_read_model is None:
+        # ⛔ Zirkularimport vermeiden durch Lazy Import:
+        from inventory.messaging.kafka_singleton import get_kafka_transport
+
+        _product_read_model = ProductReadModel(
+            transport=get_kafka_transport(),
+            catchup_timeout=product_read_model_catchup_timeout,
+            enabled=product_read_model_enabled,
+        )
+    return _product_read_model
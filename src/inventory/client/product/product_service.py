@@ -1,10 +1,31 @@
+from collections.abc import Iterable
+from hashlib import sha256
 from inventory.client.product.product_client import ProductGraphQLClient
-from typing import Any, Dict
+from inventory.client.product.single_flight import SingleFlight
+from typing import Any, Dict, Optional
 
 REQUIRED_FIELDS = "name"
 
+# Fehlercodes, mit denen der Product-Service eine unbekannte ID meldet
+_NOT_FOUND_CODES = frozenset({"NOT_FOUND", "NOT_FOUND_ERROR"})
+
+# Gleichzeitige Abfragen desselben Produkts teilen sich einen Request
+_product_flights: SingleFlight[tuple[str, str], Dict[str, Any]] = SingleFlight()
+
 
 async def get_product_by_id(product_id: str, token: str) -> Dict[str, Any]:
+    """Produkt laden; läuft für die ID bereits ein Request, wird dessen Ergebnis geteilt.
+
+    Geteilt wird nur zwischen Aufrufern mit demselben Token, damit niemand das
+    Ergebnis (oder den Fehler) einer fremden Berechtigung erhält.
+    """
+    key = (product_id, sha256(token.encode()).hexdigest())
+    return await _product_flights.do(
+        key, lambda: _fetch_product_by_id(product_id, token)
+    )
+
+
+async def _fetch_product_by_id(product_id: str, token: str) -> Dict[str, Any]:
     query = f"""
     query ($id: ID!) {{
         product(id: $id) {{
@@ -16,3 +37,51 @@ async def get_product_by_id(product_id: str, token: str) -> Dict[str, Any]:
     client = ProductGraphQLClient(token)
     result = await client.execute(query, variables)
     return result["product"]
+
+
+async def get_products_by_ids(
+    product_ids: Iterable[str], token: str
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Mehrere Produkte mit einem GraphQL-Request laden, je ID ein Alias `p<i>`.
+
+    :return: Produkt-ID → Produkt bzw. None, falls es nicht existiert. IDs, deren
+        Alias mit einem anderen Fehler endet, fehlen im Ergebnis und werden daher
+        nicht als unbekannt gecacht.
+    """
+    ids = list(dict.fromkeys(product_ids))
+    if not ids:
+        return {}
+
+    variables_decl = ", ".join(f"$id{i}: ID!" for i in range(len(ids)))
+    fields = "\n".join(
+        f"p{i}: product(id: $id{i}) {{ {REQUIRED_FIELDS} }}" for i in range(len(ids))
+    )
+    query = f"""
+    query ({variables_decl}) {{
+        {fields}
+    }}
+    """
+    variables = {f"id{i}": product_id for i, product_id in enumerate(ids)}
+    client = ProductGraphQLClient(token)
+    # Unbekannte IDs liefern einen Fehler nur für ihren Alias
+    data, errors = await client.execute_partial(query, variables)
+    errors_by_alias: Dict[str, Dict[str, Any]] = {
+        str(error["path"][0]): error for error in errors if error.get("path")
+    }
+    products: Dict[str, Optional[Dict[str, Any]]] = {}
+    for i, product_id in enumerate(ids):
+        product = data.get(f"p{i}")
+        error = errors_by_alias.get(f"p{i}")
+        if product is None and error is not None and not _is_not_found(error):
+            continue
+        products[product_id] = product
+    return products
+
+
+def _is_not_found(error: Dict[str, Any]) -> bool:
+    """Fehler eines Alias, weil das Produkt nicht existiert (statt z.B. Timeout)."""
+    code = (error.get("extensions") or {}).get("code")
+    if code is not None:
+        return str(code).upper() in _NOT_FOUND_CODES
+    message = str(error.get("message", "")).lower()
+    return "not found" in message or "nicht gefunden" in message
@@ -0,0 +1,56 @@
+"""Gleichzeitige Aufrufe mit demselben Schlüssel teilen sich einen laufenden Request."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Final
+
+from inventory.client.product.product_metrics import product_coalesced_lookups
+
+__all__ = ["SingleFlight"]
+
+
+class SingleFlight[K: Hashable, T]:
+    """Single-Flight: Ergebnis oder Exception des ersten Aufrufs gilt für alle Wartenden."""
+
+    def __init__(self) -> None:
+        self._in_flight: Final[dict[K, asyncio.Task[T]]] = {}
+        self._waiters: Final[dict[K, int]] = {}
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[T]]) -> T:
+        """`fn` ausführen, falls für `key` noch kein Aufruf läuft, sonst mitwarten.
+
+        Der gemeinsame Task ist gegen Abbruch geschützt: bricht ein Aufrufer ab
+        (z.B. Client-Timeout), laufen die übrigen weiter. Bricht der letzte
+        Wartende ab, wird auch der Task abgebrochen.
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+        else:
+            product_coalesced_lookups.inc()
+
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._waiters[key] == 1 and not task.done():
+                # Spätere Aufrufe starten einen neuen Task
+                del self._in_flight[key]
+                task.cancel()
+            raise
+        finally:
+            self._waiters[key] -= 1
+            if not self._waiters[key]:
+                del self._waiters[key]
+
+    def _finished(self, key: K, task: asyncio.Task[T]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Exception abholen, auch wenn kein Aufrufer mehr wartet
+        if not task.cancelled():
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
@@ -6,7 +6,20 @@ from strawberry.http.ides import GraphQL_IDE
 
 from inventory.config.config import inventory_config
 
-__all__ = ["graphql_ide"]
+__all__ = [
+    "graphql_cost_budgets",
+    "graphql_default_cost_budget",
+    "graphql_default_list_size",
+    "graphql_document_cache_max_size",
+    "graphql_field_costs",
+    "graphql_ide",
+    "graphql_max_aliases",
+    "graphql_max_depth",
+    "graphql_max_root_fields",
+    "graphql_persisted_queries",
+    "graphql_response_cache_max_bytes",
+    "graphql_response_cache_ttl",
+]
 
 
 _graphql_toml: Final = inventory_config.get("graphql", {})
@@ -14,3 +27,46 @@ _graphiql_enabled: Final = bool(_graphql_toml.get("graphiql-enabled", False))
 
 graphql_ide: Final[GraphQL_IDE | None] = "graphiql" if _graphiql_enabled else None
 """String 'graphiql', falls GraphiQL aktiviert ist, sonst None."""
+
+graphql_max_depth: Final[int] = int(_graphql_toml.get("max-depth", 8))
+"""Max. Verschachtelungstiefe der Felder einer Operation (default: 8)."""
+
+graphql_max_aliases: Final[int] = int(_graphql_toml.get("max-aliases", 10))
+"""Max. Anzahl Aliase in einer Operation (default: 10)."""
+
+graphql_max_root_fields: Final[int] = int(_graphql_toml.get("max-root-fields", 5))
+"""Max. Anzahl Felder auf oberster Ebene einer Operation (default: 5)."""
+
+graphql_default_list_size: Final[int] = int(_graphql_toml.get("default-list-size", 10))
+"""Angenommene Größe von Listen ohne Paginierung für die Kostenschätzung (default: 10)."""
+
+graphql_field_costs: Final[dict[str, int]] = {
+    name: int(cost) for name, cost in _graphql_toml.get("field-costs", {}).items()
+}
+"""Kosten einzelner Felder als `Typ.feld`, überschreiben die Defaults der Kostenanalyse."""
+
+graphql_cost_budgets: Final[dict[str, int]] = {
+    role: int(budget) for role, budget in _graphql_toml.get("cost-budgets", {}).items()
+}
+"""Kostenbudget einer Operation je Rolle, bei mehreren Rollen gilt das größte."""
+
+graphql_default_cost_budget: Final[int] = int(_graphql_toml.get("default-cost-budget", 100))
+"""Kostenbudget ohne passende Rolle, z.B. ohne Token (default: 100)."""
+
+graphql_document_cache_max_size: Final[int] = int(
+    _graphql_toml.get("document-cache-max-size", 1000),
+)
+"""Max. Anzahl geparster und validierter Dokumente im Cache, 0 deaktiviert den Cache."""
+
+graphql_persisted_queries: Final[bool] = bool(_graphql_toml.get("persisted-queries", True))
+"""Automatic Persisted Queries: Anfragen nur mit `sha256Hash` statt der Query (default: True)."""
+
+graphql_response_cache_max_bytes: Final[int] = int(
+    _graphql_toml.get("response-cache-max-bytes", 16 * 1024 * 1024),
+)
+"""Max. Größe der gecachten Antworten als JSON in Bytes, 0 deaktiviert den Cache (default: 16 MiB)."""
+
+graphql_response_cache_ttl: Final[float] = float(_graphql_toml.get("response-cache-ttl", 60.0))
+"""Max. Sekunden je Antwort (default: 60). Änderungen in anderen Instanzen oder im separaten
+`inventory-worker` (z.B. Reservierungen aus Kafka-Events) invalidieren den Cache per Kafka;
+nur wenn Kafka nicht erreichbar ist, sind sie erst nach dieser Zeit sichtbar."""
@@ -1,3 +1,7 @@
+import tempfile
+from pathlib import Path
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 from inventory.config import env
@@ -7,6 +11,59 @@ class KafkaSettings(BaseSettings):
     bootstrap_servers: str = env.KAFKA_URI
     topic_log: str = "logstream.log.inventory"
     client_id: str = env.PROJECT_NAME
+    group_id: str = "inventory-group"
+
+    # 🧪 "memory": In-Process-Broker statt Kafka (Tests, Benchmarks, lokale Entwicklung)
+    transport: Literal["kafka", "memory"] = "kafka"
+    memory_partitions: int = 3
+
+    # 🚀 Producer: Batching und Kompression ("lz4"/"zstd" benötigen das Extra `compression`)
+    # Linger nur für `publish_nowait` (Log-Events, Bulk), `publish` sendet ohne Wartezeit
+    producer_linger_ms: int = 5
+    producer_max_batch_size: int = 64 * 1024
+    producer_compression: Literal["none", "gzip", "lz4", "zstd"] = "none"
+    # Keine Duplikate durch Retries des Producers
+    producer_idempotent: bool = True
+    # 🔒 Gesetzt: Consumer verarbeiten Batches in Kafka-Transaktionen (read_committed)
+    # Präfix, je Partition wird "<Präfix>-<group_id>-<Topic>-<Partition>" verwendet
+    transactional_id: str | None = None
+
+    # 💾 Nicht sendbare Nachrichten lokal puffern und nachsenden, sobald Kafka erreichbar ist
+    spill_enabled: bool = True
+    # Je Prozess ein gesperrtes Unterverzeichnis "<client_id>-<hostname>-<pid>"
+    spill_dir: Path = Path(tempfile.gettempdir()) / "inventory" / "kafka-spill"
+    spill_segment_bytes: int = 4 * 1024 * 1024
+    spill_max_bytes: int = 256 * 1024 * 1024
+    spill_retry_interval_s: float = 5.0
+    # Abstand, in dem gepufferte Nachrichten im Hintergrund auf den Datenträger geschrieben werden
+    spill_sync_interval_s: float = 1.0
+
+    # 🔌 HTTP-Server ohne Consumer starten (z.B. wenn `inventory-worker` separat läuft)
+    consumer_enabled: bool = True
+    # Anzahl Consumer je Worker-Prozess (`inventory-worker`)
+    worker_consumer_count: int = 1
+    # Max. Wartezeit, bis laufende Handler bei Rebalance/Shutdown fertig sind
+    consumer_drain_timeout_s: float = 30.0
+    # Fehlgeschlagene Records nach einer Pause erneut zustellen, nach max. Versuchen überspringen
+    consumer_retry_backoff_s: float = 1.0
+    consumer_max_retries: int = 3
+
+    # 🚦 Backpressure: Partitionen pausieren, solange Handler oder DB-Pool ausgelastet sind
+    consumer_max_records: int = 100
+    consumer_poll_timeout_ms: int = 500
+    consumer_pause_in_flight: int = 200
+    consumer_resume_in_flight: int = 50
+    consumer_pause_pool_checkedout: int = 12
+    consumer_resume_pool_checkedout: int = 6
+
+    # 📝 Log-Events von LoggerPlus: Queue mit Hintergrund-Publisher statt send_and_wait
+    log_queue_size: int = 10_000
+    log_batch_size: int = 200
+    log_linger_ms: int = 50
+    # "drop": neue Events verwerfen, "sample": jedes n-te Event verdrängt das älteste
+    log_overflow_policy: Literal["drop", "sample"] = "drop"
+    log_overflow_sample_every: int = 10
+    log_flush_timeout_s: float = 5.0
 
     class Config:
         env_prefix = "KAFKA_"
@@ -0,0 +1,38 @@
+"""Konfiguration für die Verifikation der JWTs von Keycloak."""
+
+from typing import Final
+
+from inventory.config.config import inventory_config
+from inventory.config.env import env
+
+__all__ = [
+    "jwks_min_refetch_interval",
+    "jwks_timeout",
+    "jwks_ttl",
+    "jwks_url",
+    "token_cache_max_size",
+]
+
+
+_keycloak_toml: Final = inventory_config.get("keycloak", {})
+
+jwks_url: Final[str] = _keycloak_toml.get(
+    "jwks-url",
+    f"http://{env.KC_SERVICE_HOST}:{env.KC_SERVICE_PORT}/auth/realms/"
+    f"{env.KC_SERVICE_REALM}/protocol/openid-connect/certs",
+)
+"""URL der JWKS von Keycloak (default: aus KC_SERVICE_HOST, KC_SERVICE_PORT und KC_SERVICE_REALM)."""
+
+jwks_ttl: Final[float] = float(_keycloak_toml.get("jwks-ttl", 300.0))
+"""Sekunden, nach denen die Schlüssel im Hintergrund neu geladen werden (default: 300)."""
+
+jwks_min_refetch_interval: Final[float] = float(
+    _keycloak_toml.get("jwks-min-refetch-interval", 10.0),
+)
+"""Min. Sekunden zwischen zwei Abrufen wegen einer unbekannten `kid` (default: 10)."""
+
+jwks_timeout: Final[float] = float(_keycloak_toml.get("jwks-timeout", 3.0))
+"""Timeout in Sekunden für den Abruf der JWKS (default: 3)."""
+
+token_cache_max_size: Final[int] = int(_keycloak_toml.get("token-cache-max-size", 10_000))
+"""Max. Anzahl verifizierter Tokens im Cache, 0 deaktiviert den Cache (default: 10000)."""
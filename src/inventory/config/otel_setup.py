@@ -16,7 +16,6 @@ from opentelemetry.sdk.resources import SERVICE_NAME, Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.instrumentation.asgi import OpenTelemetryMiddleware
 
 from inventory.tracing.trace_context_middleware import TraceContextMiddleware
 
@@ -36,9 +35,9 @@ def setup_otel(app):
     span_processor = BatchSpanProcessor(otlp_exporter)
     provider.add_span_processor(span_processor)
 
-    # Instrumentiere FastAPI und MongoDB
-    FastAPIInstrumentor().instrument_app(app)
-
-    # 🛠 TraceContextMiddleware aktivieren
+    # 🛠 TraceContextMiddleware aktivieren: zuerst hinzufügen, damit sie innerhalb
+    # des Spans der OpenTelemetry-Middleware läuft (zuletzt hinzugefügt = außen)
     app.add_middleware(TraceContextMiddleware)
-    app.add_middleware(OpenTelemetryMiddleware)
+
+    # Instrumentiere FastAPI genau einmal (fügt OpenTelemetryMiddleware hinzu)
+    FastAPIInstrumentor.instrument_app(app)
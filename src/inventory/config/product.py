@@ -0,0 +1,101 @@
+"""Konfiguration für den HTTP-Client zum Product-Service."""
+
+from typing import Final
+
+from inventory.config.config import inventory_config
+from inventory.config.env import env
+
+__all__ = [
+    "product_breaker_failure_rate",
+    "product_breaker_half_open_probes",
+    "product_breaker_min_calls",
+    "product_breaker_open_seconds",
+    "product_breaker_window",
+    "product_cache_max_size",
+    "product_cache_negative_ttl",
+    "product_cache_stale_ttl",
+    "product_cache_ttl",
+    "product_connect_timeout",
+    "product_graphql_url",
+    "product_http2",
+    "product_keepalive_expiry",
+    "product_latency_budget",
+    "product_max_connections",
+    "product_max_keepalive_connections",
+    "product_read_model_catchup_timeout",
+    "product_read_model_enabled",
+    "product_timeout",
+    "product_verify_tls",
+]
+
+
+_product_toml: Final = inventory_config.get("product", {})
+
+product_graphql_url: Final[str] = _product_toml.get("graphql-url", env.PRODUCT_GRAPHQL_URL)
+"""URL der GraphQL-Schnittstelle des Product-Service (default: PRODUCT_GRAPHQL_URL)."""
+
+product_max_connections: Final[int] = int(_product_toml.get("max-connections", 100))
+"""Max. Anzahl Verbindungen im Pool (default: 100)."""
+
+product_max_keepalive_connections: Final[int] = int(
+    _product_toml.get("max-keepalive-connections", 20),
+)
+"""Max. Anzahl offen gehaltener Verbindungen ohne Request (default: 20)."""
+
+product_keepalive_expiry: Final[float] = float(_product_toml.get("keepalive-expiry", 30.0))
+"""Sekunden, bis eine unbenutzte Verbindung geschlossen wird (default: 30)."""
+
+product_http2: Final[bool] = bool(_product_toml.get("http2", True))
+"""Flag, ob HTTP/2 verwendet werden soll, falls `h2` installiert ist (default: True)."""
+
+product_connect_timeout: Final[float] = float(_product_toml.get("connect-timeout", 2.0))
+"""Timeout in Sekunden für den Verbindungsaufbau (default: 2)."""
+
+product_timeout: Final[float] = float(_product_toml.get("timeout", 10.0))
+"""Timeout in Sekunden für Lesen, Schreiben und Pool (default: 10)."""
+
+product_verify_tls: Final[bool] = bool(_product_toml.get("verify-tls", False))
+"""Flag, ob das Zertifikat des Product-Service geprüft wird (default: False)."""
+
+product_cache_max_size: Final[int] = int(_product_toml.get("cache-max-size", 10_000))
+"""Max. Anzahl Produkte im Cache, danach LRU-Verdrängung (default: 10000)."""
+
+product_cache_ttl: Final[float] = float(_product_toml.get("cache-ttl", 300.0))
+"""Sekunden, die ein Produkt als aktuell gilt (default: 300)."""
+
+product_cache_negative_ttl: Final[float] = float(_product_toml.get("cache-negative-ttl", 30.0))
+"""Sekunden, die ein nicht existierendes Produkt gemerkt wird (default: 30)."""
+
+product_cache_stale_ttl: Final[float] = float(_product_toml.get("cache-stale-ttl", 3600.0))
+"""Sekunden nach Ablauf der TTL, in denen der alte Wert geliefert und im Hintergrund
+aktualisiert wird (default: 3600)."""
+
+product_latency_budget: Final[float] = float(_product_toml.get("latency-budget", 1.5))
+"""Max. Sekunden je Request an den Product-Service, danach Fallback (default: 1.5)."""
+
+product_breaker_window: Final[int] = int(_product_toml.get("breaker-window", 20))
+"""Anzahl der letzten Requests für die Fehlerquote des Circuit Breakers (default: 20)."""
+
+product_breaker_failure_rate: Final[float] = float(_product_toml.get("breaker-failure-rate", 0.5))
+"""Fehlerquote im Fenster, ab der der Circuit Breaker öffnet (default: 0.5)."""
+
+product_breaker_min_calls: Final[int] = int(_product_toml.get("breaker-min-calls", 10))
+"""Min. Anzahl Requests im Fenster, bevor die Fehlerquote ausgewertet wird (default: 10)."""
+
+product_breaker_open_seconds: Final[float] = float(_product_toml.get("breaker-open-seconds", 30.0))
+"""Sekunden im Zustand offen, bevor Probe-Requests erlaubt werden (default: 30)."""
+
+product_breaker_half_open_probes: Final[int] = int(
+    _product_toml.get("breaker-half-open-probes", 3),
+)
+"""Anzahl erfolgreicher Probe-Requests, um den Circuit Breaker zu schließen (default: 3)."""
+
+product_read_model_enabled: Final[bool] = bool(_product_toml.get("read-model", True))
+"""Flag, ob Produktnamen aus dem lokalen Read Model statt vom Product-Service kommen
+(default: True)."""
+
+product_read_model_catchup_timeout: Final[float] = float(
+    _product_toml.get("read-model-catchup-timeout", 30.0),
+)
+"""Max. Sekunden beim Start, um die Product-Topics bis zum Ende nachzulesen (default: 30).
+Ist Kafka beim Start nicht erreichbar, wird nicht gewartet."""
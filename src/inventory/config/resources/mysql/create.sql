@@ -31,3 +31,18 @@ CREATE TABLE IF NOT EXISTS reserved_item (
 
 -- Optionally, create an index on the inventory_id column in reserved_products for better performance
 CREATE INDEX idx_inventory_id ON reserved_item (inventory_id);
+
+-- Lokales Read Model: Produktnamen aus den Events des Product-Service (kompakt, je Produkt eine Zeile)
+CREATE TABLE IF NOT EXISTS product (
+    product_id CHAR(36) PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    updated    DATETIME NOT NULL DEFAULT (CURRENT_TIMESTAMP)
+);
+
+-- Gelesene Offsets des Read Models je Partition, in derselben Transaktion wie product geschrieben
+CREATE TABLE IF NOT EXISTS product_offset (
+    topic VARCHAR(255) NOT NULL,
+    partition_id INT NOT NULL,
+    next_offset BIGINT NOT NULL,
+    PRIMARY KEY (topic, partition_id)
+);
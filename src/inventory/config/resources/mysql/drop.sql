@@ -4,3 +4,9 @@ DROP TABLE IF EXISTS reserved_item;
 
 -- Drop the inventory table
 DROP TABLE IF EXISTS inventory;
+
+-- Drop the product read model table
+DROP TABLE IF EXISTS product;
+
+-- Drop the offsets of the product read model
+DROP TABLE IF EXISTS product_offset;
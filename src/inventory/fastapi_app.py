@@ -11,20 +11,27 @@ from fastapi import FastAPI, HTTPException, Request, Response, status
 from fastapi.responses import FileResponse, ORJSONResponse
 from loguru import logger
 
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from prometheus_fastapi_instrumentator import Instrumentator
 
+from inventory.cache.cache_invalidation import get_response_cache_invalidation_listener
+from inventory.client.product.product_client import (
+    close_product_http_client,
+    start_product_http_client,
+)
+from inventory.client.product.product_read_model import get_product_read_model
 from inventory.config import dev
 from inventory.config.dev.db_populate_router import router as db_populate_router
 from inventory.config.dev.db_populate import db_populate
+from inventory.config.kafka import get_kafka_settings
 from inventory.config.otel_setup import setup_otel
 from inventory.dependency_provider import provide_inventory_write_service
 from inventory.error.exceptions import EmailExistsError, NotAllowedError, NotFoundError, UsernameExistsError, VersionOutdatedError
 from inventory.graphql.schema import graphql_router
 from inventory.messaging.kafka_singleton import get_kafka_consumer, get_kafka_producer
 from inventory.repository.session import dispose_connection_pool, get_session
-from inventory.router import shutdown_router
-from inventory.security.keycloak_service import KeycloakService
+from inventory.router import cache_router, shutdown_router
+from inventory.security.jwks_cache import get_jwks_cache
+from inventory.tracing.log_event_pipeline import get_log_event_pipeline
 
 from inventory.health.router import router as health_router
 
@@ -54,18 +61,41 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:  # noqa: RUF029
     # Setup: Kafka, DB, Banner
     async with get_session() as session:
         kafka_producer = get_kafka_producer()
-        kafka_consumer = await get_kafka_consumer()
+        log_event_pipeline = get_log_event_pipeline()
+        # Consumer ggf. nur im separaten Prozess `inventory-worker`
+        kafka_consumer = (
+            await get_kafka_consumer(name="http")
+            if get_kafka_settings().consumer_enabled
+            else None
+        )
 
         await kafka_producer.start()
-        await kafka_consumer.start()
+        await log_event_pipeline.start()
+        if kafka_consumer is not None:
+            await kafka_consumer.start()
+        else:
+            logger.info("📡 Kafka Consumer im HTTP-Server deaktiviert")
+        await start_product_http_client()
+        await get_jwks_cache().start()
         await db_populate()
+        # Nach db_populate, da die Tabelle product ggf. neu angelegt wird
+        await get_product_read_model().start()
+        # Invalidierungen aus dem inventory-worker und anderen Instanzen
+        await get_response_cache_invalidation_listener().start()
         banner(app.routes)
 
         yield
 
         # Shutdown
-        await kafka_consumer.stop()
+        if kafka_consumer is not None:
+            await kafka_consumer.stop()
+        await get_product_read_model().stop()
+        await get_response_cache_invalidation_listener().stop()
+        # Restliche Log-Events senden, solange der Producer noch läuft
+        await log_event_pipeline.stop()
         await kafka_producer.stop()
+        await close_product_http_client()
+        await get_jwks_cache().stop()
         await asyncio.sleep(0.5)  # Eventuell noch nötig
 
         # ✨ Pool sauber schließen
@@ -81,9 +111,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:  # noqa: RUF029
 app: Final = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Setup Observability
-setup_otel(app)  # Tracing mit Tempo
-# Tracing aktivieren
-FastAPIInstrumentor.instrument_app(app)
+setup_otel(app)  # Tracing mit Tempo, instrumentiert FastAPI
 
 # Prometheus Metriken
 Instrumentator().instrument(app).expose(app)
@@ -93,6 +121,7 @@ Instrumentator().instrument(app).expose(app)
 # --------------------------------------------------------------------------------------
 app.include_router(health_router)
 app.include_router(shutdown_router, prefix="/admin")
+app.include_router(cache_router, prefix="/admin")
 if dev:
     app.include_router(db_populate_router, prefix="/dev")
 
@@ -121,28 +150,6 @@ def favicon() -> FileResponse:
     )
 
 
-@app.middleware("http")
-async def inject_keycloak(request: Request, call_next):
-    # Sonderfall: Introspection oder kein Token
-    try:
-        body = await request.body()
-        if b"__schema" in body or b"__introspection" in body:
-            request.state.keycloak = None
-            return await call_next(request)
-    except Exception:
-        request.state.keycloak = None
-        return await call_next(request)
-
-    # Normale Authentifizierung
-    try:
-        request.state.keycloak = await KeycloakService.create(request)
-    except HTTPException as e:
-        logger.warning("Keycloak Token-Fehler: {}", e.detail)
-        request.state.keycloak = None  # sicherstellen, dass Attribut gesetzt ist
-
-    return await call_next(request)
-
-
 # --------------------------------------------------------------------------------------
 # E x c e p t i o n   H a n d l e r
 # --------------------------------------------------------------------------------------
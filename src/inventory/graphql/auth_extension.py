@@ -0,0 +1,60 @@
+"""Authentifizierung in der GraphQL-Ausführung statt in einer HTTP-Middleware.
+
+Der Request-Body wird nur einmal von Strawberry gelesen und geparst. Ob es sich
+um eine Introspection handelt, wird am bereits geparsten Dokument erkannt, das
+Token kommt aus dem Header `Authorization`.
+"""
+
+from collections.abc import AsyncIterator
+from typing import Final
+
+from fastapi import HTTPException
+from graphql import DocumentNode, FieldNode, OperationDefinitionNode, get_operation_ast
+from loguru import logger
+from strawberry.extensions import SchemaExtension
+
+from inventory.security.keycloak_service import KeycloakService
+
+__all__ = ["KeycloakExtension", "is_anonymous_operation"]
+
+_ANONYMOUS_FIELDS: Final = frozenset({"__schema", "__type", "__typename", "_service"})
+"""Felder ohne Token: Introspection und das SDL für die Komposition im Gateway."""
+
+
+def is_anonymous_operation(document: DocumentNode, operation_name: str | None) -> bool:
+    """Flag, ob die Operation nur Introspection-Felder bzw. `_service` abfragt.
+
+    :param document: Bereits geparstes GraphQL-Dokument
+    :param operation_name: Name der auszuführenden Operation, falls mehrere vorhanden
+    :return: True, falls kein Token benötigt wird
+    """
+    operation: Final[OperationDefinitionNode | None] = get_operation_ast(
+        document, operation_name
+    )
+    if operation is None:
+        return False
+    return all(
+        isinstance(selection, FieldNode) and selection.name.value in _ANONYMOUS_FIELDS
+        for selection in operation.selection_set.selections
+    )
+
+
+class KeycloakExtension(SchemaExtension):
+    """Setzt `principal` im Kontext, nachdem das Dokument geparst und validiert wurde."""
+
+    async def on_execute(self) -> AsyncIterator[None]:  # type: ignore[override]
+        context: Final = self.execution_context.context
+        document: Final = self.execution_context.graphql_document
+        if document is not None and is_anonymous_operation(
+            document, self.execution_context.operation_name
+        ):
+            logger.debug("🔍 Introspection erkannt – Authentifizierung übersprungen.")
+            context["principal"] = None
+        else:
+            try:
+                keycloak = await KeycloakService.create(context["request"])
+                context["principal"] = keycloak.principal if keycloak.token else None
+            except HTTPException as e:
+                logger.warning("Keycloak Token-Fehler: {}", e.detail)
+                context["principal"] = None
+        yield
@@ -0,0 +1,288 @@
+"""Statische Kostenanalyse: zu tiefe, zu breite oder zu teure Operationen werden abgewiesen.
+
+Die Analyse läuft auf dem bereits validierten Dokument und nach `KeycloakExtension`,
+d.h. das Budget richtet sich nach den Rollen des `Principal`. Die Resolver einer
+abgewiesenen Operation werden nicht aufgerufen.
+
+Kosten eines Feldes = eigene Kosten + Multiplikator * Kosten der Unterfelder:
+
+- eigene Kosten: `Typ.feld` aus `_DEFAULT_FIELD_COSTS` bzw. `[inventory.graphql.field-costs]`,
+  sonst 1 für Objekte und 0 für Skalare
+- Multiplikator: `pagination.limit` wie in `Pageable.create`, die Anzahl der
+  `representations` bei `_entities`, `default-list-size` bei sonstigen Listen, sonst 1
+
+`InventorySlice.content` zählt nicht doppelt, weil `pagination` bereits beim
+Elternfeld berücksichtigt ist.
+"""
+
+from collections.abc import AsyncIterator, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any, Final
+
+from graphql import (
+    DocumentNode,
+    ExecutionResult,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLField,
+    GraphQLInterfaceType,
+    GraphQLNamedType,
+    GraphQLObjectType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    SelectionSetNode,
+    get_named_type,
+    get_nullable_type,
+    get_operation_ast,
+    is_leaf_type,
+    is_list_type,
+    value_from_ast_untyped,
+)
+from loguru import logger
+from strawberry.extensions import SchemaExtension
+
+from inventory.config.graphql import (
+    graphql_cost_budgets,
+    graphql_default_cost_budget,
+    graphql_default_list_size,
+    graphql_field_costs,
+    graphql_max_aliases,
+    graphql_max_depth,
+    graphql_max_root_fields,
+)
+from inventory.graphql.graphql_metrics import (
+    graphql_query_cost,
+    graphql_rejected_cost,
+    graphql_rejections,
+)
+from inventory.repository.pageable import Pageable
+from inventory.security.principal import Principal
+
+__all__ = ["QueryComplexity", "QueryCostExtension", "analyze_operation", "cost_budget"]
+
+_DEFAULT_FIELD_COSTS: Final[Mapping[str, int]] = {
+    # DB-Abfrage inkl. COUNT für die Gesamtanzahl
+    "Query.inventorys": 5,
+    "Query.getReserveItems": 5,
+    "Query.getReserveItemsByCustomer": 5,
+    # ggf. Aufruf des Product-Service
+    "InventoryType.productName": 1,
+    # nur eine Referenz, die das Gateway auflöst
+    "InventoryType.product": 0,
+}
+
+_PAGINATED_LISTS: Final = frozenset({"InventorySlice.content"})
+"""Listen, deren Größe bereits über `pagination` des Elternfeldes gezählt wird."""
+
+
+@dataclass(eq=False, slots=True, kw_only=True)
+class QueryComplexity:
+    """Ergebnis der statischen Analyse einer Operation."""
+
+    cost: int
+    depth: int
+    aliases: int
+    root_fields: int
+
+
+class _ComplexityAnalyzer:
+    """Berechnet `QueryComplexity` durch rekursiven Abstieg über die Selektionen."""
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        fragments: Mapping[str, FragmentDefinitionNode],
+        variables: Mapping[str, Any],
+    ) -> None:
+        self._schema: Final = schema
+        self._fragments: Final = fragments
+        self._variables: Final = variables
+        self._field_costs: Final = {**_DEFAULT_FIELD_COSTS, **graphql_field_costs}
+        self.depth = 0
+        self.aliases = 0
+
+    def selection_cost(
+        self,
+        selection_set: SelectionSetNode,
+        parent_type: GraphQLNamedType | None,
+        depth: int,
+    ) -> int:
+        cost = 0
+        for node, type_ in self.fields(selection_set, parent_type):
+            name = node.name.value
+            if name.startswith("__"):
+                continue
+            if node.alias is not None:
+                self.aliases += 1
+            self.depth = max(self.depth, depth)
+
+            if not isinstance(type_, (GraphQLObjectType, GraphQLInterfaceType)):
+                continue
+            field = type_.fields.get(name)
+            if field is None:
+                continue
+            named_type = get_named_type(field.type)
+            own_cost = self._field_costs.get(
+                f"{type_.name}.{name}", 0 if is_leaf_type(named_type) else 1
+            )
+            children_cost = (
+                self.selection_cost(node.selection_set, named_type, depth + 1)
+                if node.selection_set is not None
+                else 0
+            )
+            multiplier = (
+                1 if f"{type_.name}.{name}" in _PAGINATED_LISTS else self._multiplier(node, field)
+            )
+            cost += own_cost + multiplier * children_cost
+        return cost
+
+    def fields(
+        self,
+        selection_set: SelectionSetNode,
+        parent_type: GraphQLNamedType | None,
+    ) -> Iterator[tuple[FieldNode, GraphQLNamedType | None]]:
+        """Felder einer Selektion inkl. Fragmenten mit dem jeweiligen Elterntyp."""
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                yield selection, parent_type
+            elif isinstance(selection, InlineFragmentNode):
+                type_ = (
+                    parent_type
+                    if selection.type_condition is None
+                    else self._schema.get_type(selection.type_condition.name.value)
+                )
+                yield from self.fields(selection.selection_set, type_)
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment = self._fragments.get(selection.name.value)
+                if fragment is not None:
+                    yield from self.fields(
+                        fragment.selection_set,
+                        self._schema.get_type(fragment.type_condition.name.value),
+                    )
+
+    def _multiplier(self, node: FieldNode, field: GraphQLField) -> int:
+        arguments: Final = {
+            argument.name.value: value_from_ast_untyped(argument.value, self._variables)
+            for argument in node.arguments
+        }
+        if "pagination" in field.args:
+            pagination = arguments.get("pagination") or {}
+            limit = pagination.get("limit")
+            return Pageable.create(limit=limit if isinstance(limit, int) else None).limit
+        representations: Final = arguments.get("representations")
+        if isinstance(representations, list):
+            return max(len(representations), 1)
+        if is_list_type(get_nullable_type(field.type)):
+            return graphql_default_list_size
+        return 1
+
+
+def analyze_operation(
+    schema: GraphQLSchema,
+    document: DocumentNode,
+    operation_name: str | None,
+    variables: Mapping[str, Any] | None = None,
+) -> QueryComplexity | None:
+    """Kosten, Tiefe, Aliase und Felder auf oberster Ebene einer Operation ermitteln.
+
+    :param schema: Schema von graphql-core
+    :param document: Bereits geparstes und validiertes Dokument
+    :param operation_name: Name der auszuführenden Operation, falls mehrere vorhanden
+    :param variables: Werte der Variablen
+    :return: Die Analyse oder None, falls die Operation nicht gefunden wurde
+    """
+    operation: Final = get_operation_ast(document, operation_name)
+    if operation is None:
+        return None
+    root_type: Final = schema.get_root_type(operation.operation)
+    fragments: Final = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+    analyzer: Final = _ComplexityAnalyzer(schema, fragments, variables or {})
+    root_fields: Final = sum(
+        1
+        for node, _ in analyzer.fields(operation.selection_set, root_type)
+        if not node.name.value.startswith("__")
+    )
+    cost: Final = analyzer.selection_cost(operation.selection_set, root_type, 1)
+    return QueryComplexity(
+        cost=cost,
+        depth=analyzer.depth,
+        aliases=analyzer.aliases,
+        root_fields=root_fields,
+    )
+
+
+def cost_budget(principal: Principal | None) -> int:
+    """Kostenbudget einer Operation: das größte Budget der Rollen des Benutzers."""
+    if principal is None:
+        return graphql_default_cost_budget
+    return max(
+        (graphql_cost_budgets[role] for role in principal.roles if role in graphql_cost_budgets),
+        default=graphql_default_cost_budget,
+    )
+
+
+def _rejection(complexity: QueryComplexity, budget: int) -> tuple[str, str] | None:
+    if complexity.depth > graphql_max_depth:
+        return "depth", f"Verschachtelungstiefe {complexity.depth} > {graphql_max_depth}"
+    if complexity.aliases > graphql_max_aliases:
+        return "aliases", f"Anzahl Aliase {complexity.aliases} > {graphql_max_aliases}"
+    if complexity.root_fields > graphql_max_root_fields:
+        return (
+            "root_fields",
+            f"Anzahl Felder auf oberster Ebene {complexity.root_fields} > {graphql_max_root_fields}",
+        )
+    if complexity.cost > budget:
+        return "cost", f"Kosten {complexity.cost} > Budget {budget}"
+    return None
+
+
+class QueryCostExtension(SchemaExtension):
+    """Weist Operationen ab, die Tiefe, Aliase, Felder oder das Budget der Rollen überschreiten."""
+
+    async def on_execute(self) -> AsyncIterator[None]:  # type: ignore[override]
+        execution_context: Final = self.execution_context
+        document: Final = execution_context.graphql_document
+        if document is not None:
+            complexity = analyze_operation(
+                execution_context.schema._schema,  # noqa: SLF001
+                document,
+                execution_context.operation_name,
+                execution_context.variables,
+            )
+            if complexity is not None:
+                self._check(complexity)
+        yield
+
+    def _check(self, complexity: QueryComplexity) -> None:
+        budget: Final = cost_budget(self.execution_context.context.get("principal"))
+        rejection: Final = _rejection(complexity, budget)
+        if rejection is None:
+            graphql_query_cost.observe(complexity.cost)
+            return
+
+        reason, detail = rejection
+        logger.warning("🚫 Operation abgewiesen: {}", detail)
+        graphql_rejections.labels(reason).inc()
+        if reason == "cost":
+            graphql_rejected_cost.observe(complexity.cost)
+        # Ein gesetztes Ergebnis überspringt die Ausführung der Resolver
+        self.execution_context.result = ExecutionResult(
+            data=None,
+            errors=[
+                GraphQLError(
+                    f"Operation zu komplex: {detail}",
+                    extensions={
+                        "code": "QUERY_TOO_COMPLEX",
+                        "reason": reason,
+                        "cost": complexity.cost,
+                        "budget": budget,
+                    },
+                ),
+            ],
+        )
@@ -0,0 +1,78 @@
+"""DataLoader je GraphQL-Request: gleichartige Zugriffe werden zu einer DB-Abfrage gebündelt."""
+
+from dataclasses import dataclass
+from typing import Final, Optional
+
+from strawberry.dataloader import DataLoader
+
+from inventory.client.product.product_read_model import get_product_read_model
+from inventory.dependency_provider import (
+    provide_inventory_read_service,
+    provide_reserved_item_read_service,
+)
+from inventory.model.entity.inventory import (
+    Inventory,
+    InventoryType,
+    map_inventory_to_inventory_type,
+)
+from inventory.model.entity.reserved_item import ReserveInventoryItemType
+from inventory.repository.session import get_session
+
+__all__ = ["Loaders", "create_loaders"]
+
+
+@dataclass(eq=False, slots=True, kw_only=True)
+class Loaders:
+    """DataLoader eines Requests, im Kontext unter dem Schlüssel `loaders`."""
+
+    inventory_by_id: DataLoader[str, Optional[InventoryType]]
+    """Inventar anhand der ID, z.B. für `_entities` mit `@key(fields: "id")`."""
+
+    inventory_by_sku_code: DataLoader[str, Optional[InventoryType]]
+    """Inventar anhand des SKU-Codes, z.B. für `_entities` mit `@key(fields: "skuCode")`."""
+
+    reserved_items_by_inventory_id: DataLoader[str, list[ReserveInventoryItemType]]
+    """Reservierungen eines Inventars, z.B. für `InventoryType.reservedItems`."""
+
+
+def _to_type(inventory: Optional[Inventory]) -> Optional[InventoryType]:
+    if inventory is None:
+        return None
+    # Produktname nur lokal, ansonsten löst das Gateway `product { name }` auf
+    read_model: Final = get_product_read_model()
+    return map_inventory_to_inventory_type(
+        inventory,
+        read_model.name(inventory.product_id) if read_model.ready else None,
+    )
+
+
+async def _load_by_ids(inventory_ids: list[str]) -> list[Optional[InventoryType]]:
+    async with get_session() as session:
+        async with provide_inventory_read_service(session=session) as read_service:
+            found: Final = await read_service.find_by_ids(inventory_ids)
+    return [_to_type(found.get(inventory_id)) for inventory_id in inventory_ids]
+
+
+async def _load_by_sku_codes(sku_codes: list[str]) -> list[Optional[InventoryType]]:
+    async with get_session() as session:
+        async with provide_inventory_read_service(session=session) as read_service:
+            found: Final = await read_service.find_by_sku_codes(sku_codes)
+    return [_to_type(found.get(sku_code)) for sku_code in sku_codes]
+
+
+async def _load_reserved_items(
+    inventory_ids: list[str],
+) -> list[list[ReserveInventoryItemType]]:
+    async with get_session() as session:
+        async with provide_reserved_item_read_service(session=session) as read_service:
+            found: Final = await read_service.find_by_inventory_ids(inventory_ids)
+    return [found.get(inventory_id, []) for inventory_id in inventory_ids]
+
+
+def create_loaders() -> Loaders:
+    """Neue DataLoader für einen Request, d.h. ohne Cache über Requests hinweg."""
+    return Loaders(
+        inventory_by_id=DataLoader(load_fn=_load_by_ids),
+        inventory_by_sku_code=DataLoader(load_fn=_load_by_sku_codes),
+        reserved_items_by_inventory_id=DataLoader(load_fn=_load_reserved_items),
+    )
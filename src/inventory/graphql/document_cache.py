@@ -0,0 +1,137 @@
+"""Cache geparster und validierter GraphQL-Dokumente.
+
+Schlüssel ist der SHA-256-Hash der Query als Hex-String, d.h. derselbe Wert wie
+`sha256Hash` bei Automatic Persisted Queries. Ein Dokument wird erst nach
+erfolgreicher Validierung gespeichert, bei einem Treffer entfallen Parsen und
+Validieren. Bei mehr als `max_size` Einträgen wird LRU verdrängt.
+"""
+
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from hashlib import sha256
+from typing import Final, Optional
+
+from graphql import DocumentNode
+from strawberry.extensions import SchemaExtension
+
+from inventory.config.graphql import graphql_document_cache_max_size
+from inventory.graphql.graphql_metrics import (
+    graphql_document_cache_lookups,
+    graphql_document_cache_size,
+    graphql_persisted_query_lookups,
+)
+
+__all__ = [
+    "CachedDocument",
+    "DocumentCache",
+    "DocumentCacheExtension",
+    "get_document_cache",
+    "query_hash",
+]
+
+
+def query_hash(query: str) -> str:
+    """SHA-256-Hash einer Query als Hex-String wie bei Automatic Persisted Queries."""
+    return sha256(query.encode()).hexdigest()
+
+
+@dataclass(eq=False, slots=True, kw_only=True)
+class CachedDocument:
+    """Query mit dem bereits validierten Dokument."""
+
+    query: str
+    document: DocumentNode
+
+
+class DocumentCache:
+    """Beschränkter Cache: Hash der Query → (Query, validiertes Dokument)."""
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size: Final = max_size
+        self._entries: Final[OrderedDict[str, CachedDocument]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """Flag, ob Dokumente gespeichert werden."""
+        return self._max_size > 0
+
+    def get(self, key: str) -> Optional[CachedDocument]:
+        """Validiertes Dokument zum Hash, None falls unbekannt."""
+        entry: Final = self._entries.get(key)
+        if entry is None:
+            graphql_document_cache_lookups.labels("miss").inc()
+            return None
+        self._entries.move_to_end(key)
+        graphql_document_cache_lookups.labels("hit").inc()
+        return entry
+
+    def query(self, key: str) -> Optional[str]:
+        """Query zu einem `sha256Hash` einer Persisted Query, None falls unbekannt."""
+        entry: Final = self._entries.get(key)
+        if entry is None:
+            graphql_persisted_query_lookups.labels("miss").inc()
+            return None
+        self._entries.move_to_end(key)
+        graphql_persisted_query_lookups.labels("hit").inc()
+        return entry.query
+
+    def put(self, key: str, query: str, document: DocumentNode) -> None:
+        """Soeben validiertes Dokument speichern."""
+        if not self.enabled:
+            return
+        self._entries[key] = CachedDocument(query=query, document=document)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+        graphql_document_cache_size.set(len(self._entries))
+
+
+_document_cache: Optional[DocumentCache] = None
+
+
+def get_document_cache() -> DocumentCache:
+    """Gemeinsamer Dokument-Cache des Prozesses."""
+    global _document_cache
+    if _document_cache is None:
+        _document_cache = DocumentCache(max_size=graphql_document_cache_max_size)
+    return _document_cache
+
+
+class DocumentCacheExtension(SchemaExtension):
+    """Überspringt Parsen und Validieren für bereits validierte Dokumente aus dem Cache."""
+
+    _key: Optional[str] = None
+    _cached: bool = False
+
+    def on_parse(self) -> Iterator[None]:
+        execution_context: Final = self.execution_context
+        cache: Final = get_document_cache()
+        query: Final = execution_context.query
+        if cache.enabled and query and execution_context.graphql_document is None:
+            self._key = query_hash(query)
+            entry = cache.get(self._key)
+            if entry is not None:
+                # Strawberry parst nur, falls noch kein Dokument vorhanden ist
+                execution_context.graphql_document = entry.document
+                self._cached = True
+        yield
+
+    def on_validate(self) -> Iterator[None]:
+        execution_context: Final = self.execution_context
+        if self._cached:
+            # Strawberry validiert nur, falls noch keine Fehler gesetzt sind
+            execution_context.errors = []
+        yield
+        if (
+            not self._cached
+            and self._key is not None
+            and execution_context.query
+            and execution_context.graphql_document is not None
+            and not execution_context.errors
+        ):
+            get_document_cache().put(
+                self._key,
+                execution_context.query,
+                execution_context.graphql_document,
+            )
@@ -0,0 +1,49 @@
+"""Prometheus-Metriken für die Ausführung von GraphQL-Operationen."""
+
+from typing import Final
+
+from prometheus_client import Counter, Gauge, Histogram
+
+__all__ = [
+    "graphql_document_cache_lookups",
+    "graphql_document_cache_size",
+    "graphql_persisted_query_lookups",
+    "graphql_query_cost",
+    "graphql_rejected_cost",
+    "graphql_rejections",
+]
+
+graphql_query_cost: Final = Histogram(
+    "inventory_graphql_query_cost",
+    "Geschätzte Kosten ausgeführter GraphQL-Operationen",
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000),
+)
+
+graphql_rejections: Final = Counter(
+    "inventory_graphql_rejections",
+    "Vor der Ausführung abgewiesene Operationen nach Grund (depth, aliases, root_fields, cost)",
+    ["reason"],
+)
+
+graphql_rejected_cost: Final = Histogram(
+    "inventory_graphql_rejected_cost",
+    "Geschätzte Kosten der wegen Überschreitung des Budgets abgewiesenen Operationen",
+    buckets=(100, 250, 500, 1000, 2500, 5000, 10000, 50000, 100000),
+)
+
+graphql_document_cache_lookups: Final = Counter(
+    "inventory_graphql_document_cache_lookups",
+    "Zugriffe auf den Cache geparster und validierter Dokumente nach Ergebnis (hit, miss)",
+    ["result"],
+)
+
+graphql_document_cache_size: Final = Gauge(
+    "inventory_graphql_document_cache_size",
+    "Anzahl geparster und validierter Dokumente im Cache",
+)
+
+graphql_persisted_query_lookups: Final = Counter(
+    "inventory_graphql_persisted_query_lookups",
+    "Anfragen nur mit `sha256Hash` nach Ergebnis (hit, miss)",
+    ["result"],
+)
@@ -0,0 +1,44 @@
+"""Permission-Klassen für Strawberry, geprüft gegen den `Principal` im Kontext.
+
+```python
+@strawberry.field(permission_classes=[IsAdminOrUser])
+async def inventory(self, info: Info, inventory_id: strawberry.ID) -> InventoryType | None: ...
+```
+"""
+
+from typing import Any, ClassVar, Final
+
+from strawberry.permission import BasePermission
+from strawberry.types import Info
+
+from inventory.error.authentication_error import AuthenticationError
+from inventory.security.principal import Principal
+
+__all__ = ["IsAdmin", "IsAdminOrUser", "IsAdminUserOrSupreme", "RolePermission"]
+
+
+class RolePermission(BasePermission):
+    """Zugriff, falls der angemeldete Benutzer mindestens eine der Rollen `roles` hat."""
+
+    roles: ClassVar[frozenset[str]] = frozenset()
+
+    def has_permission(self, source: Any, info: Info, **kwargs: Any) -> bool:
+        principal: Final[Principal | None] = info.context.get("principal")
+        if principal is None:
+            raise AuthenticationError()
+        return principal.has_any_role(self.roles)
+
+
+class IsAdmin(RolePermission):
+    roles = frozenset({"Admin"})
+    message = "Zugriff verweigert – Rolle Admin erforderlich"
+
+
+class IsAdminOrUser(RolePermission):
+    roles = frozenset({"Admin", "User"})
+    message = "Zugriff verweigert – Rollen Admin oder User erforderlich"
+
+
+class IsAdminUserOrSupreme(RolePermission):
+    roles = frozenset({"Admin", "User", "Supreme"})
+    message = "Zugriff verweigert – Rollen Admin, User oder Supreme erforderlich"
@@ -0,0 +1,83 @@
+"""GraphQLRouter mit Automatic Persisted Queries (APQ).
+
+Ein Client sendet zunächst nur `extensions.persistedQuery.sha256Hash`. Ist die
+Query im Dokument-Cache unbekannt, antwortet der Server mit dem Fehler
+`PersistedQueryNotFound` und der Client sendet Query und Hash erneut. Nach
+erfolgreicher Validierung ist die Query dann unter ihrem Hash gespeichert.
+"""
+
+from typing import Any, Final, Optional
+
+from fastapi import Request
+from graphql import GraphQLError
+from loguru import logger
+from strawberry.fastapi import GraphQLRouter
+from strawberry.http import GraphQLRequestData
+from strawberry.http.async_base_view import AsyncHTTPRequestAdapter
+from strawberry.types import ExecutionResult, SubscriptionExecutionResult
+
+from inventory.config.graphql import graphql_persisted_queries
+from inventory.graphql.document_cache import get_document_cache
+
+__all__ = ["PersistedQueryGraphQLRouter"]
+
+
+class PersistedQueryNotFoundError(Exception):
+    """Der `sha256Hash` einer Persisted Query ist im Cache unbekannt."""
+
+
+class PersistedQueryGraphQLRouter(GraphQLRouter):
+    """GraphQLRouter, der Anfragen ohne Query per `sha256Hash` im Dokument-Cache nachschlägt."""
+
+    async def parse_http_body(self, request: AsyncHTTPRequestAdapter) -> GraphQLRequestData:
+        request_data: Final = await super().parse_http_body(request)
+        if request_data.query is not None or not graphql_persisted_queries:
+            return request_data
+
+        # Nur Anfragen ohne Query werden ein 2. Mal gelesen, d.h. nur kleine Bodys
+        sha256_hash: Final = _sha256_hash(await self._request_extensions(request))
+        if sha256_hash is None:
+            return request_data
+        query: Final = get_document_cache().query(sha256_hash)
+        if query is None:
+            logger.debug("PersistedQuery: unbekannter sha256Hash={}", sha256_hash)
+            raise PersistedQueryNotFoundError
+        request_data.query = query
+        return request_data
+
+    async def execute_operation(
+        self,
+        request: Request,
+        context: Any,
+        root_value: Any,
+    ) -> ExecutionResult | SubscriptionExecutionResult:
+        try:
+            return await super().execute_operation(request, context, root_value)
+        except PersistedQueryNotFoundError:
+            # Antwort mit Status 200, damit der Client Query und Hash erneut sendet
+            return ExecutionResult(
+                data=None,
+                errors=[
+                    GraphQLError(
+                        "PersistedQueryNotFound",
+                        extensions={"code": "PERSISTED_QUERY_NOT_FOUND"},
+                    ),
+                ],
+            )
+
+    async def _request_extensions(self, request: AsyncHTTPRequestAdapter) -> Any:
+        if request.method == "GET":
+            extensions = request.query_params.get("extensions")
+            return self.parse_json(extensions) if extensions else None
+        body: Final = self.parse_json(await request.get_body())
+        return body.get("extensions") if isinstance(body, dict) else None
+
+
+def _sha256_hash(extensions: Any) -> Optional[str]:
+    if not isinstance(extensions, dict):
+        return None
+    persisted_query: Final = extensions.get("persistedQuery")
+    if not isinstance(persisted_query, dict):
+        return None
+    sha256_hash: Final = persisted_query.get("sha256Hash")
+    return sha256_hash if isinstance(sha256_hash, str) else None
@@ -2,35 +2,39 @@ from typing import Final
 from loguru import logger
 import strawberry
 from inventory.dependency_provider import provide_inventory_query_resolver, provide_reserved_item_query_resolver
-from inventory.error.authentication_error import AuthenticationError
+from inventory.graphql.permissions import IsAdminOrUser, IsAdminUserOrSupreme
+from inventory.cache.response_cache import INVENTORYS_TAG, inventory_tag, product_tag
+from inventory.graphql.response_cache import add_cache_tags
 from inventory.model.entity.inventory import InventoryType
 from inventory.model.entity.reserved_item import ReserveInventoryItemType
 from inventory.model.input.pagination import PaginationInput
 from inventory.model.input.search_criteria_input import InventorySearchCriteria, InventorySearchCriteriaInput
 from inventory.model.types.inventory_slice import InventorySlice
 from inventory.repository.pageable import Pageable
-from inventory.security.keycloak_service import KeycloakService
 
 # ---------------------------
 # GraphQL Query Definition
 # ---------------------------
 @strawberry.type
 class Query:
-    @strawberry.field
+    @strawberry.field(permission_classes=[IsAdminOrUser])
     async def inventory(
         self,
         info: strawberry.Info,
         inventory_id: strawberry.ID,
     ) -> InventoryType | None:
-        keycloak: KeycloakService | None = info.context.get("keycloak")
-        if keycloak is None:
-            raise AuthenticationError()
-        keycloak.assert_roles(["Admin", "User"])
-
         resolver = await provide_inventory_query_resolver()
-        return await resolver.resolve_inventory(inventory_id=str(inventory_id), token=keycloak.token)
+        inventory = await resolver.resolve_inventory(
+            info=info,
+            inventory_id=str(inventory_id),
+            token=info.context["principal"].token,
+        )
+        add_cache_tags(info, inventory_tag(str(inventory_id)))
+        if inventory is not None and inventory.product_id:
+            add_cache_tags(info, product_tag(inventory.product_id))
+        return inventory
 
-    @strawberry.field
+    @strawberry.field(permission_classes=[IsAdminOrUser])
     async def inventorys(
         self,
         pagination: PaginationInput | None = None,
@@ -45,11 +49,6 @@ class Query:
         :raises NotFoundError: Falls kein Inventar gefunden wurde, wird zu GraphQLError
         """
 
-        keycloak: KeycloakService | None = info.context.get("keycloak")
-        if keycloak is None:
-            raise AuthenticationError()
-        keycloak.assert_roles(["Admin", "User"])
-
         such_dict: Final = dict(vars(search_criteria)) if search_criteria else {}
         filtered = {k: v for k, v in such_dict.items() if v}
 
@@ -69,8 +68,14 @@ class Query:
             info=info,
             pageable=pageable,
             search_criteria=criteria,
+            token=info.context["principal"].token,
         )
 
+        add_cache_tags(
+            info,
+            INVENTORYS_TAG,
+            *(product_tag(item.product_id) for item in inventorys.content if item.product_id),
+        )
         return InventorySlice(
             content=inventorys.content,
             total=inventorys.total,
@@ -78,30 +83,20 @@ class Query:
             size=pageable.limit,
         )
 
-    @strawberry.field
+    @strawberry.field(permission_classes=[IsAdminUserOrSupreme])
     async def get_reserve_items_by_customer(
         self, info: strawberry.Info, customer_id: str | None = None
     ) -> list[ReserveInventoryItemType]:
-        keycloak: KeycloakService | None = info.context.get("keycloak")
-        if keycloak is None:
-            raise AuthenticationError()
-        keycloak.assert_roles(["Admin", "User", "Supreme"])
-
         resolver = await provide_reserved_item_query_resolver()
         items = await resolver.resolve_reserve_items_by_customer(customer_id=customer_id)
         return items
 
-    @strawberry.field
+    @strawberry.field(permission_classes=[IsAdminOrUser])
     async def get_reserve_items(
         self,
         info: strawberry.Info,
         customer_id: str | None = None,
     ) -> list[ReserveInventoryItemType]:
-        keycloak: KeycloakService | None = info.context.get("keycloak")
-        if keycloak is None:
-            raise AuthenticationError()
-        keycloak.assert_roles(["Admin", "User"])
-
         resolver = await provide_reserved_item_query_resolver()
         items = await resolver.resolve_reserve_items_by_customer(customer_id=customer_id)
         return items
@@ -0,0 +1,128 @@
+"""Antworten der Queries `inventory` und `inventorys` aus dem Response-Cache.
+
+Schlüssel ist der Hash aus normalisierter Query, Operationsname, Variablen und
+den Rollen des Benutzers, soweit Berechtigungen oder Kostenbudgets sie prüfen. Die Resolver ergänzen die Tags einer Antwort per
+`add_cache_tags`, z.B. `inventory:<id>` oder `product:<id>`. Schreiboperationen
+und Product-Events entfernen alle Antworten mit einem betroffenen Tag (siehe
+`inventory.cache.response_cache`). Antworten mit Ersatzwerten, z.B. ohne
+erreichbaren Product-Service, markieren die Resolver per `skip_cache`.
+"""
+
+from collections.abc import AsyncIterator, Mapping
+from functools import lru_cache
+from hashlib import sha256
+from typing import Any, Final, Optional
+
+from graphql import ExecutionResult, FieldNode, OperationType, get_operation_ast
+from graphql.utilities import strip_ignored_characters
+import orjson
+from strawberry.extensions import SchemaExtension
+from strawberry.types import Info
+
+from inventory.cache.response_cache import ResponseCache, get_response_cache
+from inventory.config.graphql import graphql_cost_budgets
+from inventory.graphql.document_cache import query_hash
+from inventory.graphql.permissions import RolePermission
+from inventory.security.principal import Principal
+
+__all__ = ["ResponseCacheExtension", "add_cache_tags", "response_key", "skip_cache"]
+
+_CACHEABLE_FIELDS: Final = frozenset({"inventory", "inventorys"})
+
+_KEY_ROLES: Final[frozenset[str]] = frozenset(graphql_cost_budgets).union(
+    *(permission.roles for permission in RolePermission.__subclasses__())
+)
+"""Rollen, von denen eine Antwort abhängen kann; weitere Rollen teilen den Cache nicht auf."""
+
+
+def add_cache_tags(info: Info, *tags: str) -> None:
+    """Tags der aktuellen Antwort ergänzen, falls sie gecacht wird."""
+    response_tags: Final[Optional[set[str]]] = info.context.get("cache_tags")
+    if response_tags is not None:
+        response_tags.update(tags)
+
+
+def skip_cache(info: Info) -> None:
+    """Aktuelle Antwort nicht cachen, weil sie Ersatzwerte enthält."""
+    info.context["cache_skip"] = True
+
+
+@lru_cache(maxsize=1024)
+def _normalized_query_hash(query: str) -> str:
+    # Ohne Leerzeichen, Zeilenumbrüche und Kommentare
+    return query_hash(strip_ignored_characters(query))
+
+
+def response_key(
+    query: str,
+    operation_name: Optional[str],
+    variables: Optional[Mapping[str, Any]],
+    roles: frozenset[str],
+) -> str:
+    """Schlüssel aus normalisierter Query, Operationsname, Variablen und relevanten Rollen."""
+    parts: Final = orjson.dumps(
+        [
+            _normalized_query_hash(query),
+            operation_name,
+            variables or {},
+            sorted(roles & _KEY_ROLES),
+        ],
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return sha256(parts).hexdigest()
+
+
+class ResponseCacheExtension(SchemaExtension):
+    """Beantwortet Queries auf `inventory` und `inventorys` aus dem Cache."""
+
+    async def on_execute(self) -> AsyncIterator[None]:  # type: ignore[override]
+        execution_context: Final = self.execution_context
+        cache: Final = get_response_cache()
+        key: Final = self._cache_key(cache)
+        generation: Final = cache.generation
+        data: Final = cache.get(key) if key is not None else None
+        if data is not None:
+            # Ein gesetztes Ergebnis überspringt die Ausführung der Resolver
+            execution_context.result = ExecutionResult(data=data)
+        elif key is not None:
+            execution_context.context["cache_tags"] = set()
+
+        yield
+
+        if key is None or data is not None:
+            return
+        if execution_context.context.get("cache_skip"):
+            return
+        result: Final = execution_context.result
+        if result is not None and not result.errors and result.data is not None:
+            cache.put(key, result.data, execution_context.context["cache_tags"], generation)
+
+    def _cache_key(self, cache: ResponseCache) -> Optional[str]:
+        execution_context: Final = self.execution_context
+        document: Final = execution_context.graphql_document
+        principal: Final[Optional[Principal]] = execution_context.context.get("principal")
+        if (
+            not cache.enabled
+            or execution_context.result is not None
+            or execution_context.query is None
+            or document is None
+            or principal is None
+        ):
+            return None
+
+        operation: Final = get_operation_ast(document, execution_context.operation_name)
+        if operation is None or operation.operation != OperationType.QUERY:
+            return None
+        # Nur Felder auf oberster Ebene, d.h. ohne Fragmente
+        selections: Final = operation.selection_set.selections
+        if not all(isinstance(selection, FieldNode) for selection in selections):
+            return None
+        names: Final = {selection.name.value for selection in selections}  # type: ignore[attr-defined]
+        if not names & _CACHEABLE_FIELDS or names - _CACHEABLE_FIELDS - {"__typename"}:
+            return None
+        return response_key(
+            execution_context.query,
+            execution_context.operation_name,
+            execution_context.variables,
+            principal.roles,
+        )
@@ -2,12 +2,18 @@ from typing import Final, List
 
 import strawberry
 from fastapi import Request
-from strawberry.fastapi import GraphQLRouter
 from strawberry.federation import Schema
 
 from inventory.config.graphql import graphql_ide
+from inventory.graphql.auth_extension import KeycloakExtension
+from inventory.graphql.cost_extension import QueryCostExtension
+from inventory.graphql.dataloaders import create_loaders
+from inventory.graphql.document_cache import DocumentCacheExtension
 from inventory.graphql.mutation import Mutation
+from inventory.graphql.persisted_query_router import PersistedQueryGraphQLRouter
+from inventory.graphql.response_cache import ResponseCacheExtension
 from inventory.graphql.query import Query
+from inventory.model.types.product_type import ProductType
 from inventory.repository.inventory_repository import InventoryRepository
 from inventory.repository.session import AsyncSessionFactory
 from inventory.resolver.inventory_query_resolver import InventoryQueryResolver
@@ -31,7 +37,7 @@ async def get_context(request: Request) -> dict:
     return {
         "session": session,
         "resolver": resolver,
-        "keycloak": getattr(request.state, "keycloak", None),
+        "loaders": create_loaders(),
     }
 
 
@@ -41,10 +47,18 @@ async def get_context(request: Request) -> dict:
 schema = Schema(
     query=Query,
     mutation=Mutation,
+    types=[ProductType],
+    # QueryCostExtension und ResponseCacheExtension benötigen den Principal von KeycloakExtension
+    extensions=[
+        DocumentCacheExtension,
+        KeycloakExtension,
+        QueryCostExtension,
+        ResponseCacheExtension,
+    ],
     enable_federation_2=True,
 )
 
-graphql_router: Final = GraphQLRouter(
+graphql_router: Final = PersistedQueryGraphQLRouter(
     schema,
     context_getter=get_context,
     graphql_ide=graphql_ide,
@@ -0,0 +1,66 @@
+"""Entscheidung, wann der Kafka Consumer pausieren bzw. weiterlesen soll."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Final
+
+from inventory.config.kafka import KafkaSettings
+from inventory.messaging.kafka_metrics import db_pool_checked_out
+
+__all__ = ["ConsumerBackpressure"]
+
+
+def _engine_pool_checkedout() -> int:
+    # ⛔ Lazy Import: Die Engine wird erst beim ersten Aufruf benötigt
+    from inventory.repository.session import engine
+
+    return engine.pool.checkedout()
+
+
+@dataclass(eq=False, slots=True, kw_only=True)
+class ConsumerBackpressure:
+    """Schwellwerte mit Hysterese für In-Flight-Nachrichten und DB-Pool."""
+
+    pause_in_flight: int
+    """Ab dieser Anzahl laufender Nachrichten wird pausiert."""
+
+    resume_in_flight: int
+    """Unterhalb dieser Anzahl laufender Nachrichten wird fortgesetzt."""
+
+    pause_pool_checkedout: int
+    """Ab dieser Anzahl ausgeliehener DB-Verbindungen wird pausiert."""
+
+    resume_pool_checkedout: int
+    """Unterhalb dieser Anzahl ausgeliehener DB-Verbindungen wird fortgesetzt."""
+
+    pool_checkedout: Callable[[], int] = _engine_pool_checkedout
+    """Liefert die aktuell ausgeliehenen Verbindungen des DB-Pools."""
+
+    @staticmethod
+    def from_settings(settings: KafkaSettings) -> "ConsumerBackpressure":
+        """Schwellwerte aus der Kafka-Konfiguration übernehmen."""
+        return ConsumerBackpressure(
+            pause_in_flight=settings.consumer_pause_in_flight,
+            resume_in_flight=settings.consumer_resume_in_flight,
+            pause_pool_checkedout=settings.consumer_pause_pool_checkedout,
+            resume_pool_checkedout=settings.consumer_resume_pool_checkedout,
+        )
+
+    def _checkedout(self) -> int:
+        checkedout: Final = self.pool_checkedout()
+        db_pool_checked_out.set(checkedout)
+        return checkedout
+
+    def should_pause(self, in_flight: int) -> bool:
+        """True, falls Handler oder DB-Pool den oberen Schwellwert erreicht haben."""
+        return (
+            in_flight >= self.pause_in_flight
+            or self._checkedout() >= self.pause_pool_checkedout
+        )
+
+    def should_resume(self, in_flight: int) -> bool:
+        """True, falls Handler und DB-Pool unter den unteren Schwellwert gefallen sind."""
+        return (
+            in_flight < self.resume_in_flight
+            and self._checkedout() < self.resume_pool_checkedout
+        )
@@ -1,27 +1,32 @@
 from loguru import logger
+from inventory.model.dto.inventory_item_event import (
+    InvalidEventError,
+    decode_inventory_item_event,
+)
 from inventory.model.entity.reserved_item import ReserveInventoryItemInput
 from inventory.repository.session import get_session
 from inventory.tracing.trace_context_util import TraceContextUtil
 
 # TODO preis auch reservieren
 class ReleaseItemHandler:
-    async def __call__(self, payload: dict, headers: dict):
+    async def __call__(self, value: bytes, headers: dict[str, str]):
         # ⛔ Zirkularimport vermeiden durch Lazy Import:
         from inventory.dependency_provider import provide_inventory_write_service
 
+        try:
+            event = decode_inventory_item_event(value, headers)
+        except InvalidEventError as e:
+            logger.error(f"⚠️ Ungültiges Release-Event: {e}")
+            return
+
         async with get_session() as session:
             async with provide_inventory_write_service(session=session) as write_service:
                 # trace = TraceContextUtil.from_kafka_headers(headers)
 
-                try:
-                    item = payload["item"]
-                    input = ReserveInventoryItemInput(
-                        inventory_id=item["inventoryId"],  # ← falls inventoryId als skuCode gilt
-                        quantity=item["quantity"],
-                        customer_id=payload["customerId"],
-                    )
+                input = ReserveInventoryItemInput(
+                    inventory_id=event.inventory_id,
+                    quantity=event.quantity,
+                    customer_id=event.customer_id,
+                )
 
-                    await write_service.release(input)
-                except KeyError as e:
-                    logger.error(f"⚠️ Fehlendes Feld im Payload: {e}")
-                    return
+                await write_service.release(input)
@@ -2,13 +2,32 @@
 KafkaConsumerService – liest Log-Nachrichten aus Kafka und verarbeitet sie.
 """
 
-from aiokafka import AIOKafkaConsumer
+from aiokafka import ConsumerRebalanceListener, ConsumerRecord, TopicPartition
 from loguru import logger
-import asyncio, json
+import asyncio
+from contextlib import suppress
 
+from inventory.config.kafka import get_kafka_settings
+from inventory.messaging.consumer_backpressure import ConsumerBackpressure
 from inventory.messaging.kafka_event_dispatcher import KafkaEventDispatcher
+from inventory.messaging.kafka_producer_service import KafkaProducerService
+from inventory.messaging.kafka_metrics import (
+    kafka_consumer_in_flight,
+    kafka_consumer_lag,
+    kafka_consumer_paused,
+)
+from inventory.messaging.transport import AIOKafkaTransport, KafkaConsumerClient, KafkaTransport
 from inventory.config import env, kafka
 
+
+class _RecordFailedError(Exception):
+    """Der Handler eines Records ist fehlgeschlagen, die übrigen Records des Batches fehlen."""
+
+    def __init__(self, record: ConsumerRecord) -> None:
+        super().__init__(f"Handler für {record.topic}/{record.partition}@{record.offset} fehlgeschlagen")
+        self.record = record
+
+
 class KafkaConsumerService:
     """Asynchrone Kafka-Consumer-Logik für Log-Einträge."""
 
@@ -17,25 +36,57 @@ class KafkaConsumerService:
         dispatcher: KafkaEventDispatcher,
         topics: list[str],
         bootstrap_servers: str = env.KAFKA_URI,
+        backpressure: ConsumerBackpressure | None = None,
+        name: str = "consumer",
+        transport: KafkaTransport | None = None,
+        producer: KafkaProducerService | None = None,
     ):
+        settings = get_kafka_settings()
         self.dispatcher = dispatcher
         self.topics = topics
+        self.name = name
         self._bootstrap_servers = bootstrap_servers
-        self._consumer = None
+        self._transport = transport or AIOKafkaTransport()
+        self._client_id = f"{settings.client_id}-{name}"
+        self._group_id = settings.group_id
+        self._drain_timeout_s = settings.consumer_drain_timeout_s
+        self._backpressure = backpressure or ConsumerBackpressure.from_settings(settings)
+        self._max_records = settings.consumer_max_records
+        self._poll_timeout_ms = settings.consumer_poll_timeout_ms
+        self._retry_backoff_s = settings.consumer_retry_backoff_s
+        self._max_retries = settings.consumer_max_retries
+        # Transaktional: Ausgaben der Handler und Offsets werden gemeinsam committet
+        self._producer = producer
+        self._transactional = producer is not None and producer.transactional
+        self._consumer: KafkaConsumerClient | None = None
         self._task = None
+        # Je Partition die zuletzt gestartete Verarbeitung (Reihenfolge bleibt erhalten)
+        self._partition_tasks: dict[TopicPartition, asyncio.Task] = {}
+        # Je Partition erhöht durch einen Abbruch: bereits eingereihte Batches verfallen
+        self._partition_epochs: dict[TopicPartition, int] = {}
+        # Je Partition: (Offset des zuletzt fehlgeschlagenen Records, Anzahl Versuche)
+        self._failures: dict[TopicPartition, tuple[int, int]] = {}
+        # Je Partition ein Record, der nach `consumer_max_retries` übersprungen wird
+        self._skip_offsets: dict[TopicPartition, int] = {}
+        self._in_flight = 0
+        self._paused = False
 
     async def start(self):
-        self._consumer = AIOKafkaConsumer(
-            *self.topics,
+        self._consumer = self._transport.create_consumer(
             bootstrap_servers=self._bootstrap_servers,
-            value_deserializer=lambda v: json.loads(v.decode("utf-8")),
+            client_id=self._client_id,
+            # Rohe Bytes: Dekodierung erfolgt typisiert im jeweiligen Handler
             auto_offset_reset="earliest",
-            enable_auto_commit=True,
-            group_id="inventory-group",
+            # Offsets erst nach der Verarbeitung committen (siehe _commit)
+            enable_auto_commit=False,
+            group_id=self._group_id,
+            # Nur committete Transaktionen lesen, falls vorgelagert transaktional produziert wird
+            isolation_level="read_committed" if self._transactional else "read_uncommitted",
         )
+        self._consumer.subscribe(self.topics, listener=_RebalanceListener(self))
         await self._consumer.start()
         self._task = asyncio.create_task(self._consume())
-        logger.info("📡 Kafka Consumer gestartet.")
+        logger.info("📡 Kafka Consumer '{}' gestartet.", self.name)
 
     async def stop(self):
         if self._task:
@@ -44,23 +95,259 @@ class KafkaConsumerService:
                 await self._task
             except asyncio.CancelledError:
                 pass
+        # Bereits abgeholte Nachrichten noch zu Ende verarbeiten
+        await self.drain()
         if self._consumer:
             await self._consumer.stop()
+            logger.info("🛑 Kafka Consumer '{}' gestoppt.", self.name)
+
+    async def drain(self, partitions: set[TopicPartition] | None = None) -> None:
+        """Warten, bis die laufenden Batches (ggf. nur der Partitionen) verarbeitet sind."""
+        tasks = [
+            task
+            for tp, task in self._partition_tasks.items()
+            if partitions is None or tp in partitions
+        ]
+        if not tasks:
+            return
+        _, pending = await asyncio.wait(tasks, timeout=self._drain_timeout_s)
+        if pending:
+            logger.warning(
+                "⏱️ Kafka Consumer '{}': {} Batches nach {}s nicht fertig",
+                self.name,
+                len(pending),
+                self._drain_timeout_s,
+            )
 
     async def _consume(self):
-        async for msg in self._consumer:
-            topic = msg.topic
-            headers = dict((k, v.decode("utf-8")) for k, v in (msg.headers or []))
-            logger.debug(f"📥 Kafka MSG: {msg.value} on topic={topic} headers={headers}")
-            handler = self.dispatcher.get_handler(topic)
-            if handler:
-                try:
-                    await handler(msg.value, headers)
-                    logger.debug(f"✅ Handler für Topic '{topic}' erfolgreich ausgeführt")
-                except Exception as e:
-                    logger.exception(f"❌ Fehler im Handler für Topic '{topic}': {e}")
-            else:
-                logger.warning(f"⚠️ Kein Handler für Topic: {topic}")
+        while True:
+            batches = await self._consumer.getmany(
+                timeout_ms=self._poll_timeout_ms,
+                max_records=self._max_records,
+            )
+            for tp, records in batches.items():
+                self._submit(tp, records)
+            self._apply_backpressure()
+
+    def _submit(self, tp: TopicPartition, records: list[ConsumerRecord]) -> None:
+        """Batch einer Partition im Hintergrund verarbeiten, nach dem vorherigen Batch."""
+        self._in_flight += len(records)
+        kafka_consumer_in_flight.inc(len(records))
+
+        previous = self._partition_tasks.get(tp)
+        epoch = self._partition_epochs.get(tp, 0)
+        task = asyncio.create_task(self._process_partition(tp, records, previous, epoch))
+        self._partition_tasks[tp] = task
+
+        def _done(finished: asyncio.Task) -> None:
+            if self._partition_tasks.get(tp) is finished:
+                del self._partition_tasks[tp]
+            self._apply_backpressure()
+
+        task.add_done_callback(_done)
+
+    async def _process_partition(
+        self,
+        tp: TopicPartition,
+        records: list[ConsumerRecord],
+        previous: asyncio.Task | None,
+        epoch: int,
+    ) -> None:
+        if previous is not None:
+            await asyncio.wait([previous])
+
+        if self._partition_epochs.get(tp, 0) != epoch:
+            # Ein vorheriger Batch wurde abgebrochen und ab seinem Offset neu abgeholt
+            logger.debug("Kafka Consumer '{}': Batch für {} verworfen", self.name, tp)
+            self._release_in_flight(len(records))
+            return
+
+        if self._transactional:
+            await self._process_in_transaction(tp, records)
+            return
+
+        try:
+            await self._handle_records(tp, records)
+        except _RecordFailedError as e:
+            # Nur bis vor den fehlgeschlagenen Record committen (at-least-once)
+            if e.record.offset > records[0].offset:
+                await self._commit(tp, e.record.offset)
+            await self._redeliver(tp, records[0].offset, e.record.offset)
+            return
+        await self._commit(tp, records[-1].offset + 1)
+
+    async def _handle_records(self, tp: TopicPartition, records: list[ConsumerRecord]) -> None:
+        """Records der Reihe nach verarbeiten.
+
+        :raises _RecordFailedError: Beim ersten fehlgeschlagenen Handler, die
+            restlichen Records des Batches werden nicht verarbeitet
+        """
+        for index, msg in enumerate(records):
+            try:
+                if self._skip_offsets.get(tp) == msg.offset:
+                    del self._skip_offsets[tp]
+                    logger.error(
+                        "⏭️ Kafka Consumer '{}': {}@{} nach {} Versuchen übersprungen",
+                        self.name,
+                        tp,
+                        msg.offset,
+                        self._max_retries + 1,
+                    )
+                    continue
+                await self._handle(msg)
+            except Exception as e:
+                self._release_in_flight(len(records) - index - 1)
+                raise _RecordFailedError(msg) from e
+            finally:
+                self._release_in_flight(1)
+                self._record_lag(tp, msg.offset)
+
+    async def _redeliver(
+        self,
+        tp: TopicPartition,
+        offset: int,
+        failed_offset: int | None = None,
+    ) -> None:
+        """Partition ab `offset` erneut abholen, bereits eingereihte Batches verfallen.
+
+        Schlägt derselbe Record mehr als `consumer_max_retries` Mal fehl, wird er
+        beim nächsten Mal übersprungen.
+        """
+        if failed_offset is not None:
+            previous_offset, attempts = self._failures.get(tp, (failed_offset, 0))
+            attempts = attempts + 1 if previous_offset == failed_offset else 1
+            self._failures[tp] = (failed_offset, attempts)
+            if attempts > self._max_retries:
+                self._skip_offsets[tp] = failed_offset
+                self._failures.pop(tp, None)
+        if tp not in self._skip_offsets:
+            # Während der Pause eingereihte Batches verfallen ebenfalls (Epoche)
+            await asyncio.sleep(self._retry_backoff_s)
+        # Bereits eingereihte Batches dahinter verwerfen, sonst committen sie Offsets
+        # hinter den fehlgeschlagenen Records
+        self._partition_epochs[tp] = self._partition_epochs.get(tp, 0) + 1
+        if self._consumer is not None and tp in self._consumer.assignment():
+            self._consumer.seek(tp, offset)
+
+    def _release_in_flight(self, count: int) -> None:
+        self._in_flight -= count
+        kafka_consumer_in_flight.dec(count)
+
+    async def _process_in_transaction(
+        self,
+        tp: TopicPartition,
+        records: list[ConsumerRecord],
+    ) -> None:
+        """Batch in einer Kafka-Transaktion: Ausgaben der Handler und Offset atomar.
+
+        DB-Änderungen der Handler sind nicht Teil der Kafka-Transaktion. Transaktionen
+        verschiedener Partitionen laufen parallel.
+        """
+        started = False
+        try:
+            async with self._producer.transaction(
+                self._producer.transactional_id(self._group_id, tp)
+            ):
+                started = True
+                # Fehler eines Handlers brechen die Transaktion ab, d.h. keine Teilausgaben
+                await self._handle_records(tp, records)
+                if self._consumer is None or tp not in self._consumer.assignment():
+                    raise RuntimeError(f"Partition {tp} wurde während des Batches entzogen")
+                await self._producer.send_offsets(
+                    {tp: records[-1].offset + 1}, self._group_id
+                )
+        except _RecordFailedError as e:
+            logger.error("❌ Kafka-Transaktion für {} abgebrochen: {}", tp, e)
+            # Batch erneut abholen, da weder Ausgaben noch Offset committet sind
+            await self._redeliver(tp, records[0].offset, e.record.offset)
+        except Exception as e:
+            logger.error("❌ Kafka-Transaktion für {} abgebrochen: {}", tp, e)
+            if not started:
+                self._release_in_flight(len(records))
+            await self._redeliver(tp, records[0].offset)
+
+    async def _commit(self, tp: TopicPartition, offset: int) -> None:
+        """Offset nach erfolgreicher Verarbeitung committen (at-least-once)."""
+        if self._consumer is None or tp not in self._consumer.assignment():
+            # Partition wurde inzwischen entzogen: der neue Besitzer verarbeitet erneut
+            return
+        try:
+            await self._consumer.commit({tp: offset})
+        except Exception as e:
+            logger.warning("⚠️ Commit für {} fehlgeschlagen: {}", tp, e)
+
+    async def _handle(self, msg: ConsumerRecord) -> None:
+        topic = msg.topic
+        headers = dict((k, v.decode("utf-8")) for k, v in (msg.headers or []))
+        logger.debug(f"📥 Kafka MSG: {msg.value!r} on topic={topic} headers={headers}")
+        handler = self.dispatcher.get_handler(topic)
+        if handler:
+            try:
+                await handler(msg.value, headers)
+                logger.debug(f"✅ Handler für Topic '{topic}' erfolgreich ausgeführt")
+            except Exception as e:
+                # Weiterreichen: der Record wird erneut zugestellt statt committet
+                logger.exception(f"❌ Fehler im Handler für Topic '{topic}': {e}")
+                raise
+        else:
+            logger.warning(f"⚠️ Kein Handler für Topic: {topic}")
+
+    def _record_lag(self, tp: TopicPartition, offset: int) -> None:
+        highwater = self._consumer.highwater(tp) if self._consumer else None
+        if highwater is not None:
+            kafka_consumer_lag.labels(tp.topic, str(tp.partition)).set(
+                max(highwater - offset - 1, 0)
+            )
+
+    def _apply_backpressure(self) -> None:
+        """Partitionen pausieren bzw. fortsetzen, abhängig von Handlern und DB-Pool."""
+        if self._consumer is None:
+            return
+
+        if not self._paused and self._backpressure.should_pause(self._in_flight):
+            partitions = self._consumer.assignment()
+            self._consumer.pause(*partitions)
+            self._paused = True
+            for tp in partitions:
+                kafka_consumer_paused.labels(tp.topic, str(tp.partition)).set(1)
+            logger.warning(
+                "🚦 Kafka Consumer pausiert: in_flight={}, partitions={}",
+                self._in_flight,
+                len(partitions),
+            )
+        elif self._paused and self._backpressure.should_resume(self._in_flight):
+            partitions = self._consumer.paused()
+            self._consumer.resume(*partitions)
+            self._paused = False
+            for tp in partitions:
+                kafka_consumer_paused.labels(tp.topic, str(tp.partition)).set(0)
+            logger.info("🟢 Kafka Consumer fortgesetzt: in_flight={}", self._in_flight)
+
+    async def on_partitions_revoked(self, revoked: set[TopicPartition]) -> None:
+        """Vor dem Rebalance laufende Batches der entzogenen Partitionen beenden."""
+        logger.info("🔄 Kafka Consumer '{}': Partitionen entzogen {}", self.name, revoked)
+        await self.drain(revoked)
+        for tp in revoked:
+            self._failures.pop(tp, None)
+            self._skip_offsets.pop(tp, None)
+            if self._transactional:
+                await self._producer.release_transactional(
+                    self._producer.transactional_id(self._group_id, tp)
+                )
+            with suppress(KeyError):
+                kafka_consumer_paused.remove(tp.topic, str(tp.partition))
+            with suppress(KeyError):
+                kafka_consumer_lag.remove(tp.topic, str(tp.partition))
+
+    def on_partitions_assigned(self, assigned: set[TopicPartition]) -> None:
+        """Neu zugewiesene Partitionen übernehmen den aktuellen Backpressure-Zustand."""
+        logger.info("🔄 Kafka Consumer '{}': Partitionen zugewiesen {}", self.name, assigned)
+        if self._paused and assigned:
+            self._consumer.pause(*assigned)
+        for tp in assigned:
+            kafka_consumer_paused.labels(tp.topic, str(tp.partition)).set(
+                1 if self._paused else 0
+            )
 
 
     async def handle_log(self, event: dict):
@@ -81,3 +368,16 @@ class KafkaConsumerService:
         await self.stop()  # zuerst Kafka-Consumer stoppen
         loop = asyncio.get_event_loop()
         loop.call_later(1, loop.stop)  # sanfter Stop (optional: os._exit(0))
+
+
+class _RebalanceListener(ConsumerRebalanceListener):
+    """Leitet Rebalance-Callbacks von aiokafka an den KafkaConsumerService weiter."""
+
+    def __init__(self, service: KafkaConsumerService):
+        self._service = service
+
+    async def on_partitions_revoked(self, revoked):
+        await self._service.on_partitions_revoked(set(revoked))
+
+    async def on_partitions_assigned(self, assigned):
+        self._service.on_partitions_assigned(set(assigned))
@@ -0,0 +1,77 @@
+"""Prometheus-Metriken für Kafka Consumer und Producer."""
+
+from typing import Final
+
+from prometheus_client import Counter, Gauge
+
+__all__ = [
+    "db_pool_checked_out",
+    "kafka_consumer_in_flight",
+    "kafka_consumer_lag",
+    "kafka_consumer_paused",
+    "kafka_spill_bytes",
+    "kafka_spill_dropped",
+    "kafka_spill_pending",
+    "kafka_spill_replayed",
+    "log_events_dropped",
+    "log_events_published",
+    "log_events_queued",
+]
+
+kafka_consumer_lag: Final = Gauge(
+    "inventory_kafka_consumer_lag",
+    "Anzahl noch nicht verarbeiteter Nachrichten je Partition",
+    ["topic", "partition"],
+)
+
+kafka_consumer_paused: Final = Gauge(
+    "inventory_kafka_consumer_paused",
+    "1, falls die Partition wegen Backpressure pausiert ist, sonst 0",
+    ["topic", "partition"],
+)
+
+kafka_consumer_in_flight: Final = Gauge(
+    "inventory_kafka_consumer_in_flight",
+    "Anzahl abgeholter, aber noch nicht verarbeiteter Nachrichten",
+)
+
+db_pool_checked_out: Final = Gauge(
+    "inventory_db_pool_checked_out",
+    "Anzahl ausgeliehener Verbindungen aus dem DB-Pool",
+)
+
+kafka_spill_pending: Final = Gauge(
+    "inventory_kafka_spill_pending",
+    "Anzahl Nachrichten im Spill-Journal, die noch nachgesendet werden müssen",
+)
+
+kafka_spill_bytes: Final = Gauge(
+    "inventory_kafka_spill_bytes",
+    "Belegter Speicher der Segment-Dateien des Spill-Journals",
+)
+
+kafka_spill_replayed: Final = Counter(
+    "inventory_kafka_spill_replayed",
+    "Anzahl aus dem Spill-Journal nachgesendeter Nachrichten",
+)
+
+kafka_spill_dropped: Final = Counter(
+    "inventory_kafka_spill_dropped",
+    "Anzahl verworfener Nachrichten, weil das Spill-Journal voll war",
+)
+
+log_events_queued: Final = Gauge(
+    "inventory_log_events_queued",
+    "Anzahl Log-Events in der Queue, die noch nicht an Kafka gesendet wurden",
+)
+
+log_events_dropped: Final = Counter(
+    "inventory_log_events_dropped",
+    "Anzahl verworfener Log-Events",
+    ["reason"],
+)
+
+log_events_published: Final = Counter(
+    "inventory_log_events_published",
+    "Anzahl an Kafka gesendeter Log-Events",
+)
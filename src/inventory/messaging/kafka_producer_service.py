@@ -1,42 +1,391 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 import orjson
-from aiokafka import AIOKafkaProducer
+from aiokafka import TopicPartition, codec
+from aiokafka.structs import RecordMetadata
 from loguru import logger
+from socket import gethostname
 from typing import Final, Optional, Union
 
 from opentelemetry import trace
 
 from inventory.config.kafka import get_kafka_settings
+from inventory.messaging.kafka_metrics import (
+    kafka_spill_bytes,
+    kafka_spill_dropped,
+    kafka_spill_pending,
+    kafka_spill_replayed,
+)
+from inventory.messaging.spill_journal import SpillJournal, SpilledRecord
+from inventory.messaging.transport import AIOKafkaTransport, KafkaProducerClient, KafkaTransport
 from inventory.tracing.trace_context import TraceContext
 from inventory.tracing.trace_context_util import TraceContextUtil
 
+# Kompressionsverfahren → Prüfung, ob die optionale Bibliothek installiert ist
+_CODECS: Final = {
+    "gzip": codec.has_gzip,
+    "lz4": codec.has_lz4,
+    "zstd": codec.has_zstd,
+}
+
+# Producer der laufenden Transaktion im aktuellen Task (siehe KafkaProducerService.transaction)
+_transaction_producer: ContextVar[Optional[KafkaProducerClient]] = ContextVar(
+    "kafka_transaction_producer", default=None
+)
+
+
+def _retrieve_exception(future: asyncio.Future) -> None:
+    """Exception als abgeholt markieren, damit asyncio keine Warnung loggt."""
+    if future.done() and not future.cancelled():
+        future.exception()
+
+
+def _compression_type(compression: str) -> Optional[str]:
+    """Konfigurierte Kompression, falls die Bibliothek dafür installiert ist."""
+    if compression == "none":
+        return None
+    if not _CODECS[compression]():
+        logger.warning(
+            "⚠️ Kafka-Kompression '{}' nicht verfügbar (Extra `compression` installieren)",
+            compression,
+        )
+        return None
+    return compression
+
 
 class KafkaProducerService:
     """Kafka Producer mit automatischem Tracing und Header-Support."""
 
-    def __init__(self) -> None:
-        self._producer: Optional[AIOKafkaProducer] = None
+    def __init__(self, transport: Optional[KafkaTransport] = None) -> None:
+        self._transport: Final = transport or AIOKafkaTransport()
+        # publish() wartet je Nachricht auf den Broker, d.h. ohne Linger
+        self._producer: Optional[KafkaProducerClient] = None
+        # publish_nowait() (Log-Events, Bulk) sammelt Batches über `producer_linger_ms`
+        self._batch_producer: Optional[KafkaProducerClient] = None
+        # Eigene Producer für Transaktionen je transactional_id: Log-Events u.ä. laufen außerhalb
+        self._tx_producers: Final[dict[str, KafkaProducerClient]] = {}
+        self._tx_locks: Final[dict[str, asyncio.Lock]] = {}
         self.started: bool = False
 
         settings = get_kafka_settings()
         self._bootstrap: Final = settings.bootstrap_servers
         self._client_id: Final = settings.client_id
         self._topic_log: Final = settings.topic_log
+        self._linger_ms: Final = settings.producer_linger_ms
+        self._max_batch_size: Final = settings.producer_max_batch_size
+        self._compression: Final = settings.producer_compression
+        self._idempotent: Final = settings.producer_idempotent
+        self._transactional_id_prefix: Final = settings.transactional_id
+
+        # Nicht sendbare Nachrichten lokal puffern und im Hintergrund nachsenden
+        self._journal: Final = (
+            SpillJournal(
+                settings.spill_dir,
+                owner=f"{settings.client_id}-{gethostname()}",
+                segment_bytes=settings.spill_segment_bytes,
+                max_bytes=settings.spill_max_bytes,
+            )
+            if settings.spill_enabled
+            else None
+        )
+        self._spill_retry_interval_s: Final = settings.spill_retry_interval_s
+        self._spill_sync_interval_s: Final = settings.spill_sync_interval_s
+        self._spilled: Final = asyncio.Event()
+        self._replay_task: Optional[asyncio.Task] = None
+        self._sync_task: Optional[asyncio.Task] = None
+        # Je Producer (batched?) die noch nicht bestätigten Sendungen in Sende-Reihenfolge
+        self._unconfirmed: Final[
+            dict[bool, deque[tuple[asyncio.Future, SpilledRecord, asyncio.Future]]]
+        ] = {False: deque(), True: deque()}
+
+    @property
+    def transactional(self) -> bool:
+        """True, falls `KAFKA_TRANSACTIONAL_ID` gesetzt ist."""
+        return self._transactional_id_prefix is not None
+
+    def transactional_id(self, group_id: str, tp: TopicPartition) -> str:
+        """transactional_id für die Verarbeitung einer Partition.
+
+        Jede Partition ist genau einem Consumer der Group zugewiesen, d.h. Replicas
+        und Consumer fencen sich nicht gegenseitig. Übernimmt nach einem Rebalance
+        ein anderer Consumer die Partition, fenct er den vorherigen Besitzer.
+        """
+        return f"{self._transactional_id_prefix}-{group_id}-{tp.topic}-{tp.partition}"
 
     async def start(self) -> None:
+        """Producer starten; ohne erreichbaren Broker wird mit Spill-Journal weitergemacht."""
+        if self._journal is not None and self._replay_task is None:
+            self._journal.open()
+            self._update_spill_metrics()
+
         if not self._producer:
-            self._producer = AIOKafkaProducer(
-                bootstrap_servers=self._bootstrap, client_id=self._client_id, acks="all"
+            try:
+                await self._start_producers()
+            except Exception as e:
+                if self._journal is None:
+                    raise
+                logger.warning(
+                    "⚠️ Kafka Producer nicht gestartet, Nachrichten werden lokal gepuffert: {}",
+                    e,
+                )
+
+        if self._journal is not None and self._replay_task is None:
+            self._replay_task = asyncio.create_task(self._replay())
+            self._sync_task = asyncio.create_task(self._sync_journal())
+
+    async def _start_producers(self) -> None:
+        compression_type = _compression_type(self._compression)
+        producer = self._transport.create_producer(
+            bootstrap_servers=self._bootstrap,
+            client_id=self._client_id,
+            acks="all",
+            enable_idempotence=self._idempotent,
+            linger_ms=0,
+            max_batch_size=self._max_batch_size,
+            compression_type=compression_type,
+        )
+        await producer.start()
+        batch_producer = producer
+        if self._linger_ms > 0:
+            batch_producer = self._transport.create_producer(
+                bootstrap_servers=self._bootstrap,
+                client_id=f"{self._client_id}-batch",
+                acks="all",
+                enable_idempotence=self._idempotent,
+                linger_ms=self._linger_ms,
+                max_batch_size=self._max_batch_size,
+                compression_type=compression_type,
             )
-            await self._producer.start()
-            self.started = True
-            logger.info("✅ Kafka Producer gestartet")
+            try:
+                await batch_producer.start()
+            except Exception:
+                await producer.stop()
+                raise
+        self._producer = producer
+        self._batch_producer = batch_producer
+        self.started = True
+        logger.info(
+            "✅ Kafka Producer gestartet (linger_ms={}, compression={}, idempotent={}, transactional={})",
+            self._linger_ms,
+            compression_type or "none",
+            self._idempotent,
+            self.transactional,
+        )
+
+    async def flush(self) -> None:
+        """Warten, bis alle gepufferten Nachrichten vom Broker bestätigt sind."""
+        if self._batch_producer and self._batch_producer is not self._producer:
+            await self._batch_producer.flush()
+        if self._producer:
+            await self._producer.flush()
 
     async def stop(self) -> None:
+        for task in (self._replay_task, self._sync_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._replay_task = None
+        self._sync_task = None
         if self._producer:
+            # Mit publish_nowait gepufferte Nachrichten nicht verlieren
+            await self.flush()
             await self._producer.stop()
+            if self._batch_producer is not self._producer:
+                await self._batch_producer.stop()
+            self._batch_producer = None
             self._producer = None
             self.started = False
             logger.info("🛑 Kafka Producer gestoppt")
+        for transactional_id in list(self._tx_producers):
+            await self.release_transactional(transactional_id)
+        if self._journal is not None:
+            # Nicht nachgesendete Nachrichten bleiben für den nächsten Start erhalten
+            self._journal.close()
+
+    # ------------------------------------------------------------------
+    # Spill-Journal
+    # ------------------------------------------------------------------
+    def _spill(self, record: SpilledRecord) -> bool:
+        """Nachricht ins Journal schreiben, der Replay-Task sendet sie später nach."""
+        if not self._journal.append(record):
+            kafka_spill_dropped.inc()
+            logger.error("❌ Spill-Journal voll, Nachricht an '{}' verworfen", record.topic)
+            return False
+        self._update_spill_metrics()
+        self._spilled.set()
+        return True
+
+    def _spill_on_failure(
+        self,
+        future: asyncio.Future[RecordMetadata],
+        record: SpilledRecord,
+        batched: bool,
+    ) -> asyncio.Future[Optional[RecordMetadata]]:
+        """Future, das bei fehlgeschlagener Zustellung ins Journal ausweicht (Ergebnis None)."""
+        result: Final[asyncio.Future[Optional[RecordMetadata]]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        unconfirmed: Final = self._unconfirmed[batched]
+        unconfirmed.append((future, record, result))
+        future.add_done_callback(lambda _: self._confirm_in_order(unconfirmed))
+        return result
+
+    def _confirm_in_order(
+        self,
+        unconfirmed: deque[tuple[asyncio.Future, SpilledRecord, asyncio.Future]],
+    ) -> None:
+        """Sendungen in Sende-Reihenfolge abschließen.
+
+        Schlägt eine Sendung fehl, werden auch alle danach gesendeten ins Journal
+        geschrieben, selbst wenn der Broker sie bereits bestätigt hat: sonst würden
+        sie die fehlgeschlagene überholen. Beim Nachsenden entstehen dadurch ggf.
+        Duplikate (at-least-once).
+        """
+        while unconfirmed and unconfirmed[0][0].done():
+            sent, record, result = unconfirmed.popleft()
+            if sent.cancelled():
+                result.cancel()
+                continue
+            error = sent.exception()
+            if error is None:
+                if not result.done():
+                    result.set_result(sent.result())
+                continue
+
+            failed = [(record, result), *((r, res) for _, r, res in unconfirmed)]
+            for later_sent, _, _ in unconfirmed:
+                # Ergebnis wird nicht mehr benötigt, Fehler trotzdem abholen
+                later_sent.add_done_callback(_retrieve_exception)
+            unconfirmed.clear()
+            logger.warning(
+                "💾 {} Kafka-Nachrichten ab '{}' lokal gepuffert: {}", len(failed), record.topic, error
+            )
+            for failed_record, failed_result in failed:
+                spilled = self._spill(failed_record)
+                if failed_result.done():
+                    continue
+                if spilled:
+                    # None: gepuffert, der Replay-Task sendet nach
+                    failed_result.set_result(None)
+                else:
+                    failed_result.set_exception(error)
+                    # Bereits von _spill geloggt, publish_nowait-Aufrufer warten ggf. nicht
+                    _retrieve_exception(failed_result)
+            return
+
+    async def _sync_journal(self) -> None:
+        """Gepufferte Nachrichten regelmäßig in einem Thread auf den Datenträger schreiben."""
+        while True:
+            await asyncio.sleep(self._spill_sync_interval_s)
+            if self._journal.dirty:
+                await asyncio.to_thread(self._journal.sync)
+
+    async def _replay(self) -> None:
+        """Producer ggf. neu starten und das Journal in der ursprünglichen Reihenfolge nachsenden."""
+        while True:
+            if not self.started:
+                try:
+                    await self._start_producers()
+                except Exception as e:
+                    logger.debug("Kafka weiterhin nicht erreichbar: {}", e)
+                    await asyncio.sleep(self._spill_retry_interval_s)
+                    continue
+
+            record = self._journal.peek()
+            if record is None:
+                self._spilled.clear()
+                await self._spilled.wait()
+                continue
+
+            try:
+                await self._producer.send_and_wait(
+                    record.topic, value=record.value, headers=record.headers
+                )
+            except Exception as e:
+                logger.warning("⚠️ Nachsenden aus dem Spill-Journal fehlgeschlagen: {}", e)
+                await asyncio.sleep(self._spill_retry_interval_s)
+                continue
+
+            self._journal.ack()
+            kafka_spill_replayed.inc()
+            self._update_spill_metrics()
+            if self._journal.pending_records == 0:
+                logger.info("✅ Spill-Journal vollständig nachgesendet")
+
+    def _update_spill_metrics(self) -> None:
+        kafka_spill_pending.set(self._journal.pending_records)
+        kafka_spill_bytes.set(self._journal.size_bytes)
+
+    @asynccontextmanager
+    async def transaction(self, transactional_id: str) -> AsyncIterator["KafkaProducerService"]:
+        """Kafka-Transaktion: `publish` im Block und `send_offsets` werden atomar committet.
+
+        Bei einer Exception wird die Transaktion abgebrochen. Nur Transaktionen mit
+        derselben `transactional_id` laufen nacheinander, der Producer dafür wird beim
+        ersten Aufruf gestartet.
+        """
+        if not self.transactional:
+            raise RuntimeError("Kafka Producer ist nicht transaktional konfiguriert")
+
+        lock: Final = self._tx_locks.setdefault(transactional_id, asyncio.Lock())
+        async with lock:
+            producer = await self._tx_producer(transactional_id)
+            await producer.begin_transaction()
+            token = _transaction_producer.set(producer)
+            try:
+                yield self
+            except BaseException:
+                await producer.abort_transaction()
+                raise
+            else:
+                await producer.commit_transaction()
+            finally:
+                _transaction_producer.reset(token)
+
+    async def release_transactional(self, transactional_id: str) -> None:
+        """Producer einer `transactional_id` stoppen, z.B. wenn die Partition entzogen wurde."""
+        lock: Final = self._tx_locks.get(transactional_id)
+        if lock is None:
+            return
+        async with lock:
+            producer = self._tx_producers.pop(transactional_id, None)
+            if producer is not None:
+                await producer.stop()
+
+    async def _tx_producer(self, transactional_id: str) -> KafkaProducerClient:
+        producer = self._tx_producers.get(transactional_id)
+        if producer is not None:
+            return producer
+        # Transaktionen setzen Idempotenz voraus
+        producer = self._transport.create_producer(
+            bootstrap_servers=self._bootstrap,
+            client_id=f"{self._client_id}-tx",
+            acks="all",
+            enable_idempotence=True,
+            transactional_id=transactional_id,
+            linger_ms=self._linger_ms,
+            max_batch_size=self._max_batch_size,
+            compression_type=_compression_type(self._compression),
+        )
+        await producer.start()
+        self._tx_producers[transactional_id] = producer
+        logger.debug("Kafka Producer für transactional_id={} gestartet", transactional_id)
+        return producer
+
+    async def send_offsets(
+        self, offsets: Mapping[TopicPartition, int], group_id: str
+    ) -> None:
+        """Consumer-Offsets als Teil der laufenden Transaktion committen."""
+        producer = _transaction_producer.get()
+        if producer is None:
+            raise RuntimeError("Keine laufende Kafka-Transaktion")
+        await producer.send_offsets_to_transaction(offsets, group_id)
 
     async def publish(
         self,
@@ -45,7 +394,40 @@ class KafkaProducerService:
         trace_ctx: Optional[TraceContext] = None,
         headers: Optional[list[tuple[str, str]]] = None,
     ) -> None:
-        if not self.started or not self._producer:
+        """Nachricht senden und auf die Bestätigung des Brokers (oder des Journals) warten."""
+        await (await self._send(topic, payload, trace_ctx, headers, spill=True, batched=False))
+
+    async def publish_nowait(
+        self,
+        topic: str,
+        payload: Union[dict, bytes],
+        trace_ctx: Optional[TraceContext] = None,
+        headers: Optional[list[tuple[str, str]]] = None,
+        spill: bool = True,
+    ) -> asyncio.Future[Optional[RecordMetadata]]:
+        """Nachricht nur in den Batch des Producers legen (fire-and-forget).
+
+        Der Batch wird nach `producer_linger_ms` gesendet. Ist Kafka nicht erreichbar,
+        wird die Nachricht ins Spill-Journal geschrieben (außer in Transaktionen oder
+        mit `spill=False`).
+
+        :return: Future mit der Bestätigung des Brokers bzw. None, falls gepuffert
+        :rtype: asyncio.Future[Optional[RecordMetadata]]
+        """
+        return await self._send(topic, payload, trace_ctx, headers, spill=spill, batched=True)
+
+    async def _send(
+        self,
+        topic: str,
+        payload: Union[dict, bytes],
+        trace_ctx: Optional[TraceContext],
+        headers: Optional[list[tuple[str, str]]],
+        spill: bool,
+        batched: bool,
+    ) -> asyncio.Future[Optional[RecordMetadata]]:
+        in_transaction = _transaction_producer.get() is not None
+        spill = spill and self._journal is not None and not in_transaction
+        if not spill and (not self.started or not self._producer):
             raise RuntimeError("Kafka Producer ist nicht gestartet")
 
         trace_ctx = trace_ctx or TraceContextUtil.get()
@@ -72,13 +454,44 @@ class KafkaProducerService:
             span.set_attribute("messaging.message_payload_size_bytes", len(value))
 
             logger.debug("📤 Sende Kafka-Event an '{}': {}", topic, payload)
-            await self._producer.send_and_wait(
-                topic, value=value, headers=kafka_headers
-            )
+            if not spill:
+                # Innerhalb von transaction() über den transaktionalen Producer senden
+                producer = _transaction_producer.get() or self._producer_for(batched)
+                return await producer.send(topic, value=value, headers=kafka_headers)
+
+            record = SpilledRecord(topic=topic, value=value, headers=kafka_headers)
+            # Solange das Journal nicht leer ist, dahinter einreihen (Reihenfolge)
+            if not self.started or self._journal.pending_records:
+                if not self._spill(record):
+                    raise RuntimeError("Kafka nicht erreichbar und Spill-Journal voll")
+                span.set_attribute("messaging.spilled", True)
+                done = asyncio.get_running_loop().create_future()
+                done.set_result(None)
+                return done
+            try:
+                future = await self._producer_for(batched).send(
+                    topic, value=value, headers=kafka_headers
+                )
+            except Exception as e:
+                future = asyncio.get_running_loop().create_future()
+                future.set_exception(e)
+            return self._spill_on_failure(future, record, batched)
+
+    def _producer_for(self, batched: bool) -> KafkaProducerClient:
+        return self._batch_producer if batched else self._producer
+
+    async def send_log_event(
+        self, log_event: Union[dict, bytes], trace_ctx: TraceContext
+    ) -> None:
+        """Sende strukturierte Log-Events (z. B. von LoggerPlus)."""
+        await (await self.send_log_event_nowait(log_event, trace_ctx))
 
-    async def send_log_event(self, log_event: dict, trace_ctx: TraceContext) -> None:
-        """Sende strukturierte Log-Events (z. B. von LoggerPlus)."""
-        await self.publish(
+    async def send_log_event_nowait(
+        self, log_event: Union[dict, bytes], trace_ctx: TraceContext
+    ) -> asyncio.Future[Optional[RecordMetadata]]:
+        """Log-Event in den Batch legen, ohne auf den Broker zu warten."""
+        # Log-Events nicht ins Spill-Journal: sie würden es bei Ausfällen füllen
+        return await self.publish_nowait(
             topic=self._topic_log,
             payload=log_event,
             trace_ctx=trace_ctx,
@@ -87,4 +500,5 @@ class KafkaProducerService:
                 ("x-event-name", "log"),
                 ("x-event-version", "1.0.0"),
             ],
+            spill=False,
         )
@@ -2,29 +2,50 @@
 
 from typing import Optional
 from inventory.config import env
+from inventory.config.kafka import get_kafka_settings
 from inventory.messaging.handler.release_item_handler import ReleaseItemHandler
 from inventory.messaging.kafka_consumer_service import KafkaConsumerService
 from inventory.messaging.kafka_event_dispatcher import KafkaEventDispatcher
 from inventory.messaging.kafka_producer_service import KafkaProducerService
 from inventory.messaging.kafka_topic_properties import KafkaTopics
 from inventory.messaging.handler.reserve_item_handler import ReserveItemHandler
+from inventory.messaging.transport import (
+    AIOKafkaTransport,
+    InMemoryBroker,
+    InMemoryTransport,
+    KafkaTransport,
+)
 
 # ❌ Kein @lru_cache, damit .start()/.stop() steuerbar bleiben
 _kafka_producer_instance: Optional[KafkaProducerService] = None
 _kafka_consumer_instance: Optional[KafkaConsumerService] = None
+_kafka_transport_instance: Optional[KafkaTransport] = None
+
+
+def get_kafka_transport() -> KafkaTransport:
+    """aiokafka oder - mit `KAFKA_TRANSPORT=memory` - ein gemeinsamer In-Memory-Broker."""
+    global _kafka_transport_instance
+    if _kafka_transport_instance is None:
+        settings = get_kafka_settings()
+        _kafka_transport_instance = (
+            InMemoryTransport(InMemoryBroker(num_partitions=settings.memory_partitions))
+            if settings.transport == "memory"
+            else AIOKafkaTransport()
+        )
+    return _kafka_transport_instance
 
 
 def get_kafka_producer() -> KafkaProducerService:
     global _kafka_producer_instance
     if _kafka_producer_instance is None:
-        _kafka_producer_instance = KafkaProducerService()
+        _kafka_producer_instance = KafkaProducerService(transport=get_kafka_transport())
     return _kafka_producer_instance
 
 
 dispatcher = KafkaEventDispatcher()
 
 
-async def get_kafka_consumer() -> KafkaConsumerService:
+async def get_kafka_consumer(name: str = "consumer") -> KafkaConsumerService:
     dispatcher.register(
     KafkaTopics.inventory_reserve,
     ReserveItemHandler(),
@@ -39,4 +60,7 @@ async def get_kafka_consumer() -> KafkaConsumerService:
         dispatcher=dispatcher,
         topics=[KafkaTopics.inventory_reserve, KafkaTopics.inventory_release],
         bootstrap_servers=env.KAFKA_URI,
+        name=name,
+        transport=get_kafka_transport(),
+        producer=get_kafka_producer(),
     )
@@ -1,3 +1,7 @@
 class KafkaTopics:
     inventory_reserve = "inventory.reserve-item.shopping-cart"
     inventory_release = "inventory.release-item.shopping-cart"
+    product_created = "inventory.create-product.product"
+    product_updated = "inventory.update-product.product"
+    product_deleted = "inventory.delete-product.product"
+    response_cache_invalidated = "inventory.invalidate-response-cache.inventory"
@@ -0,0 +1,321 @@
+"""Lokales Journal für Kafka-Nachrichten, die während eines Broker-Ausfalls nicht gesendet werden können.
+
+Die Nachrichten werden append-only in Segment-Dateien fester Größe geschrieben,
+die per `mmap` eingeblendet sind. Jeder Record hat den Aufbau
+
+    Länge (4 Byte) | CRC32 (4 Byte) | Flag (1 Byte) | Nutzdaten
+
+Nach dem erfolgreichen Nachsenden wird nur das Flag des Records gesetzt; ein
+vollständig nachgesendetes Segment wird gelöscht. Beim Start werden vorhandene
+Segmente eingelesen, d.h. auch nach einem Neustart werden die Nachrichten in
+der ursprünglichen Reihenfolge nachgesendet.
+
+Jeder Prozess schreibt in ein eigenes Verzeichnis `<owner>-<pid>`, das per
+Dateisperre belegt ist. Verzeichnisse desselben `owner`, deren Sperre frei ist,
+stammen von beendeten Prozessen: ihre Segmente werden beim Öffnen übernommen.
+`append` schreibt nur in den Page Cache, `sync` schreibt geänderte Segmente
+auf den Datenträger und kann in einem eigenen Thread laufen.
+"""
+
+from contextlib import suppress
+import mmap
+import os
+import struct
+import threading
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Final, Optional
+
+from loguru import logger
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+__all__ = ["SpillJournal", "SpilledRecord"]
+
+_RECORD_HEADER: Final = struct.Struct("!IIB")
+_U16: Final = struct.Struct("!H")
+_U32: Final = struct.Struct("!I")
+_FLAG_PENDING: Final = 0
+_FLAG_REPLAYED: Final = 1
+_SEGMENT_PATTERN: Final = "segment-*.log"
+_LOCK_FILE: Final = "journal.lock"
+
+
+def _try_lock(path: Path) -> Optional[BinaryIO]:
+    """Exklusive Sperre ohne Warten; die geöffnete Datei hält die Sperre bis `close()`."""
+    file: Final = path.open("a+b")
+    try:
+        if fcntl is not None:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        file.close()
+        return None
+    return file
+
+
+def _segment_path(directory: Path, seq: int) -> Path:
+    return directory / f"segment-{seq:010d}.log"
+
+
+@dataclass(eq=False, slots=True, kw_only=True)
+class SpilledRecord:
+    """Kafka-Nachricht im Journal."""
+
+    topic: str
+    value: bytes
+    headers: list[tuple[str, bytes]] = field(default_factory=list)
+
+    def encode(self) -> bytes:
+        topic: Final = self.topic.encode()
+        parts: Final = [_U16.pack(len(topic)), topic, _U32.pack(len(self.value)), self.value]
+        parts.append(_U16.pack(len(self.headers)))
+        for key, value in self.headers:
+            key_bytes = key.encode()
+            parts += [_U16.pack(len(key_bytes)), key_bytes, _U32.pack(len(value)), value]
+        return b"".join(parts)
+
+    @classmethod
+    def decode(cls, data: bytes) -> "SpilledRecord":
+        view: Final = memoryview(data)
+        pos = 0
+
+        def _read(length_struct: struct.Struct) -> bytes:
+            nonlocal pos
+            (length,) = length_struct.unpack_from(view, pos)
+            pos += length_struct.size
+            chunk = bytes(view[pos : pos + length])
+            pos += length
+            return chunk
+
+        topic: Final = _read(_U16).decode()
+        value: Final = _read(_U32)
+        (header_count,) = _U16.unpack_from(view, pos)
+        pos += _U16.size
+        headers: Final = [(_read(_U16).decode(), _read(_U32)) for _ in range(header_count)]
+        return cls(topic=topic, value=value, headers=headers)
+
+
+class _Segment:
+    """Segment-Datei fester Größe, per mmap eingeblendet."""
+
+    def __init__(self, path: Path, size: int) -> None:
+        self.path: Final = path
+        self.seq: Final = int(path.stem.split("-")[1])
+        with path.open("a+b") as file:
+            if file.seek(0, 2) < size:
+                file.truncate(size)
+        self._file = path.open("r+b")
+        self.map: Final = mmap.mmap(self._file.fileno(), 0)
+        self.size: Final = len(self.map)
+        self.read_pos = 0
+        self.write_pos = 0
+        self.dirty = False
+
+    def records(self) -> list[tuple[int, int, int]]:
+        """Gültige Records als (Position, Länge, Flag) bis zum ersten leeren/defekten Eintrag."""
+        result: Final[list[tuple[int, int, int]]] = []
+        pos = 0
+        while pos + _RECORD_HEADER.size <= self.size:
+            length, crc, flag = _RECORD_HEADER.unpack_from(self.map, pos)
+            start = pos + _RECORD_HEADER.size
+            if length == 0 or start + length > self.size:
+                break
+            if zlib.crc32(self.map[start : start + length]) != crc:
+                logger.warning("⚠️ Spill-Journal: defekter Record in {} bei {}", self.path.name, pos)
+                break
+            result.append((pos, length, flag))
+            pos = start + length
+        return result
+
+    def close(self) -> None:
+        self.map.close()
+        self._file.close()
+
+
+class SpillJournal:
+    """Begrenztes Journal aus mmap-Segmenten: anhängen, der Reihe nach lesen und quittieren."""
+
+    def __init__(self, base_dir: Path, owner: str, segment_bytes: int, max_bytes: int) -> None:
+        """
+        :param base_dir: Gemeinsames Verzeichnis der Journale
+        :param owner: Kennung des Producers, z.B. `<client_id>-<hostname>`
+        """
+        self._base_dir: Final = base_dir
+        self._owner: Final = owner
+        self._directory: Final = base_dir / f"{owner}-{os.getpid()}"
+        self._segment_bytes: Final = segment_bytes
+        self._max_segments: Final = max(max_bytes // segment_bytes, 1)
+        self._segments: list[_Segment] = []
+        self._lock_file: Optional[BinaryIO] = None
+        # sync() im Thread vs. Schließen der Segmente im Event Loop
+        self._sync_lock: Final = threading.Lock()
+        self.pending_records = 0
+        self.pending_bytes = 0
+
+    @property
+    def directory(self) -> Path:
+        """Verzeichnis dieses Prozesses."""
+        return self._directory
+
+    @property
+    def dirty(self) -> bool:
+        """Flag, ob Records seit dem letzten `sync` noch nicht auf dem Datenträger sind."""
+        return any(segment.dirty for segment in self._segments)
+
+    @property
+    def size_bytes(self) -> int:
+        """Belegter Speicher der Segment-Dateien."""
+        return sum(segment.size for segment in self._segments)
+
+    def open(self) -> None:
+        """Verzeichnis sperren, Segmente beendeter Prozesse übernehmen und alle Segmente einlesen.
+
+        :raises RuntimeError: Falls das Verzeichnis von einem anderen Prozess gesperrt ist
+        """
+        if self._lock_file is not None:
+            return
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._lock_file = _try_lock(self._directory / _LOCK_FILE)
+        if self._lock_file is None:
+            raise RuntimeError(f"Spill-Journal {self._directory} ist von einem anderen Prozess belegt")
+        self._adopt_orphans()
+
+        self.pending_records = 0
+        self.pending_bytes = 0
+        for path in sorted(self._directory.glob(_SEGMENT_PATTERN)):
+            segment = _Segment(path, self._segment_bytes)
+            records = segment.records()
+            segment.write_pos = (
+                records[-1][0] + _RECORD_HEADER.size + records[-1][1] if records else 0
+            )
+            pending = [(pos, length) for pos, length, flag in records if flag == _FLAG_PENDING]
+            segment.read_pos = pending[0][0] if pending else segment.write_pos
+            self.pending_records += len(pending)
+            self.pending_bytes += sum(length for _, length in pending)
+            self._segments.append(segment)
+        self._drop_replayed_segments()
+        if self.pending_records:
+            logger.info(
+                "💾 Spill-Journal: {} Nachrichten aus {} Segmenten wiederhergestellt",
+                self.pending_records,
+                len(self._segments),
+            )
+
+    def close(self) -> None:
+        with self._sync_lock:
+            for segment in self._segments:
+                segment.map.flush()
+                segment.close()
+            self._segments = []
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    def sync(self) -> None:
+        """Geänderte Segmente auf den Datenträger schreiben (msync), blockiert den Aufrufer."""
+        with self._sync_lock:
+            for segment in self._segments:
+                if segment.dirty:
+                    # Vor dem Schreiben zurücksetzen: spätere Änderungen bleiben markiert
+                    segment.dirty = False
+                    segment.map.flush()
+
+    def append(self, record: SpilledRecord) -> bool:
+        """Record anhängen.
+
+        :return: False, falls das Journal voll ist oder der Record zu groß
+        :rtype: bool
+        """
+        self.open()
+        payload: Final = record.encode()
+        needed: Final = _RECORD_HEADER.size + len(payload)
+        if needed > self._segment_bytes:
+            return False
+
+        segment = self._segments[-1] if self._segments else None
+        if segment is None or segment.write_pos + needed > segment.size:
+            if len(self._segments) >= self._max_segments:
+                return False
+            segment = self._new_segment()
+
+        pos: Final = segment.write_pos
+        _RECORD_HEADER.pack_into(segment.map, pos, len(payload), zlib.crc32(payload), _FLAG_PENDING)
+        segment.map[pos + _RECORD_HEADER.size : pos + needed] = payload
+        segment.dirty = True
+        segment.write_pos += needed
+        self.pending_records += 1
+        self.pending_bytes += len(payload)
+        return True
+
+    def peek(self) -> Optional[SpilledRecord]:
+        """Ältesten noch nicht quittierten Record lesen."""
+        self._drop_replayed_segments()
+        if not self._segments:
+            return None
+        segment: Final = self._segments[0]
+        if segment.read_pos >= segment.write_pos:
+            return None
+        length, _, _ = _RECORD_HEADER.unpack_from(segment.map, segment.read_pos)
+        start: Final = segment.read_pos + _RECORD_HEADER.size
+        return SpilledRecord.decode(segment.map[start : start + length])
+
+    def ack(self) -> None:
+        """Den mit `peek` gelesenen Record als nachgesendet markieren."""
+        segment: Final = self._segments[0]
+        length, _, _ = _RECORD_HEADER.unpack_from(segment.map, segment.read_pos)
+        # Flag liegt hinter Länge und CRC
+        segment.map[segment.read_pos + 8] = _FLAG_REPLAYED
+        segment.dirty = True
+        segment.read_pos += _RECORD_HEADER.size + length
+        self.pending_records -= 1
+        self.pending_bytes -= length
+        self._drop_replayed_segments()
+
+    def _new_segment(self) -> _Segment:
+        seq: Final = self._segments[-1].seq + 1 if self._segments else 0
+        segment: Final = _Segment(_segment_path(self._directory, seq), self._segment_bytes)
+        self._segments.append(segment)
+        return segment
+
+    def _adopt_orphans(self) -> None:
+        """Segmente aus nicht gesperrten Verzeichnissen desselben `owner` hinten anfügen."""
+        own: Final = sorted(self._directory.glob(_SEGMENT_PATTERN))
+        seq = int(own[-1].stem.split("-")[1]) + 1 if own else 0
+        for directory in sorted(self._base_dir.glob(f"{self._owner}-*")):
+            pid = directory.name.removeprefix(f"{self._owner}-")
+            if directory == self._directory or not pid.isdigit() or not directory.is_dir():
+                continue
+            lock_file = _try_lock(directory / _LOCK_FILE)
+            if lock_file is None:
+                # Der Prozess läuft noch
+                continue
+            try:
+                paths = sorted(directory.glob(_SEGMENT_PATTERN))
+                for path in paths:
+                    path.rename(_segment_path(self._directory, seq))
+                    seq += 1
+            finally:
+                lock_file.close()
+            with suppress(OSError):
+                (directory / _LOCK_FILE).unlink()
+                directory.rmdir()
+            if paths:
+                logger.info(
+                    "💾 Spill-Journal: {} Segmente aus {} übernommen", len(paths), directory.name
+                )
+
+    def _drop_replayed_segments(self) -> None:
+        """Vollständig nachgesendete Segmente schließen und löschen."""
+        while self._segments and self._segments[0].read_pos >= self._segments[0].write_pos:
+            with self._sync_lock:
+                segment = self._segments.pop(0)
+                segment.close()
+            segment.path.unlink(missing_ok=True)
@@ -0,0 +1,18 @@
+"""Austauschbare Transportschicht für Kafka: aiokafka oder In-Memory-Broker."""
+
+from inventory.messaging.transport.aiokafka_transport import AIOKafkaTransport
+from inventory.messaging.transport.base import (
+    KafkaConsumerClient,
+    KafkaProducerClient,
+    KafkaTransport,
+)
+from inventory.messaging.transport.memory import InMemoryBroker, InMemoryTransport
+
+__all__ = [
+    "AIOKafkaTransport",
+    "InMemoryBroker",
+    "InMemoryTransport",
+    "KafkaConsumerClient",
+    "KafkaProducerClient",
+    "KafkaTransport",
+]
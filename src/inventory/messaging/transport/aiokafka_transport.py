@@ -0,0 +1,17 @@
+"""Transport über einen echten Kafka-Broker mit aiokafka."""
+
+from typing import Any
+
+from aiokafka import AIOKafkaConsumer, AIOKafkaProducer
+
+__all__ = ["AIOKafkaTransport"]
+
+
+class AIOKafkaTransport:
+    """Erzeugt `AIOKafkaConsumer` und `AIOKafkaProducer` mit der übergebenen Konfiguration."""
+
+    def create_consumer(self, **config: Any) -> AIOKafkaConsumer:
+        return AIOKafkaConsumer(**config)
+
+    def create_producer(self, **config: Any) -> AIOKafkaProducer:
+        return AIOKafkaProducer(**config)
@@ -0,0 +1,103 @@
+"""Schnittstellen, die KafkaConsumerService und KafkaProducerService benötigen."""
+
+import asyncio
+from collections.abc import Iterable, Mapping
+from typing import Any, Protocol
+
+from aiokafka import ConsumerRebalanceListener, ConsumerRecord, TopicPartition
+from aiokafka.structs import RecordMetadata
+
+__all__ = ["KafkaConsumerClient", "KafkaProducerClient", "KafkaTransport"]
+
+
+class KafkaConsumerClient(Protocol):
+    """Teilmenge von `AIOKafkaConsumer`, die vom KafkaConsumerService genutzt wird."""
+
+    def subscribe(
+        self,
+        topics: Iterable[str] = (),
+        pattern: str | None = None,
+        listener: ConsumerRebalanceListener | None = None,
+    ) -> None: ...
+
+    async def start(self) -> None: ...
+
+    async def stop(self) -> None: ...
+
+    async def getmany(
+        self,
+        *partitions: TopicPartition,
+        timeout_ms: int = 0,
+        max_records: int | None = None,
+    ) -> dict[TopicPartition, list[ConsumerRecord]]: ...
+
+    async def commit(self, offsets: Mapping[TopicPartition, Any] | None = None) -> None: ...
+
+    def assignment(self) -> set[TopicPartition]: ...
+
+    def pause(self, *partitions: TopicPartition) -> None: ...
+
+    def resume(self, *partitions: TopicPartition) -> None: ...
+
+    def paused(self) -> set[TopicPartition]: ...
+
+    def highwater(self, partition: TopicPartition) -> int | None: ...
+
+    def seek(self, partition: TopicPartition, offset: int) -> None: ...
+
+    async def position(self, partition: TopicPartition) -> int: ...
+
+    async def end_offsets(
+        self,
+        partitions: Iterable[TopicPartition],
+    ) -> dict[TopicPartition, int]: ...
+
+
+class KafkaProducerClient(Protocol):
+    """Teilmenge von `AIOKafkaProducer`, die vom KafkaProducerService genutzt wird."""
+
+    async def start(self) -> None: ...
+
+    async def stop(self) -> None: ...
+
+    async def send(
+        self,
+        topic: str,
+        value: bytes | None = None,
+        key: bytes | None = None,
+        partition: int | None = None,
+        timestamp_ms: int | None = None,
+        headers: list[tuple[str, bytes]] | None = None,
+    ) -> asyncio.Future[RecordMetadata]: ...
+
+    async def send_and_wait(
+        self,
+        topic: str,
+        value: bytes | None = None,
+        key: bytes | None = None,
+        partition: int | None = None,
+        timestamp_ms: int | None = None,
+        headers: list[tuple[str, bytes]] | None = None,
+    ) -> RecordMetadata: ...
+
+    async def flush(self) -> None: ...
+
+    async def begin_transaction(self) -> None: ...
+
+    async def commit_transaction(self) -> None: ...
+
+    async def abort_transaction(self) -> None: ...
+
+    async def send_offsets_to_transaction(
+        self,
+        offsets: Mapping[TopicPartition, Any],
+        group_id: str,
+    ) -> None: ...
+
+
+class KafkaTransport(Protocol):
+    """Fabrik für Consumer und Producer, z.B. aiokafka oder der In-Memory-Broker."""
+
+    def create_consumer(self, **config: Any) -> KafkaConsumerClient: ...
+
+    def create_producer(self, **config: Any) -> KafkaProducerClient: ...
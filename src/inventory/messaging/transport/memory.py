@@ -0,0 +1,418 @@
+"""In-Process-Broker als Ersatz für Kafka in Tests und Benchmarks.
+
+Unterstützt Topics mit mehreren Partitionen, Offsets, Consumer Groups mit
+Round-Robin-Zuweisung der Partitionen inkl. Rebalance-Callbacks sowie
+committete Offsets je Group. Persistenz, Replikation und Kompression entfallen.
+Transaktionen committen die Offsets atomar, Nachrichten sind aber sofort
+sichtbar (keine Isolation wie bei `read_committed`).
+"""
+
+import asyncio
+import zlib
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from itertools import count
+from time import time
+from typing import Any, Final
+
+from aiokafka import ConsumerRebalanceListener, ConsumerRecord, TopicPartition
+from aiokafka.structs import OffsetAndMetadata, RecordMetadata
+from loguru import logger
+
+__all__ = ["InMemoryBroker", "InMemoryConsumer", "InMemoryProducer", "InMemoryTransport"]
+
+_TIMESTAMP_TYPE_CREATE_TIME: Final = 0
+
+
+@dataclass(eq=False, slots=True, kw_only=True)
+class _Group:
+    """Mitglieder und committete Offsets einer Consumer Group."""
+
+    members: list["InMemoryConsumer"] = field(default_factory=list)
+    committed: dict[TopicPartition, int] = field(default_factory=dict)
+
+
+class InMemoryBroker:
+    """Broker im selben Prozess: Topics → Partitionen → Liste von Records."""
+
+    def __init__(self, num_partitions: int = 3) -> None:
+        self.num_partitions: Final = num_partitions
+        self._logs: dict[TopicPartition, list[ConsumerRecord]] = {}
+        self._groups: dict[str, _Group] = {}
+        self._round_robin = count()
+        self._data_event = asyncio.Event()
+        self._rebalance_lock = asyncio.Lock()
+
+    # ------------------------------------------------------------------
+    # Topics und Records
+    # ------------------------------------------------------------------
+    def partitions_for(self, topic: str) -> list[TopicPartition]:
+        """Partitionen eines Topics, das Topic wird ggf. angelegt."""
+        partitions: Final = [
+            TopicPartition(topic, partition) for partition in range(self.num_partitions)
+        ]
+        for tp in partitions:
+            self._logs.setdefault(tp, [])
+        return partitions
+
+    def append(
+        self,
+        topic: str,
+        value: bytes | None,
+        key: bytes | None = None,
+        partition: int | None = None,
+        timestamp_ms: int | None = None,
+        headers: Iterable[tuple[str, bytes]] | None = None,
+    ) -> RecordMetadata:
+        """Record an eine Partition anhängen, wie ein Kafka-Producer mit acks=all."""
+        partitions: Final = self.partitions_for(topic)
+        if partition is None:
+            partition = (
+                zlib.crc32(key) % self.num_partitions
+                if key is not None
+                else next(self._round_robin) % self.num_partitions
+            )
+        tp: Final = partitions[partition]
+        log: Final = self._logs[tp]
+        offset: Final = len(log)
+        timestamp: Final = timestamp_ms if timestamp_ms is not None else int(time() * 1000)
+        log.append(
+            ConsumerRecord(
+                topic=topic,
+                partition=partition,
+                offset=offset,
+                timestamp=timestamp,
+                timestamp_type=_TIMESTAMP_TYPE_CREATE_TIME,
+                key=key,
+                value=value,
+                checksum=None,
+                serialized_key_size=len(key) if key is not None else -1,
+                serialized_value_size=len(value) if value is not None else -1,
+                headers=tuple(headers or ()),
+            ),
+        )
+
+        # Wartende Consumer wecken
+        self._data_event.set()
+        self._data_event = asyncio.Event()
+
+        return RecordMetadata(
+            topic=topic,
+            partition=partition,
+            topic_partition=tp,
+            offset=offset,
+            timestamp=timestamp,
+            timestamp_type=_TIMESTAMP_TYPE_CREATE_TIME,
+            log_start_offset=0,
+        )
+
+    def fetch(self, tp: TopicPartition, position: int, max_records: int) -> list[ConsumerRecord]:
+        """Records ab `position` lesen."""
+        return self._logs.get(tp, [])[position : position + max_records]
+
+    def highwater(self, tp: TopicPartition) -> int:
+        """Offset des nächsten Records, der geschrieben wird."""
+        return len(self._logs.get(tp, ()))
+
+    async def wait_for_data(self, timeout_s: float) -> None:
+        """Warten, bis ein neuer Record geschrieben wurde oder das Timeout abläuft."""
+        event: Final = self._data_event
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout_s)
+        except TimeoutError:
+            pass
+
+    # ------------------------------------------------------------------
+    # Consumer Groups
+    # ------------------------------------------------------------------
+    def committed(self, group_id: str, tp: TopicPartition) -> int | None:
+        """Committeter Offset einer Group für eine Partition."""
+        group: Final = self._groups.get(group_id)
+        return group.committed.get(tp) if group else None
+
+    def commit(self, group_id: str, offsets: Mapping[TopicPartition, int]) -> None:
+        """Offsets einer Group speichern."""
+        self._groups.setdefault(group_id, _Group()).committed.update(offsets)
+
+    async def join(self, consumer: "InMemoryConsumer") -> None:
+        """Consumer tritt seiner Group bei, danach werden die Partitionen neu verteilt."""
+        if consumer.group_id is None:
+            await consumer.reassign(self._all_partitions(consumer.topics))
+            return
+        async with self._rebalance_lock:
+            group: Final = self._groups.setdefault(consumer.group_id, _Group())
+            group.members.append(consumer)
+            await self._rebalance(group)
+
+    async def leave(self, consumer: "InMemoryConsumer") -> None:
+        """Consumer verlässt seine Group, die übrigen Mitglieder übernehmen."""
+        if consumer.group_id is None:
+            await consumer.reassign([])
+            return
+        async with self._rebalance_lock:
+            group: Final = self._groups.get(consumer.group_id)
+            if group is None or consumer not in group.members:
+                return
+            await consumer.reassign([])
+            group.members.remove(consumer)
+            await self._rebalance(group)
+
+    def _all_partitions(self, topics: Iterable[str]) -> list[TopicPartition]:
+        return [tp for topic in sorted(topics) for tp in self.partitions_for(topic)]
+
+    async def _rebalance(self, group: _Group) -> None:
+        """Eager Rebalance: alles entziehen, dann Round-Robin neu zuweisen."""
+        for member in group.members:
+            await member.reassign([])
+
+        assignments: Final[dict[InMemoryConsumer, list[TopicPartition]]] = {
+            member: [] for member in group.members
+        }
+        for index, tp in enumerate(
+            self._all_partitions({t for m in group.members for t in m.topics}),
+        ):
+            candidates = [m for m in group.members if tp.topic in m.topics]
+            if candidates:
+                assignments[candidates[index % len(candidates)]].append(tp)
+
+        for member, partitions in assignments.items():
+            await member.reassign(partitions)
+        logger.debug("🧪 InMemoryBroker: Rebalance mit {} Mitgliedern", len(group.members))
+
+
+class InMemoryConsumer:
+    """Consumer mit der API-Teilmenge von `AIOKafkaConsumer`."""
+
+    def __init__(
+        self,
+        broker: InMemoryBroker,
+        *topics: str,
+        group_id: str | None = None,
+        auto_offset_reset: str = "latest",
+        enable_auto_commit: bool = True,
+        **_ignored: Any,
+    ) -> None:
+        self._broker: Final = broker
+        self.group_id: Final = group_id
+        self.topics: set[str] = set(topics)
+        self._auto_offset_reset: Final = auto_offset_reset
+        self._enable_auto_commit: Final = enable_auto_commit
+        self._listener: ConsumerRebalanceListener | None = None
+        self._assignment: set[TopicPartition] = set()
+        self._positions: dict[TopicPartition, int] = {}
+        self._paused: set[TopicPartition] = set()
+
+    def subscribe(
+        self,
+        topics: Iterable[str] = (),
+        pattern: str | None = None,
+        listener: ConsumerRebalanceListener | None = None,
+    ) -> None:
+        if pattern is not None:
+            # Topics entstehen erst beim 1. Zugriff, d.h. ein Pattern wäre nie vollständig
+            raise ValueError(
+                "InMemoryConsumer unterstützt kein subscribe(pattern=...): "
+                "die Topics explizit angeben",
+            )
+        self.topics = set(topics)
+        self._listener = listener
+
+    async def start(self) -> None:
+        await self._broker.join(self)
+
+    async def stop(self) -> None:
+        await self._broker.leave(self)
+
+    async def reassign(self, partitions: Iterable[TopicPartition]) -> None:
+        """Vom Broker aufgerufen: Zuweisung ändern und den Listener informieren."""
+        if self._assignment and self._listener is not None:
+            await self._listener.on_partitions_revoked(set(self._assignment))
+        if self._assignment and self._enable_auto_commit:
+            await self.commit()
+
+        self._assignment = set(partitions)
+        self._paused &= self._assignment
+        self._positions = {tp: self._initial_position(tp) for tp in self._assignment}
+
+        if self._assignment and self._listener is not None:
+            await self._listener.on_partitions_assigned(set(self._assignment))
+
+    def _initial_position(self, tp: TopicPartition) -> int:
+        committed: Final = (
+            self._broker.committed(self.group_id, tp) if self.group_id else None
+        )
+        if committed is not None:
+            return committed
+        return 0 if self._auto_offset_reset == "earliest" else self._broker.highwater(tp)
+
+    async def getmany(
+        self,
+        *partitions: TopicPartition,
+        timeout_ms: int = 0,
+        max_records: int | None = None,
+    ) -> dict[TopicPartition, list[ConsumerRecord]]:
+        result = self._fetch(partitions, max_records)
+        if not result and timeout_ms > 0:
+            await self._broker.wait_for_data(timeout_ms / 1000)
+            result = self._fetch(partitions, max_records)
+        if result and self._enable_auto_commit:
+            await self.commit()
+        return result
+
+    def _fetch(
+        self,
+        partitions: Iterable[TopicPartition],
+        max_records: int | None,
+    ) -> dict[TopicPartition, list[ConsumerRecord]]:
+        remaining = max_records if max_records is not None else 500
+        result: dict[TopicPartition, list[ConsumerRecord]] = {}
+        for tp in sorted(set(partitions) or self._assignment):
+            if remaining <= 0:
+                break
+            if tp in self._paused or tp not in self._assignment:
+                continue
+            records = self._broker.fetch(tp, self._positions[tp], remaining)
+            if records:
+                result[tp] = records
+                self._positions[tp] += len(records)
+                remaining -= len(records)
+        return result
+
+    async def commit(self, offsets: Mapping[TopicPartition, Any] | None = None) -> None:
+        if self.group_id is None:
+            return
+        if offsets is None:
+            offsets = dict(self._positions)
+        self._broker.commit(
+            self.group_id,
+            {
+                tp: offset.offset if isinstance(offset, OffsetAndMetadata) else offset
+                for tp, offset in offsets.items()
+            },
+        )
+
+    def assignment(self) -> set[TopicPartition]:
+        return set(self._assignment)
+
+    def pause(self, *partitions: TopicPartition) -> None:
+        self._paused |= set(partitions) & self._assignment
+
+    def resume(self, *partitions: TopicPartition) -> None:
+        self._paused -= set(partitions)
+
+    def paused(self) -> set[TopicPartition]:
+        return set(self._paused)
+
+    def highwater(self, partition: TopicPartition) -> int | None:
+        return self._broker.highwater(partition)
+
+    def seek(self, partition: TopicPartition, offset: int) -> None:
+        if partition in self._assignment:
+            self._positions[partition] = offset
+
+    async def position(self, partition: TopicPartition) -> int:
+        return self._positions[partition]
+
+    async def end_offsets(
+        self,
+        partitions: Iterable[TopicPartition],
+    ) -> dict[TopicPartition, int]:
+        return {tp: self._broker.highwater(tp) for tp in partitions}
+
+
+class InMemoryProducer:
+    """Producer mit der API-Teilmenge von `AIOKafkaProducer`."""
+
+    def __init__(
+        self,
+        broker: InMemoryBroker,
+        transactional_id: str | None = None,
+        **_ignored: Any,
+    ) -> None:
+        self._broker: Final = broker
+        self._transactional_id: Final = transactional_id
+        self._in_transaction = False
+        self._pending_offsets: dict[str, dict[TopicPartition, int]] = {}
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def send(
+        self,
+        topic: str,
+        value: bytes | None = None,
+        key: bytes | None = None,
+        partition: int | None = None,
+        timestamp_ms: int | None = None,
+        headers: list[tuple[str, bytes]] | None = None,
+    ) -> asyncio.Future[RecordMetadata]:
+        future: Final[asyncio.Future[RecordMetadata]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        future.set_result(
+            self._broker.append(topic, value, key, partition, timestamp_ms, headers),
+        )
+        return future
+
+    async def send_and_wait(
+        self,
+        topic: str,
+        value: bytes | None = None,
+        key: bytes | None = None,
+        partition: int | None = None,
+        timestamp_ms: int | None = None,
+        headers: list[tuple[str, bytes]] | None = None,
+    ) -> RecordMetadata:
+        return await (await self.send(topic, value, key, partition, timestamp_ms, headers))
+
+    async def flush(self) -> None:
+        pass
+
+    async def begin_transaction(self) -> None:
+        if self._transactional_id is None:
+            raise RuntimeError("Producer ohne transactional_id")
+        if self._in_transaction:
+            raise RuntimeError("Transaktion läuft bereits")
+        self._in_transaction = True
+
+    async def commit_transaction(self) -> None:
+        for group_id, offsets in self._pending_offsets.items():
+            self._broker.commit(group_id, offsets)
+        self._end_transaction()
+
+    async def abort_transaction(self) -> None:
+        self._end_transaction()
+
+    async def send_offsets_to_transaction(
+        self,
+        offsets: Mapping[TopicPartition, Any],
+        group_id: str,
+    ) -> None:
+        if not self._in_transaction:
+            raise RuntimeError("Keine laufende Transaktion")
+        self._pending_offsets.setdefault(group_id, {}).update(
+            {
+                tp: offset.offset if isinstance(offset, OffsetAndMetadata) else offset
+                for tp, offset in offsets.items()
+            },
+        )
+
+    def _end_transaction(self) -> None:
+        self._in_transaction = False
+        self._pending_offsets = {}
+
+
+class InMemoryTransport:
+    """Transport, der Consumer und Producer an einen gemeinsamen InMemoryBroker bindet."""
+
+    def __init__(self, broker: InMemoryBroker | None = None) -> None:
+        self.broker: Final = broker or InMemoryBroker()
+
+    def create_consumer(self, *topics: str, **config: Any) -> InMemoryConsumer:
+        return InMemoryConsumer(self.broker, *topics, **config)
+
+    def create_producer(self, **config: Any) -> InMemoryProducer:
+        return InMemoryProducer(self.broker, **config)
@@ -0,0 +1,105 @@
+"""Typisierte Kafka-Events zum Reservieren und Freigeben von Inventar-Artikeln."""
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any, Final
+
+import orjson
+
+__all__ = [
+    "EVENT_VERSION_HEADER",
+    "InvalidEventError",
+    "InventoryItemEvent",
+    "decode_inventory_item_event",
+]
+
+EVENT_VERSION_HEADER: Final = "x-event-version"
+"""Kafka-Header mit der Schema-Version des Events, z.B. '1.0.0'."""
+
+DEFAULT_EVENT_VERSION: Final = 1
+"""Schema-Version, falls der Producer keinen Versions-Header mitsendet."""
+
+
+class InvalidEventError(ValueError):
+    """Exception, falls ein Kafka-Event nicht zum erwarteten Schema passt."""
+
+
+@dataclass(eq=False, slots=True, kw_only=True)
+class InventoryItemEvent:
+    """Event für das Reservieren oder Freigeben eines Inventar-Artikels."""
+
+    inventory_id: str
+    """ID des betroffenen Inventars."""
+
+    quantity: int
+    """Anzahl der zu reservierenden bzw. freizugebenden Artikel."""
+
+    customer_id: str
+    """ID des Kunden, der mit der Reservierung verknüpft ist."""
+
+    version: int
+    """Schema-Version (Major), mit der das Event dekodiert wurde."""
+
+
+def _decode_v1(payload: Mapping[str, Any]) -> InventoryItemEvent:
+    """Schema v1: `{"item": {"inventoryId", "quantity"}, "customerId"}`."""
+    item: Final = payload["item"]
+    return InventoryItemEvent(
+        inventory_id=str(item["inventoryId"]),
+        quantity=int(item["quantity"]),
+        customer_id=str(payload["customerId"]),
+        version=1,
+    )
+
+
+def _decode_v2(payload: Mapping[str, Any]) -> InventoryItemEvent:
+    """Schema v2: flach `{"inventoryId", "quantity", "customerId"}`."""
+    return InventoryItemEvent(
+        inventory_id=str(payload["inventoryId"]),
+        quantity=int(payload["quantity"]),
+        customer_id=str(payload["customerId"]),
+        version=2,
+    )
+
+
+_DECODERS: Final[dict[int, Callable[[Mapping[str, Any]], InventoryItemEvent]]] = {
+    1: _decode_v1,
+    2: _decode_v2,
+}
+"""Decoder je Major-Version des Event-Schemas."""
+
+
+def _major_version(headers: Mapping[str, str] | None) -> int:
+    raw: Final = headers.get(EVENT_VERSION_HEADER) if headers else None
+    if not raw:
+        return DEFAULT_EVENT_VERSION
+    try:
+        return int(raw.split(".", 1)[0])
+    except ValueError as err:
+        raise InvalidEventError(f"Ungültige Event-Version: {raw}") from err
+
+
+def decode_inventory_item_event(
+    value: bytes,
+    headers: Mapping[str, str] | None = None,
+) -> InventoryItemEvent:
+    """Rohe Kafka-Nachricht in einem Durchlauf in ein `InventoryItemEvent` dekodieren.
+
+    :param value: Nachricht als UTF-8-kodiertes JSON
+    :param headers: Bereits dekodierte Kafka-Header
+    :return: Das typisierte Event
+    :rtype: InventoryItemEvent
+    :raises InvalidEventError: Falls JSON, Version oder Felder ungültig sind
+    """
+    version: Final = _major_version(headers)
+    decoder: Final = _DECODERS.get(version)
+    if decoder is None:
+        raise InvalidEventError(f"Nicht unterstützte Event-Version: {version}")
+
+    try:
+        payload: Final = orjson.loads(value)
+        return decoder(payload)
+    except orjson.JSONDecodeError as err:
+        raise InvalidEventError(f"Ungültiges JSON: {err}") from err
+    except (KeyError, TypeError, ValueError) as err:
+        raise InvalidEventError(f"Fehlendes oder ungültiges Feld: {err}") from err
@@ -0,0 +1,48 @@
+"""Typisierte Kafka-Events des Product-Service für das lokale Read Model."""
+
+from dataclasses import dataclass
+from typing import Final, Optional
+
+import orjson
+
+from inventory.model.dto.inventory_item_event import InvalidEventError
+
+__all__ = ["ProductEvent", "decode_product_event"]
+
+
+@dataclass(eq=False, slots=True, kw_only=True)
+class ProductEvent:
+    """Event für ein neu angelegtes, geändertes oder gelöschtes Produkt."""
+
+    product_id: str
+    """ID des betroffenen Produkts."""
+
+    name: Optional[str]
+    """Aktueller Name des Produkts, None bei einem gelöschten Produkt."""
+
+    deleted: bool
+    """Flag, ob das Produkt gelöscht wurde."""
+
+
+def decode_product_event(value: bytes | None, deleted: bool = False) -> ProductEvent:
+    """Rohe Kafka-Nachricht des Product-Service dekodieren.
+
+    Erwartet `{"id" | "productId", "name"}`, bei gelöschten Produkten genügt die ID.
+
+    :param value: Nachricht als UTF-8-kodiertes JSON
+    :param deleted: Flag, ob die Nachricht aus dem Topic für gelöschte Produkte stammt
+    :return: Das typisierte Event
+    :rtype: ProductEvent
+    :raises InvalidEventError: Falls JSON oder Felder ungültig sind
+    """
+    if value is None:
+        raise InvalidEventError("Leere Nachricht")
+    try:
+        payload: Final = orjson.loads(value)
+        product_id: Final = payload.get("id") or payload["productId"]
+        name: Final = None if deleted else str(payload["name"])
+    except orjson.JSONDecodeError as err:
+        raise InvalidEventError(f"Ungültiges JSON: {err}") from err
+    except (AttributeError, KeyError, TypeError) as err:
+        raise InvalidEventError(f"Fehlendes oder ungültiges Feld: {err}") from err
+    return ProductEvent(product_id=str(product_id), name=name, deleted=deleted)
@@ -1,5 +1,6 @@
 """Entity-Klasse für Inventory data."""
 
+from collections.abc import Awaitable
 from dataclasses import InitVar
 from datetime import date, datetime
 from decimal import Decimal
@@ -13,11 +14,13 @@ from sqlalchemy import JSON, Identity, String, func
 from sqlalchemy.orm import Mapped, mapped_column, reconstructor, relationship
 import strawberry
 
+from inventory.graphql.permissions import IsAdminOrUser
 from inventory.model.entity.base import Base
-from inventory.model.entity.reserved_item import Reserved_item
+from inventory.model.entity.reserved_item import ReserveInventoryItemType, Reserved_item
 from inventory.model.enum.inventory_status_type import InventoryStatusType
+from inventory.model.types.product_type import ProductType
 
-@strawberry.type
+@strawberry.federation.type(keys=["id", "skuCode"])
 class InventoryType:
     id: str | None
     version: int
@@ -26,10 +29,43 @@ class InventoryType:
     unit_price: float
     status: InventoryStatusType
     product_id: str | None
-    product_name: str | None
+    product_name: str | None = strawberry.field(
+        deprecation_reason="Über `product { name }` aus dem Product-Subgraph lesen",
+    )
     created: datetime
     updated: datetime
 
+    @strawberry.field
+    def product(self) -> Optional[ProductType]:
+        """Entity-Referenz, die das Gateway gebündelt beim Product-Subgraph auflöst."""
+        return ProductType(id=strawberry.ID(self.product_id)) if self.product_id else None
+
+    @strawberry.field
+    async def reserved_items(self, info: strawberry.Info) -> list[ReserveInventoryItemType]:
+        """Reservierungen, für alle Inventare eines Requests mit einer DB-Abfrage geladen."""
+        if self.id is None:
+            return []
+        return await info.context["loaders"].reserved_items_by_inventory_id.load(self.id)
+
+    @classmethod
+    def resolve_reference(
+        cls,
+        info: strawberry.Info,
+        **representation: Any,
+    ) -> Awaitable[Optional["InventoryType"]]:
+        """`_entities` für `@key(fields: "id")` und `@key(fields: "skuCode")`.
+
+        Alle Repräsentationen eines Requests werden per DataLoader gebündelt geladen.
+        """
+        permission: Final = IsAdminOrUser()
+        if not permission.has_permission(None, info):
+            permission.on_unauthorized()
+
+        loaders: Final = info.context["loaders"]
+        if "id" in representation:
+            return loaders.inventory_by_id.load(str(representation["id"]))
+        return loaders.inventory_by_sku_code.load(str(representation["skuCode"]))
+
 
 @strawberry.input
 class InventoryInput:
@@ -0,0 +1,31 @@
+"""Entity-Klasse für das lokale Read Model der Produkte."""
+
+from datetime import datetime
+
+from sqlalchemy import String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from inventory.model.entity.base import Base
+
+
+class Product(Base):
+    """Kompakte Kopie eines Produkts aus dem Product-Service: nur ID und Name."""
+
+    __tablename__ = "product"
+
+    product_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    """Die ID des Produkts im Product-Service."""
+
+    name: Mapped[str]
+    """Der aktuelle Name des Produkts."""
+
+    updated: Mapped[datetime | None] = mapped_column(
+        insert_default=func.now(),
+        onupdate=func.now(),
+        default=None,
+    )
+    """Der Zeitstempel des zuletzt verarbeiteten Events."""
+
+    def __repr__(self) -> str:
+        """Ausgabe eines Produkts als String."""
+        return f"Product(product_id={self.product_id}, name={self.name}, updated={self.updated})"
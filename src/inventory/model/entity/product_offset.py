@@ -0,0 +1,28 @@
+"""Entity-Klasse für die gelesenen Offsets des Produkt-Read-Models."""
+
+from sqlalchemy import BigInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from inventory.model.entity.base import Base
+
+
+class ProductOffset(Base):
+    """Nächster zu lesender Offset einer Partition der Product-Topics."""
+
+    __tablename__ = "product_offset"
+
+    topic: Mapped[str] = mapped_column(String(255), primary_key=True)
+    """Das Topic der Partition."""
+
+    partition_id: Mapped[int] = mapped_column(primary_key=True)
+    """Die Nummer der Partition."""
+
+    next_offset: Mapped[int] = mapped_column(BigInteger)
+    """Der Offset nach dem zuletzt übernommenen Event."""
+
+    def __repr__(self) -> str:
+        """Ausgabe eines Offsets als String."""
+        return (
+            f"ProductOffset(topic={self.topic}, partition_id={self.partition_id}, "
+            f"next_offset={self.next_offset})"
+        )
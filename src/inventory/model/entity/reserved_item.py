@@ -1,7 +1,7 @@
 """Entity-Klasse für Reserved_item."""
 
 from datetime import datetime
-from typing import Any, Literal, Self
+from typing import TYPE_CHECKING, Annotated, Any, Literal, Self
 import uuid
 
 from sqlalchemy import ForeignKey, String, func
@@ -11,6 +11,9 @@ import strawberry
 
 from inventory.model.entity.base import Base
 
+if TYPE_CHECKING:
+    from inventory.model.entity.inventory import InventoryType
+
 
 @strawberry.input
 class ReserveInventoryItemInput:
@@ -29,6 +32,14 @@ class ReserveInventoryItemType:
     created: datetime
     updated: datetime
 
+    @strawberry.field
+    async def inventory(
+        self,
+        info: strawberry.Info,
+    ) -> Annotated["InventoryType", strawberry.lazy("inventory.model.entity.inventory")] | None:
+        """Das reservierte Inventar, für alle Reservierungen eines Requests gebündelt geladen."""
+        return await info.context["loaders"].inventory_by_id.load(self.inventory_id)
+
 
 class Reserved_item(Base):
     """Entity-Klasse für einen reservierten Artikel (Reserved_item) im Lagerbestand."""
@@ -0,0 +1,9 @@
+import strawberry
+from strawberry.federation.schema_directives import Key
+
+
+@strawberry.federation.type(name="Product", keys=[Key(fields="id", resolvable=False)])
+class ProductType:
+    """Referenz auf ein Produkt des Product-Subgraphs, die Felder löst das Gateway auf."""
+
+    id: strawberry.ID
@@ -31,6 +31,16 @@ class InventoryRepository:
             raise NotFoundError(f"SKU nicht gefunden: {sku_code}")
         return inventory
 
+    async def find_by_ids(self, inventory_ids: list[str]) -> list[Inventory]:
+        stmt = select(Inventory).where(Inventory.id.in_(inventory_ids))
+        result = await self.session.scalars(stmt)
+        return list(result.all())
+
+    async def find_by_sku_codes(self, sku_codes: list[str]) -> list[Inventory]:
+        stmt = select(Inventory).where(Inventory.sku_code.in_(sku_codes))
+        result = await self.session.scalars(stmt)
+        return list(result.all())
+
     async def find(
         self,
         filter_dict: dict[str, str] | None = None,
@@ -0,0 +1,50 @@
+from collections.abc import Iterable
+from typing import Final
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from inventory.model.entity.product import Product
+from inventory.model.entity.product_offset import ProductOffset
+
+
+class ProductRepository:
+    """DB-Zugriff auf das lokale Read Model `product` (Produkt-ID → Name)."""
+
+    def __init__(self, session: AsyncSession):
+        self.session: Final = session
+
+    async def find_names(self) -> dict[str, str]:
+        result = await self.session.execute(select(Product.product_id, Product.name))
+        return {product_id: name for product_id, name in result.all()}
+
+    async def upsert(self, products: Iterable[tuple[str, str]]) -> None:
+        rows = [{"product_id": product_id, "name": name} for product_id, name in products]
+        if not rows:
+            return
+        stmt = insert(Product).values(rows)
+        stmt = stmt.on_duplicate_key_update(name=stmt.inserted.name, updated=func.now())
+        await self.session.execute(stmt)
+
+    async def delete(self, product_ids: Iterable[str]) -> None:
+        ids = list(product_ids)
+        if ids:
+            await self.session.execute(delete(Product).where(Product.product_id.in_(ids)))
+
+    async def find_offsets(self) -> dict[tuple[str, int], int]:
+        result = await self.session.execute(
+            select(ProductOffset.topic, ProductOffset.partition_id, ProductOffset.next_offset)
+        )
+        return {(topic, partition): offset for topic, partition, offset in result.all()}
+
+    async def save_offsets(self, offsets: Iterable[tuple[str, int, int]]) -> None:
+        rows = [
+            {"topic": topic, "partition_id": partition, "next_offset": offset}
+            for topic, partition, offset in offsets
+        ]
+        if not rows:
+            return
+        stmt = insert(ProductOffset).values(rows)
+        stmt = stmt.on_duplicate_key_update(next_offset=stmt.inserted.next_offset)
+        await self.session.execute(stmt)
@@ -20,6 +20,11 @@ class ReservedItemRepository:
         result = await self.session.scalars(stmt)
         return result.all()
 
+    async def find_by_inventory_ids(self, inventory_ids: list[str]) -> list[Reserved_item]:
+        stmt = select(Reserved_item).where(Reserved_item.inventory_id.in_(inventory_ids))
+        result = await self.session.scalars(stmt)
+        return list(result.all())
+
     async def find_by_composite_key_or_throw(
         self,
         customer_id: str,
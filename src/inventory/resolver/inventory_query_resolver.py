@@ -5,6 +5,7 @@ import strawberry
 from strawberry.types import Info
 from typing import Final, Optional
 from inventory.error.exceptions import NotFoundError
+from inventory.graphql.response_cache import skip_cache
 from inventory.model.entity.inventory import InventoryType, map_inventory_to_inventory_type
 from inventory.model.entity.reserved_item import ReserveInventoryItemType
 from inventory.model.input.search_criteria_input import InventorySearchCriteriaInput
@@ -12,7 +13,9 @@ from inventory.security.keycloak_service import KeycloakService
 from inventory.service.inventory_read_service import InventoryReadService
 from inventory.repository.pageable import Pageable
 from inventory.tracing.decorators import traced
-from inventory.client.product.product_service import get_product_by_id
+from inventory.client.product.product_cache import get_product_cache
+from inventory.client.product.product_read_model import get_product_read_model
+from inventory.client.product.product_service import get_product_by_id, get_products_by_ids
 
 
 @strawberry.type
@@ -25,6 +28,7 @@ class InventoryQueryResolver:
     @traced("resolve_inventory")
     async def resolve_inventory(
         self,
+        info: Info,
         inventory_id: str,
         token: str,
     ) -> InventoryType | None:
@@ -38,12 +42,24 @@ class InventoryQueryResolver:
 
         product_name = "Unbekannt"
 
+        read_model: Final = get_product_read_model()
+        local_name: Final = read_model.name(inventory.product_id) if read_model.ready else None
+        if local_name is not None:
+            # Lokaler Join ohne Aufruf des Product-Service
+            return map_inventory_to_inventory_type(inventory, local_name)
 
         try:
-            product = await get_product_by_id(inventory.product_id, token)
-            product_name = product.get("name", "Unbekannt")
+            # Namen ändern sich selten: meist ohne Aufruf des Product-Service
+            product = await get_product_cache().get(
+                inventory.product_id,
+                lambda: get_product_by_id(inventory.product_id, token),
+            )
+            if product is not None:
+                product_name = product.get("name", "Unbekannt")
         except Exception as e:
             logger.warning("Produktservice nicht erreichbar: {}", e)
+            # "Unbekannt" nicht für die ganze TTL ausliefern
+            skip_cache(info)
 
         inventory_type = map_inventory_to_inventory_type(inventory, product_name)
         inventory_type.product_name = product_name
@@ -56,6 +72,7 @@ class InventoryQueryResolver:
         info: Info,
         pageable: Pageable,
         search_criteria: InventorySearchCriteriaInput | None = None,
+        token: str | None = None,
     ) -> list[InventoryType]:
         logger.debug("resolve_inventorys: search_criteria={}", search_criteria)
 
@@ -73,4 +90,38 @@ class InventoryQueryResolver:
             return []
 
         logger.debug("resolve_inventorys: found=%{}", len(result_slice.content))
+        read_model: Final = get_product_read_model()
+        unresolved: Final[list[InventoryType]] = []
+        for item in result_slice.content:
+            local_name = (
+                read_model.name(item.product_id) if read_model.ready and item.product_id else None
+            )
+            if local_name is not None:
+                item.product_name = local_name
+            else:
+                unresolved.append(item)
+        # Im Read Model unbekannte IDs über Produkt-Cache bzw. Product-Service
+        if unresolved and token is not None:
+            await self._fill_product_names(info, unresolved, token)
         return result_slice
+
+    async def _fill_product_names(
+        self, info: Info, inventorys: list[InventoryType], token: str
+    ) -> None:
+        """Produktnamen einer ganzen Seite mit höchstens einem Request laden."""
+        product_ids: Final = [item.product_id for item in inventorys if item.product_id]
+        if not product_ids:
+            return
+        try:
+            products = await get_product_cache().get_many(
+                product_ids,
+                lambda ids: get_products_by_ids(ids, token),
+            )
+        except Exception as e:
+            logger.warning("Produktservice nicht erreichbar: {}", e)
+            skip_cache(info)
+            return
+        for item in inventorys:
+            product = products.get(item.product_id) if item.product_id else None
+            if product is not None:
+                item.product_name = product.get("name", "Unbekannt")
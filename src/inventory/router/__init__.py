@@ -3,10 +3,12 @@
 
 from collections.abc import Sequence
 
+from inventory.router.cache_router import router as cache_router
 from inventory.router.shutdown_router import router as shutdown_router
 from inventory.router.shutdown_router import shutdown
 
 __all__: Sequence[str] = [
+    "cache_router",
     "delete_by_id",
     "get",
     "get_by_id",
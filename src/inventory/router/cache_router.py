@@ -0,0 +1,18 @@
+"""REST-Schnittstelle für den Cache der GraphQL-Antworten."""
+
+from typing import Any, Final
+
+from fastapi import APIRouter
+
+from inventory.cache.response_cache import get_response_cache
+
+__all__ = ["router"]
+
+
+router: Final = APIRouter(tags=["Admin"])
+
+
+@router.get("/cache")
+def cache_stats() -> dict[str, Any]:
+    """Speichergrenze, Belegung und Trefferquote des Caches für GraphQL-Antworten."""
+    return get_response_cache().stats()
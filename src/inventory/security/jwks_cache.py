@@ -0,0 +1,143 @@
+"""Cache für die öffentlichen Schlüssel (JWKS) von Keycloak, indiziert nach `kid`.
+
+- Die Schlüssel werden einmal geparst und im Hintergrund alle `ttl` Sekunden neu geladen.
+- Eine unbekannte `kid` (z.B. nach einer Schlüsselrotation) löst einen sofortigen
+  Abruf aus, höchstens einmal je `min_refetch_interval`.
+- Ist Keycloak nicht erreichbar, werden die zuletzt geladenen Schlüssel weiter verwendet.
+"""
+
+import asyncio
+from contextlib import suppress
+from time import monotonic
+from typing import Final, Optional
+
+import httpx
+from jose import jwk
+from jose.backends.base import Key
+from loguru import logger
+
+from inventory.config.keycloak import (
+    jwks_min_refetch_interval,
+    jwks_timeout,
+    jwks_ttl,
+    jwks_url,
+)
+from inventory.security.security_metrics import jwks_fetches, jwks_keys
+
+__all__ = ["JwksCache", "get_jwks_cache"]
+
+
+class JwksCache:
+    """Öffentliche Schlüssel von Keycloak: `kid` → geparster Schlüssel."""
+
+    def __init__(
+        self,
+        url: str,
+        ttl: float,
+        min_refetch_interval: float,
+        timeout: float,
+    ) -> None:
+        self._url: Final = url
+        self._ttl: Final = ttl
+        self._min_refetch_interval: Final = min_refetch_interval
+        self._timeout: Final = timeout
+        self._keys: dict[str, Key] = {}
+        self._fetched_at = 0.0
+        self._last_attempt = float("-inf")
+        self._lock: Final = asyncio.Lock()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Schlüssel laden und die Aktualisierung im Hintergrund starten."""
+        await self._refetch("refresh")
+        self._task = asyncio.create_task(self._refresh_periodically())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def get_key(self, kid: str) -> Optional[Key]:
+        """Schlüssel zur `kid`, ggf. nach einem (begrenzten) Abruf der JWKS.
+
+        :param kid: Key ID aus dem Header des JWT
+        :return: Öffentlicher Schlüssel oder None, falls die `kid` unbekannt ist
+        """
+        key = self._keys.get(kid)
+        if key is not None:
+            if self._task is None and monotonic() - self._fetched_at >= self._ttl:
+                # Ohne Hintergrund-Task (z.B. ohne Lifespan) beim Zugriff aktualisieren
+                await self._refetch("refresh")
+            return self._keys.get(kid, key)
+
+        # Unbekannte kid: evtl. wurde rotiert, aber Keycloak nicht in jedem Request fragen
+        await self._refetch("unknown_kid")
+        return self._keys.get(kid)
+
+    async def _refresh_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._ttl)
+            await self._refetch("refresh")
+
+    async def _refetch(self, reason: str) -> None:
+        """JWKS laden, höchstens ein Abruf gleichzeitig und einer je `min_refetch_interval`."""
+        attempt: Final = monotonic()
+        async with self._lock:
+            if (
+                self._last_attempt > attempt
+                or attempt - self._last_attempt < self._min_refetch_interval
+            ):
+                # Ein anderer Aufrufer hat gerade geladen bzw. der letzte Abruf war eben erst
+                return
+            self._last_attempt = monotonic()
+            try:
+                keys = await self._fetch()
+            except Exception as e:
+                jwks_fetches.labels(reason, "error").inc()
+                logger.warning(
+                    "⚠️ JWKS nicht geladen, verwende {} Schlüssel aus dem Cache: {}",
+                    len(self._keys),
+                    e,
+                )
+                return
+            self._keys = keys
+            self._fetched_at = monotonic()
+            jwks_fetches.labels(reason, "success").inc()
+            jwks_keys.set(len(keys))
+            logger.debug("🔑 JWKS geladen: kids={}", list(keys))
+
+    async def _fetch(self) -> dict[str, Key]:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self._timeout)
+        response: Final = await self._client.get(self._url)
+        response.raise_for_status()
+        keys: Final = response.json().get("keys")
+        if not keys:
+            raise ValueError("JWKS enthält keine Schlüssel")
+        return {
+            key["kid"]: jwk.construct(key, key.get("alg", "RS256"))
+            for key in keys
+            if key.get("use", "sig") == "sig"
+        }
+
+
+_jwks_cache: Optional[JwksCache] = None
+
+
+def get_jwks_cache() -> JwksCache:
+    """Gemeinsamer JWKS-Cache des Prozesses."""
+    global _jwks_cache
+    if _jwks_cache is None:
+        _jwks_cache = JwksCache(
+            url=jwks_url,
+            ttl=jwks_ttl,
+            min_refetch_interval=jwks_min_refetch_interval,
+            timeout=jwks_timeout,
+        )
+    return _jwks_cache
@@ -1,35 +1,36 @@
 from fastapi import Request, HTTPException, status
 from jose import jwt, JWTError
 from typing import List, Optional
-import os
-import httpx
 from loguru import logger
 
-from inventory.config import env
+from inventory.security.jwks_cache import get_jwks_cache
+from inventory.security.principal import Principal
+from inventory.security.token_cache import get_token_cache
 
 
 class KeycloakService:
     """
     Service zur Extraktion und Validierung von JWTs aus Keycloak,
     inklusive dynamischem Laden des öffentlichen Schlüssels via JWKS-Endpunkt.
-    Unterstützt das Überspringen von Introspection Queries.
+    Introspection Queries werden in `KeycloakExtension` am geparsten Dokument erkannt.
     """
 
     def __init__(self, request: Request, token: Optional[str], payload: dict):
         self.request = request
         self.token = token
         self.payload = payload
+        # Rollen einmal je Request als frozenset, danach Prüfungen in O(1)
+        self.principal = Principal.from_claims(token, payload)
 
     @classmethod
     async def create(cls, request: Request) -> "KeycloakService":
         """
-        Erstellt eine Instanz des KeycloakService. Bei IntrospectionQuery wird
-        keine Authentifizierung erzwungen.
+        Erstellt eine Instanz des KeycloakService anhand der Header. Bei einer
+        Introspection durch das Gateway (Header `x-introspection`) wird keine
+        Authentifizierung erzwungen.
         """
-        if await cls._is_introspection_request(request):
-            logger.debug(
-                "🔍 IntrospectionQuery erkannt – Authentifizierung übersprungen."
-            )
+        if request.headers.get("x-introspection") == "true":
+            logger.debug("🔍 Gateway-Introspection via Header erkannt.")
             return cls(request, None, {})
 
         try:
@@ -40,27 +41,6 @@ class KeycloakService:
             logger.warning("Keycloak Token-Fehler: {}", e.detail)
             raise
 
-    @classmethod
-    async def _is_introspection_request(cls, request: Request) -> bool:
-        """
-        Erkennt sowohl normale IntrospectionQuerys als auch Apollo-Gateway-Aufrufe
-        anhand eines speziellen Headers.
-        """
-        if request.headers.get("x-introspection") == "true":
-            logger.debug("🔍 Gateway-Introspection via Header erkannt.")
-            return True
-
-        if request.method != "POST":
-            return False
-        try:
-            body = await request.json()
-            if body.get("operationName") == "IntrospectionQuery":
-                logger.debug("🔍 Standard-IntrospectionQuery erkannt.")
-                return True
-        except Exception:
-            pass
-        return False
-
     @classmethod
     def _extract_token(cls, request: Request) -> str:
         """
@@ -77,65 +57,55 @@ class KeycloakService:
     @classmethod
     async def _decode_token(cls, token: str) -> dict:
         """
-        Dekodiert und verifiziert das JWT mithilfe der JWKS von Keycloak.
+        Dekodiert und verifiziert das JWT mit dem zwischengespeicherten Schlüssel zur `kid`.
+        Bereits verifizierte Tokens werden bis `exp` aus dem Token-Cache geliefert.
         """
-        realm = env.KC_SERVICE_REALM
-        host = env.KC_SERVICE_HOST
-        port = env.KC_SERVICE_PORT
-
-        jwks_url = (
-            f"http://{host}:{port}/auth/realms/{realm}/protocol/openid-connect/certs"
-        )
-        logger.debug("Keycloak JWKS URI: {}", jwks_url)
+        token_cache = get_token_cache()
+        cached = token_cache.get(token)
+        if cached is not None:
+            return cached
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(jwks_url)
-            jwks = response.json()
-
-            keys = jwks.get("keys")
-            if not keys:
-                raise ValueError("JWKS enthält keine Schlüssel")
-
-            unverified_header = jwt.get_unverified_header(token)
-            for key in keys:
-                if key["kid"] == unverified_header["kid"]:
-                    return jwt.decode(
-                        token,
-                        key,
-                        algorithms=["RS256"],
-                        options={"verify_aud": False},
-                    )
+            kid = jwt.get_unverified_header(token).get("kid")
+        except JWTError as e:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=f"Token-Verifikation fehlgeschlagen: {e}",
+            )
 
+        key = await get_jwks_cache().get_key(kid) if kid else None
+        if key is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Kein passender Schlüssel im JWKS gefunden",
             )
 
+        try:
+            payload = jwt.decode(
+                token,
+                key,
+                algorithms=["RS256"],
+                options={"verify_aud": False},
+            )
         except JWTError as e:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail=f"Token-Verifikation fehlgeschlagen: {e}",
             )
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Fehler beim Laden des JWKS: {e}",
-            )
+        token_cache.put(token, payload)
+        return payload
 
     def get_roles(self) -> List[str]:
         """
         Gibt alle Rollen aus dem realm_access des Tokens zurück.
         """
-        print(f"rollen: {self.payload.get("realm_access", {}).get("roles", [])}")
-        return self.payload.get("realm_access", {}).get("roles", [])
+        return list(self.principal.roles)
 
     def has_role(self, required_roles: List[str]) -> bool:
         """
         Prüft, ob eine der erforderlichen Rollen vorhanden ist.
         """
-
-        return any(role in self.get_roles() for role in required_roles)
+        return self.principal.has_any_role(frozenset(required_roles))
 
     def assert_roles(self, required_roles: List[str]) -> None:
         """
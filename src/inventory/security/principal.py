@@ -0,0 +1,37 @@
+"""Angemeldeter Benutzer eines Requests mit den Rollen aus dem JWT."""
+
+from dataclasses import dataclass, field
+from typing import Any, Final, Optional
+
+__all__ = ["Principal"]
+
+
+@dataclass(eq=False, slots=True, kw_only=True)
+class Principal:
+    """Benutzer mit unveränderlicher Rollenmenge, einmal je Request aus den Claims berechnet."""
+
+    token: Optional[str]
+    """Das Bearer-Token, z.B. für Aufrufe anderer Services."""
+
+    subject: Optional[str] = None
+    """Claim `sub`, d.h. die ID des Benutzers in Keycloak."""
+
+    username: Optional[str] = None
+    """Claim `preferred_username`."""
+
+    roles: frozenset[str] = field(default_factory=frozenset)
+    """Realm-Rollen aus `realm_access.roles`."""
+
+    @classmethod
+    def from_claims(cls, token: Optional[str], claims: dict[str, Any]) -> "Principal":
+        realm_access: Final = claims.get("realm_access") or {}
+        return cls(
+            token=token,
+            subject=claims.get("sub"),
+            username=claims.get("preferred_username"),
+            roles=frozenset(realm_access.get("roles", ())),
+        )
+
+    def has_any_role(self, roles: frozenset[str]) -> bool:
+        """Flag, ob der Benutzer mindestens eine der Rollen hat."""
+        return not self.roles.isdisjoint(roles)
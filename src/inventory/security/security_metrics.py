@@ -0,0 +1,29 @@
+"""Prometheus-Metriken für die Verifikation der JWTs."""
+
+from typing import Final
+
+from prometheus_client import Counter, Gauge
+
+__all__ = ["jwks_fetches", "jwks_keys", "token_cache_lookups", "token_cache_size"]
+
+jwks_fetches: Final = Counter(
+    "inventory_jwks_fetches",
+    "Abrufe der JWKS von Keycloak nach Anlass (refresh, unknown_kid) und Ergebnis",
+    ["reason", "outcome"],
+)
+
+jwks_keys: Final = Gauge(
+    "inventory_jwks_keys",
+    "Anzahl öffentlicher Schlüssel im JWKS-Cache",
+)
+
+token_cache_lookups: Final = Counter(
+    "inventory_token_cache_lookups",
+    "Zugriffe auf den Cache verifizierter Tokens nach Ergebnis (hit, miss, expired)",
+    ["result"],
+)
+
+token_cache_size: Final = Gauge(
+    "inventory_token_cache_size",
+    "Anzahl verifizierter Tokens im Cache",
+)
@@ -0,0 +1,71 @@
+"""Cache für bereits verifizierte JWTs, damit die RS256-Signatur nur einmal je Token geprüft wird.
+
+Schlüssel ist der SHA-256-Digest des Tokens, d.h. das Token selbst wird nicht
+gespeichert. Ein Eintrag gilt bis zum Claim `exp`, Tokens ohne `exp` werden
+nicht gespeichert. Bei mehr als `max_size` Einträgen wird LRU verdrängt.
+
+Die Claims werden als JSON gespeichert, d.h. jeder Aufrufer erhält eine eigene
+Kopie und Änderungen daran wirken sich nicht auf andere Requests aus.
+"""
+
+from collections import OrderedDict
+from hashlib import sha256
+from time import time
+from typing import Any, Final, Optional
+
+import orjson
+
+from inventory.config.keycloak import token_cache_max_size
+from inventory.security.security_metrics import token_cache_lookups, token_cache_size
+
+__all__ = ["TokenCache", "get_token_cache"]
+
+
+class TokenCache:
+    """Beschränkter Cache: Digest des Tokens → (Claims als JSON, exp)."""
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size: Final = max_size
+        self._entries: Final[OrderedDict[bytes, tuple[bytes, float]]] = OrderedDict()
+
+    def get(self, token: str) -> Optional[dict[str, Any]]:
+        """Kopie der Claims eines bereits verifizierten Tokens, None falls unbekannt oder abgelaufen."""
+        if self._max_size <= 0:
+            return None
+        digest: Final = sha256(token.encode()).digest()
+        entry: Final = self._entries.get(digest)
+        if entry is None:
+            token_cache_lookups.labels("miss").inc()
+            return None
+        claims, expires_at = entry
+        if time() >= expires_at:
+            del self._entries[digest]
+            token_cache_size.set(len(self._entries))
+            token_cache_lookups.labels("expired").inc()
+            return None
+        self._entries.move_to_end(digest)
+        token_cache_lookups.labels("hit").inc()
+        return orjson.loads(claims)
+
+    def put(self, token: str, claims: dict[str, Any]) -> None:
+        """Claims eines soeben verifizierten Tokens speichern."""
+        expires_at: Final = claims.get("exp")
+        if self._max_size <= 0 or not isinstance(expires_at, (int, float)):
+            return
+        digest: Final = sha256(token.encode()).digest()
+        self._entries[digest] = (orjson.dumps(claims), float(expires_at))
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+        token_cache_size.set(len(self._entries))
+
+
+_token_cache: Optional[TokenCache] = None
+
+
+def get_token_cache() -> TokenCache:
+    """Gemeinsamer Token-Cache des Prozesses."""
+    global _token_cache
+    if _token_cache is None:
+        _token_cache = TokenCache(max_size=token_cache_max_size)
+    return _token_cache
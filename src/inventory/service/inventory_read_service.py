@@ -46,6 +46,26 @@ class InventoryReadService:
             raise NotFoundError(inventory_id)
         return inventory
 
+    async def find_by_ids(self, inventory_ids: list[str]) -> dict[str, Inventory]:
+        """Mehrere Inventare mit einer DB-Abfrage suchen.
+
+        :param inventory_ids: IDs der gesuchten Inventare
+        :return: ID → Inventar, nicht gefundene IDs fehlen
+        """
+        logger.debug("inventory_ids={}", inventory_ids)
+        inventorys = await self._repository.find_by_ids(inventory_ids)
+        return {inventory.id: inventory for inventory in inventorys}
+
+    async def find_by_sku_codes(self, sku_codes: list[str]) -> dict[str, Inventory]:
+        """Mehrere Inventare anhand ihrer SKU-Codes mit einer DB-Abfrage suchen.
+
+        :param sku_codes: SKU-Codes der gesuchten Inventare
+        :return: SKU-Code → Inventar, nicht gefundene SKU-Codes fehlen
+        """
+        logger.debug("sku_codes={}", sku_codes)
+        inventorys = await self._repository.find_by_sku_codes(sku_codes)
+        return {inventory.sku_code: inventory for inventory in inventorys}
+
     async def find(
         self,
         filter,
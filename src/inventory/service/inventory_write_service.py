@@ -8,6 +8,8 @@ from inventory.model.entity.reserved_item import ReserveInventoryItemInput, Rese
 from inventory.repository.inventory_repository import InventoryRepository
 from inventory.repository.reserved_item_repository import ReservedItemRepository
 from inventory.error.exceptions import NotFoundError
+from inventory.cache.cache_invalidation import invalidate_response_cache
+from inventory.cache.response_cache import INVENTORYS_TAG, inventory_tag
 from inventory.tracing.decorators import traced
 from inventory.model.entity.inventory import map_inventory_to_inventory_type
 
@@ -32,6 +34,7 @@ class InventoryWriteService:
         inventory = Inventory.from_dict_primitive(input.__dict__)
         await self._inventory_repo.save(inventory)
         await self._session.commit()
+        await invalidate_response_cache(INVENTORYS_TAG, inventory_tag(inventory.id))
 
         return map_inventory_to_inventory_type(inventory)
 
@@ -47,6 +50,7 @@ class InventoryWriteService:
 
         await self._inventory_repo.update(inventory)
         await self._session.commit()
+        await invalidate_response_cache(INVENTORYS_TAG, inventory_tag(inventory_id))
 
         return map_inventory_to_inventory_type(inventory)
 
@@ -57,6 +61,7 @@ class InventoryWriteService:
         inventory = await self._inventory_repo.find_by_id_or_throw(inventory_id)
         await self._inventory_repo.delete(inventory)
         await self._session.commit()
+        await invalidate_response_cache(INVENTORYS_TAG, inventory_tag(inventory_id))
 
         return True
 
@@ -82,6 +87,7 @@ class InventoryWriteService:
         await self._reserved_item_repo.save(reserved_item)
         await self._inventory_repo.update(inventory)
         await self._session.commit()
+        await invalidate_response_cache(INVENTORYS_TAG, inventory_tag(input.inventory_id))
 
         return reserved_item.id
 
@@ -100,3 +106,4 @@ class InventoryWriteService:
         await self._reserved_item_repo.delete(reserved_item)
         await self._inventory_repo.update(inventory)
         await self._session.commit()
+        await invalidate_response_cache(INVENTORYS_TAG, inventory_tag(input.inventory_id))
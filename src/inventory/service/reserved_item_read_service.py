@@ -61,6 +61,23 @@ class ReservedItemReadService:
 
         return [self._map_to_type(item) for item in items]
 
+    async def find_by_inventory_ids(
+        self,
+        inventory_ids: list[str],
+    ) -> dict[str, list[ReserveInventoryItemType]]:
+        """Reservierungen mehrerer Inventare mit einer DB-Abfrage suchen.
+
+        :param inventory_ids: IDs der Inventare
+        :return: Inventar-ID → Reservierungen, Inventare ohne Reservierung fehlen
+        """
+        logger.debug("ReserveItemReadService.find_by_inventory_ids: inventory_ids={}", inventory_ids)
+        items: list[Reserved_item] = await self._repository.find_by_inventory_ids(inventory_ids)
+
+        result: dict[str, list[ReserveInventoryItemType]] = defaultdict(list)
+        for item in items:
+            result[item.inventory_id].append(self._map_to_type(item))
+        return result
+
     def _map_to_type(self, item: Reserved_item) -> ReserveInventoryItemType:
         return ReserveInventoryItemType(
             id=item.id,
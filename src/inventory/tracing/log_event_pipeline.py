@@ -0,0 +1,198 @@
+"""Nicht-blockierende Pipeline für Log-Events von LoggerPlus nach Kafka.
+
+Log-Aufrufe legen das Event nur in eine beschränkte Queue. Ein Hintergrund-Task
+sammelt die Events, bis `log_batch_size` erreicht oder `log_linger_ms` abgelaufen
+ist, und legt den Batch dann ohne Round Trip je Event in den Kafka-Producer.
+Läuft die Queue über, wird je nach `log_overflow_policy` verworfen oder
+gesampelt, statt den Request zu bremsen.
+"""
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+from itertools import count
+from time import monotonic
+from typing import Final, Literal, Optional
+
+from loguru import logger
+
+from inventory.config.kafka import KafkaSettings, get_kafka_settings
+from inventory.messaging.kafka_metrics import (
+    log_events_dropped,
+    log_events_published,
+    log_events_queued,
+)
+from inventory.messaging.kafka_producer_service import KafkaProducerService
+from inventory.messaging.kafka_singleton import get_kafka_producer
+from inventory.tracing.trace_context import TraceContext
+
+__all__ = ["LogEventPipeline", "get_log_event_pipeline"]
+
+
+@dataclass(eq=False, slots=True, kw_only=True)
+class _QueuedLogEvent:
+    """Serialisiertes Log-Event mit dem TraceContext des Aufrufers."""
+
+    payload: bytes
+    trace_ctx: TraceContext
+
+
+class LogEventPipeline:
+    """Beschränkte Queue mit Hintergrund-Publisher für Log-Events."""
+
+    def __init__(
+        self,
+        producer_factory: Callable[[], KafkaProducerService],
+        max_queue: int,
+        batch_size: int,
+        linger_ms: int,
+        overflow_policy: Literal["drop", "sample"] = "drop",
+        sample_every: int = 10,
+        flush_timeout_s: float = 5.0,
+    ) -> None:
+        self._producer_factory: Final = producer_factory
+        self._queue: Final[asyncio.Queue[_QueuedLogEvent]] = asyncio.Queue(maxsize=max_queue)
+        self._batch_size: Final = max(batch_size, 1)
+        self._linger_s: Final = linger_ms / 1000
+        self._overflow_policy: Final = overflow_policy
+        self._sample_every: Final = max(sample_every, 1)
+        self._flush_timeout_s: Final = flush_timeout_s
+        self._overflow_count = count(1)
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: KafkaSettings,
+        producer_factory: Callable[[], KafkaProducerService],
+    ) -> "LogEventPipeline":
+        """Pipeline mit den Werten aus `KafkaSettings` erzeugen."""
+        return cls(
+            producer_factory=producer_factory,
+            max_queue=settings.log_queue_size,
+            batch_size=settings.log_batch_size,
+            linger_ms=settings.log_linger_ms,
+            overflow_policy=settings.log_overflow_policy,
+            sample_every=settings.log_overflow_sample_every,
+            flush_timeout_s=settings.log_flush_timeout_s,
+        )
+
+    def submit(self, payload: bytes, trace_ctx: TraceContext) -> bool:
+        """Log-Event einreihen, ohne zu warten.
+
+        :param payload: Serialisiertes Log-Event
+        :param trace_ctx: TraceContext für die Kafka-Header
+        :return: False, falls das Event wegen Überlauf verworfen wurde
+        :rtype: bool
+        """
+        item: Final = _QueuedLogEvent(payload=payload, trace_ctx=trace_ctx)
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            if not self._on_overflow(item):
+                return False
+        log_events_queued.set(self._queue.qsize())
+        return True
+
+    def _on_overflow(self, item: _QueuedLogEvent) -> bool:
+        """Bei voller Queue: verwerfen oder (gesampelt) das älteste Event verdrängen."""
+        if (
+            self._overflow_policy == "sample"
+            and next(self._overflow_count) % self._sample_every == 0
+        ):
+            self._queue.get_nowait()
+            self._queue.task_done()
+            self._queue.put_nowait(item)
+            log_events_dropped.labels("overflow").inc()
+            return True
+        log_events_dropped.labels("overflow").inc()
+        return False
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info("📝 Log-Pipeline gestartet")
+
+    async def stop(self) -> None:
+        """Restliche Events bis `flush_timeout_s` senden, danach den Publisher beenden."""
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=self._flush_timeout_s)
+        except TimeoutError:
+            logger.warning(
+                "⏱️ Log-Pipeline: {} Events beim Shutdown nicht gesendet",
+                self._queue.qsize(),
+            )
+            log_events_dropped.labels("shutdown").inc(self._queue.qsize())
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("🛑 Log-Pipeline gestoppt")
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._publish(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+                log_events_queued.set(self._queue.qsize())
+
+    async def _next_batch(self) -> list[_QueuedLogEvent]:
+        """Auf das erste Event warten, dann bis Batch-Größe oder Linger-Zeit sammeln."""
+        batch: Final = [await self._queue.get()]
+        deadline: Final = monotonic() + self._linger_s
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except TimeoutError:
+                break
+        return batch
+
+    async def _publish(self, batch: list[_QueuedLogEvent]) -> None:
+        """Batch in den Producer legen und danach gemeinsam auf die Bestätigung warten."""
+        producer: Final = self._producer_factory()
+        if not producer.started:
+            log_events_dropped.labels("producer_stopped").inc(len(batch))
+            return
+        futures: list[asyncio.Future] = []
+        failed = 0
+        for item in batch:
+            try:
+                futures.append(await producer.send_log_event_nowait(item.payload, item.trace_ctx))
+            except Exception:
+                failed += 1
+        results: Final = await asyncio.gather(*futures, return_exceptions=True)
+        failed += sum(1 for result in results if isinstance(result, BaseException))
+        if failed:
+            # Kein LoggerPlus hier: sonst Rückkopplung über die eigene Queue
+            logger.warning("⚠️ Log-Pipeline: {} von {} Events nicht gesendet", failed, len(batch))
+            log_events_dropped.labels("error").inc(failed)
+        log_events_published.inc(len(batch) - failed)
+
+
+_log_event_pipeline: Optional[LogEventPipeline] = None
+
+
+def get_log_event_pipeline() -> LogEventPipeline:
+    """Gemeinsame Pipeline für alle LoggerPlus-Instanzen."""
+    global _log_event_pipeline
+    if _log_event_pipeline is None:
+        _log_event_pipeline = LogEventPipeline.from_settings(
+            get_kafka_settings(),
+            producer_factory=get_kafka_producer,
+        )
+    return _log_event_pipeline
@@ -1,8 +1,9 @@
 # src/inventory/logging/logger_plus.py
 
-import inspect
+import sys
 from datetime import datetime
-from typing import Any, Optional
+from types import CodeType, FrameType
+from typing import Any, Final, Optional
 from uuid import uuid4
 from loguru import logger
 
@@ -10,24 +11,54 @@ from inventory.config import env
 from inventory.config.kafka import get_kafka_settings
 from inventory.tracing.log_event_dto import LogEventDTO, LogLevel
 from inventory.tracing.trace_context_util import TraceContextUtil
-from inventory.messaging.kafka_singleton import get_kafka_producer
+from inventory.tracing.log_event_pipeline import get_log_event_pipeline
 from inventory.tracing.trace_context import TraceContext
 
 
+_UNKNOWN_CLASS: Final = "UnknownClass"
+
+# Klassen- und Methodenname je Code-Objekt: einmal aus co_qualname ermittelt
+_code_context_cache: Final[dict[CodeType, tuple[str, str]]] = {}
+
+
+def _code_context(code: CodeType) -> tuple[str, str]:
+    """Klassen- und Methodenname aus `co_qualname`, z.B. `Foo.bar` → (Foo, bar)."""
+    context = _code_context_cache.get(code)
+    if context is None:
+        parts = code.co_qualname.split(".")
+        class_name = (
+            parts[-2] if len(parts) > 1 and parts[-2] != "<locals>" else _UNKNOWN_CLASS
+        )
+        context = _code_context_cache[code] = (class_name, code.co_name)
+    return context
+
+
+def _caller_frame() -> FrameType | None:
+    """Ersten Frame außerhalb dieses Moduls finden, ohne den ganzen Stack aufzubauen."""
+    frame = sys._getframe(2)
+    while frame is not None and frame.f_code.co_filename == __file__:
+        frame = frame.f_back
+    return frame
+
+
 class LoggerPlus:
     def __init__(self):
-        self.producer = get_kafka_producer()
+        # Log-Events nur einreihen: gesendet wird im Hintergrund (LogEventPipeline)
+        self.pipeline = get_log_event_pipeline()
+        # Einmal lesen: KafkaSettings() wertet bei jedem Aufruf die Umgebung aus
+        self._service = get_kafka_settings().client_id
 
     def _get_call_context(self) -> tuple[str, str]:
-        frame = inspect.stack()[2]
-        return frame.frame.f_globals["__name__"], frame.function
+        frame = _caller_frame()
+        if frame is None:
+            return "unknown", "unknown"
+        return frame.f_globals["__name__"], frame.f_code.co_name
 
     def _get_context(self) -> tuple[str, str]:
-        frame = inspect.stack()[3]
-        instance = frame.frame.f_locals.get("self", None)
-        class_name = instance.__class__.__name__ if instance else "UnknownClass"
-        method_name = frame.function
-        return class_name, method_name
+        frame = _caller_frame()
+        if frame is None:
+            return _UNKNOWN_CLASS, "unknown"
+        return _code_context(frame.f_code)
 
     async def log(
         self,
@@ -49,13 +80,13 @@ class LoggerPlus:
             timestamp=datetime.utcnow(),
             level=level,
             message=message,
-            service=get_kafka_settings().client_id,
+            service=self._service,
             class_name=class_name,
             method_name=method_name,
         )
 
-        if level not in (LogLevel.DEBUG):
-            await self.producer.send_log_event(event, trace_ctx)
+        if level != LogLevel.DEBUG:
+            self.pipeline.submit(event.to_kafka(), trace_ctx)
 
 
     async def info(
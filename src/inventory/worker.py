@@ -0,0 +1,100 @@
+"""Eigenständiger Kafka-Worker, der nur die Consumer-Pipeline ohne HTTP-Server startet.
+
+Damit kann die Event-Verarbeitung unabhängig von der GraphQL-Schnittstelle skaliert
+werden. Der HTTP-Server wird dann mit `KAFKA_CONSUMER_ENABLED=false` gestartet.
+
+```powershell
+uv run inventory-worker --consumers 2
+```
+
+Alternativ ohne _uv_, z.B. in einem Docker-Image: `python -m inventory.worker`.
+"""
+
+import argparse
+import asyncio
+import signal
+from contextlib import suppress
+from typing import Final
+
+from loguru import logger
+
+from inventory.config.kafka import get_kafka_settings
+from inventory.messaging.kafka_singleton import get_kafka_consumer, get_kafka_producer
+from inventory.repository.session import dispose_connection_pool
+from inventory.tracing.log_event_pipeline import get_log_event_pipeline
+
+__all__ = ["main", "run"]
+
+
+async def _run_worker(consumer_count: int) -> None:
+    """Producer und Consumer starten und bis SIGINT/SIGTERM laufen lassen."""
+    stop_event: Final = asyncio.Event()
+    loop: Final = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        # Windows: keine Signal-Handler im Event-Loop, dann KeyboardInterrupt
+        with suppress(NotImplementedError):
+            loop.add_signal_handler(sig, stop_event.set)
+
+    kafka_producer: Final = get_kafka_producer()
+    log_event_pipeline: Final = get_log_event_pipeline()
+    kafka_consumers: Final = [
+        await get_kafka_consumer(name=f"worker-{index}")
+        for index in range(consumer_count)
+    ]
+
+    await kafka_producer.start()
+    await log_event_pipeline.start()
+    for kafka_consumer in kafka_consumers:
+        await kafka_consumer.start()
+    logger.info("👷 Inventory-Worker gestartet mit {} Consumer(n)", consumer_count)
+
+    try:
+        await stop_event.wait()
+    finally:
+        logger.info("🛑 Inventory-Worker wird heruntergefahren")
+        # Laufende Batches beenden und Offsets committen, bevor der Pool schließt
+        await asyncio.gather(
+            *(kafka_consumer.stop() for kafka_consumer in kafka_consumers),
+            return_exceptions=True,
+        )
+        await log_event_pipeline.stop()
+        await kafka_producer.stop()
+        try:
+            await dispose_connection_pool()
+        except Exception as e:
+            logger.warning("DB-Dispose beim Shutdown fehlgeschlagen: {}", e)
+
+
+def run(consumer_count: int | None = None) -> None:
+    """Worker im eigenen Event-Loop starten.
+
+    :param consumer_count: Anzahl Consumer in diesem Prozess, default aus
+        `KAFKA_WORKER_CONSUMER_COUNT`
+    :raises ValueError: Falls die Anzahl kleiner als 1 ist
+    """
+    count: Final = (
+        get_kafka_settings().worker_consumer_count if consumer_count is None else consumer_count
+    )
+    if count < 1:
+        raise ValueError(f"Anzahl Consumer muss mindestens 1 sein: {count}")
+    with suppress(KeyboardInterrupt):
+        asyncio.run(_run_worker(count))
+
+
+def main() -> None:
+    """main-Funktion für das Skript `inventory-worker`."""
+    parser: Final = argparse.ArgumentParser(description="Inventory Kafka-Worker")
+    parser.add_argument(
+        "--consumers",
+        type=int,
+        default=None,
+        help="Anzahl Consumer in diesem Prozess (default: KAFKA_WORKER_CONSUMER_COUNT)",
+    )
+    args: Final = parser.parse_args()
+    if args.consumers is not None and args.consumers < 1:
+        parser.error("--consumers muss mindestens 1 sein")
+    run(args.consumers)
+
+
+if __name__ == "__main__":
+    main()